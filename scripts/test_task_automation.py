@@ -16,6 +16,7 @@ These features enable automation of routine task operations and workflows.
 import sys
 import os
 import json
+import dataclasses
 from datetime import datetime, timedelta
 import time
 
@@ -254,7 +255,7 @@ def main():
     # Trigger a task status changed event
     print("\nTriggering a task status changed event")
     task2.status = TaskStatus.DONE
-    task2.completed_at = datetime.now()
+    task2.completion_time = datetime.now()
     
     event_result = automation_system.handle_task_event(
         event_type="task_status_changed",
@@ -297,7 +298,7 @@ def main():
         trigger_result = automation_system.trigger_rule(
             rule_id=rule_id,
             context={
-                "task": task3.__dict__
+                "task": dataclasses.asdict(task3)
             }
         )
         print_json(trigger_result)
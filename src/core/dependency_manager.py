@@ -10,6 +10,7 @@ This module provides functionality for managing task dependencies, including:
 Inspired by the dependency management system in claude-task-master.
 """
 
+from collections import Counter
 from typing import Dict, List, Set, Tuple, Optional, Any, Union
 from .models import Task, TaskStatus
 
@@ -89,8 +90,8 @@ class DependencyManager:
             unique_deps = set(task.dependencies)
             if len(unique_deps) < len(task.dependencies):
                 result["valid"] = False
-                duplicates = [dep for dep in task.dependencies 
-                             if task.dependencies.count(dep) > 1]
+                counts = Counter(task.dependencies)
+                duplicates = [dep for dep in task.dependencies if counts[dep] > 1]
                 result["duplicate_dependencies"].append({
                     "task_id": task_id,
                     "duplicates": list(set(duplicates))
@@ -11,6 +11,8 @@ from datetime import datetime
 import uuid
 import json
 import abc
+import asyncio
+import functools
 import logging
 
 
@@ -52,9 +54,37 @@ class IntegrationStatus(Enum):
     PENDING = "pending"
 
 
+# Cached enum lookups, used on every config load, create and update
+
+@functools.lru_cache(maxsize=None)
+def _integration_type(value: Any) -> IntegrationType:
+    """Look up a IntegrationType member by value."""
+    return IntegrationType(value)
+
+
+@functools.lru_cache(maxsize=None)
+def _auth_type(value: Any) -> AuthType:
+    """Look up a AuthType member by value."""
+    return AuthType(value)
+
+
+@functools.lru_cache(maxsize=None)
+def _sync_direction(value: Any) -> SyncDirection:
+    """Look up a SyncDirection member by value."""
+    return SyncDirection(value)
+
+
+@functools.lru_cache(maxsize=None)
+def _integration_status(value: Any) -> IntegrationStatus:
+    """Look up a IntegrationStatus member by value."""
+    return IntegrationStatus(value)
+
+
 class AuthenticationConfig:
     """Configuration for authentication with external systems."""
     
+    __slots__ = ("auth_type", "credentials", "scopes", "expires_at", "refresh_token")
+    
     def __init__(self, 
                  auth_type: AuthType,
                  credentials: Dict[str, Any],
@@ -108,7 +138,7 @@ class AuthenticationConfig:
             expires_at = datetime.fromisoformat(data["expires_at"])
         
         return cls(
-            auth_type=AuthType(data.get("auth_type", "none")),
+            auth_type=_auth_type(data.get("auth_type", "none")),
             credentials=data.get("credentials", {}),
             scopes=data.get("scopes", []),
             expires_at=expires_at,
@@ -131,6 +161,8 @@ class AuthenticationConfig:
 class SyncConfig:
     """Configuration for data synchronization."""
     
+    __slots__ = ("direction", "interval_minutes", "filters", "mappings", "last_sync")
+    
     def __init__(self, 
                  direction: SyncDirection,
                  interval_minutes: int = 60,
@@ -184,7 +216,7 @@ class SyncConfig:
             last_sync = datetime.fromisoformat(data["last_sync"])
         
         return cls(
-            direction=SyncDirection(data.get("direction", "import")),
+            direction=_sync_direction(data.get("direction", "import")),
             interval_minutes=data.get("interval_minutes", 60),
             filters=data.get("filters", {}),
             mappings=data.get("mappings", {}),
@@ -195,6 +227,11 @@ class SyncConfig:
 class IntegrationConfig:
     """Configuration for an integration."""
     
+    __slots__ = (
+        "id", "name", "type", "auth_config", "sync_config", "settings",
+        "status", "created_at", "updated_at", "metadata", "_cached_dict"
+    )
+    
     def __init__(self, 
                  id: str,
                  name: str,
@@ -231,11 +268,52 @@ class IntegrationConfig:
         self.created_at = created_at or datetime.now()
         self.updated_at = updated_at or datetime.now()
         self.metadata = metadata or {}
+        
+        # Cached result of _snapshot(), cleared by _bump()
+        self._cached_dict: Optional[Dict[str, Any]] = None
+    
+    def __setattr__(self, name: str, value: Any) -> None:
+        # Assigning any field invalidates the cached dictionary
+        if name != "_cached_dict":
+            object.__setattr__(self, "_cached_dict", None)
+        object.__setattr__(self, name, value)
+    
+    def _bump(self) -> None:
+        """
+        Invalidate the cached dictionary after an in-place mutation.
+        
+        Assigning a field does this automatically; code that mutates the nested
+        auth or sync configs in place must call this afterwards.
+        """
+        self._cached_dict = None
     
     def to_dict(self) -> Dict[str, Any]:
         """
         Convert to dictionary.
         
+        Returns:
+            Dictionary representation
+        """
+        return self._compute_dict()
+    
+    def _snapshot(self) -> Dict[str, Any]:
+        """
+        Get the cached dictionary representation, for the save path.
+        
+        The result is cached until a field is assigned or ``_bump()`` is
+        called. It must not be modified.
+        
+        Returns:
+            Cached dictionary representation
+        """
+        if self._cached_dict is None:
+            self._cached_dict = self._compute_dict()
+        return self._cached_dict
+    
+    def _compute_dict(self) -> Dict[str, Any]:
+        """
+        Build the dictionary representation.
+        
         Returns:
             Dictionary representation
         """
@@ -277,11 +355,11 @@ class IntegrationConfig:
         return cls(
             id=data.get("id", str(uuid.uuid4())),
             name=data.get("name", ""),
-            type=IntegrationType(data.get("type", "custom")),
+            type=_integration_type(data.get("type", "custom")),
             auth_config=auth_config,
             sync_config=sync_config,
             settings=data.get("settings", {}),
-            status=IntegrationStatus(data.get("status", "inactive")),
+            status=_integration_status(data.get("status", "inactive")),
             created_at=created_at,
             updated_at=updated_at,
             metadata=data.get("metadata", {})
@@ -291,16 +369,21 @@ class IntegrationConfig:
 class IntegrationProvider(abc.ABC):
     """Base class for integration providers."""
     
-    def __init__(self, config: IntegrationConfig, logger: Optional[logging.Logger] = None):
+    def __init__(self, 
+                 config: IntegrationConfig, 
+                 logger: Optional[logging.Logger] = None,
+                 http: Optional[Any] = None):
         """
         Initialize an integration provider.
         
         Args:
             config: Integration configuration
             logger: Optional logger
+            http: Optional shared ``requests.Session`` to issue API requests through
         """
         self.config = config
         self.logger = logger or logging.getLogger(f"tascade.integration.{config.type.value}")
+        self.http = http
     
     @abc.abstractmethod
     def authenticate(self) -> bool:
@@ -361,6 +444,24 @@ class IntegrationProvider(abc.ABC):
         """
         pass
     
+    async def sync_async(self, direction: Optional[SyncDirection] = None) -> Dict[str, Any]:
+        """
+        Synchronize tasks with the external system from an event loop.
+        
+        The default implementation is only a thread wrapper: it runs the
+        blocking ``sync`` in the loop's default executor, so each call still
+        occupies a pool thread while it waits on I/O. Providers with a native
+        async client can override it.
+        
+        Args:
+            direction: Optional direction to override config
+            
+        Returns:
+            Dictionary with synchronization results
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, self.sync, direction)
+    
     @abc.abstractmethod
     def get_webhooks(self) -> List[Dict[str, Any]]:
         """
@@ -427,6 +528,7 @@ class IntegrationProvider(abc.ABC):
     def update_sync_timestamp(self) -> None:
         """Update the last sync timestamp."""
         self.config.sync_config.last_sync = datetime.now()
+        self.config._bump()
     
     def map_task_to_external(self, task: Dict[str, Any]) -> Dict[str, Any]:
         """
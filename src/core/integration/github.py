@@ -64,15 +64,19 @@ class GitHubProvider(IntegrationProvider):
         "closed": "done"
     }
     
-    def __init__(self, config: IntegrationConfig, logger: Optional[logging.Logger] = None):
+    def __init__(self, 
+                 config: IntegrationConfig, 
+                 logger: Optional[logging.Logger] = None,
+                 http: Optional[requests.Session] = None):
         """
         Initialize a GitHub integration provider.
         
         Args:
             config: Integration configuration
             logger: Optional logger
+            http: Optional shared session to issue API requests through
         """
-        super().__init__(config, logger)
+        super().__init__(config, logger, http)
         
         # Ensure the config type is GitHub
         if config.type != IntegrationType.GITHUB:
@@ -81,6 +85,7 @@ class GitHubProvider(IntegrationProvider):
         # Set up default mappings if not provided
         if not self.config.sync_config.mappings:
             self.config.sync_config.mappings = self.DEFAULT_MAPPINGS
+            self.config._bump()
         
         # Extract repository information from settings
         self.owner = self.config.settings.get("owner")
@@ -533,7 +538,9 @@ class GitHubProvider(IntegrationProvider):
         # Update kwargs with headers
         kwargs["headers"] = headers
         
-        # Make request
+        # Make request, reusing the shared connection pool if one was provided
+        if self.http is not None:
+            return self.http.request(method, url, **kwargs)
         return requests.request(method, url, **kwargs)
     
     def _add_default_external_fields(self, task: Dict[str, Any], external_task: Dict[str, Any]) -> None:
@@ -63,15 +63,19 @@ class JiraProvider(IntegrationProvider):
         "critical": "Highest"
     }
     
-    def __init__(self, config: IntegrationConfig, logger: Optional[logging.Logger] = None):
+    def __init__(self, 
+                 config: IntegrationConfig, 
+                 logger: Optional[logging.Logger] = None,
+                 http: Optional[requests.Session] = None):
         """
         Initialize a Jira integration provider.
         
         Args:
             config: Integration configuration
             logger: Optional logger
+            http: Optional shared session to issue API requests through
         """
-        super().__init__(config, logger)
+        super().__init__(config, logger, http)
         
         # Ensure the config type is Jira
         if config.type != IntegrationType.JIRA:
@@ -80,6 +84,7 @@ class JiraProvider(IntegrationProvider):
         # Set up default mappings if not provided
         if not self.config.sync_config.mappings:
             self.config.sync_config.mappings = self.DEFAULT_MAPPINGS
+            self.config._bump()
         
         # Extract Jira information from settings
         self.base_url = self.config.settings.get("base_url")
@@ -551,7 +556,9 @@ class JiraProvider(IntegrationProvider):
         # Update kwargs with headers
         kwargs["headers"] = headers
         
-        # Make request
+        # Make request, reusing the shared connection pool if one was provided
+        if self.http is not None:
+            return self.http.request(method, url, **kwargs)
         return requests.request(method, url, **kwargs)
     
     def _add_default_external_fields(self, task: Dict[str, Any], external_task: Dict[str, Any]) -> None:
@@ -5,40 +5,49 @@ This module provides the main interface for managing integrations with
 external tools and services.
 """
 
-from typing import Dict, List, Any, Optional, Union, Callable, Type
+from typing import Dict, List, Any, Optional, Union, Callable, Type, Tuple, Iterator, Set
 from datetime import datetime
+import asyncio
+import functools
+import heapq
 import json
 import os
 import logging
 import importlib
+import math
 import uuid
 import threading
-import time
 import schedule
 
 from .base import (
     IntegrationProvider,
     IntegrationConfig,
+    AuthenticationConfig,
+    SyncConfig,
     IntegrationType,
     AuthType,
     SyncDirection,
-    IntegrationStatus
+    IntegrationStatus,
+    _auth_type,
+    _sync_direction
 )
 
-# Import providers
-from .github import GitHubProvider
-from .jira import JiraProvider
-
 
 class IntegrationManager:
     """Manager for task integrations."""
     
-    # Provider mapping
+    # Provider mapping keyed by IntegrationType value
+    # (module path relative to this package, class name).
+    # Providers are imported on first use so that their HTTP dependencies are
+    # only loaded when an integration of that type is actually initialized.
     PROVIDER_MAPPING = {
-        IntegrationType.GITHUB: GitHubProvider,
-        IntegrationType.JIRA: JiraProvider
+        IntegrationType.GITHUB.value: (".github", "GitHubProvider"),
+        IntegrationType.JIRA.value: (".jira", "JiraProvider")
     }
     
+    # Delay in seconds used to coalesce consecutive saves
+    FLUSH_DELAY = 0.1
+    
     def __init__(self, 
                  data_dir: str = None,
                  config_file: str = "integrations.json",
@@ -61,6 +70,21 @@ class IntegrationManager:
         # Initialize integrations
         self.integrations: Dict[str, IntegrationConfig] = {}
         self.providers: Dict[str, IntegrationProvider] = {}
+        self._provider_classes: Dict[str, Type[IntegrationProvider]] = {}
+        
+        # Shared HTTP session for all providers, created on first use
+        self._http = None
+        
+        # Debounced writer state
+        self._flush_timer: Optional[threading.Timer] = None
+        self._flush_lock = threading.Lock()
+        
+        # Guards self.integrations and the configs while the writer serializes
+        # them; never hold it while scheduling a flush
+        self._state_lock = threading.RLock()
+        
+        # Bytes of the last snapshot written to disk
+        self._last_snapshot_bytes: Optional[bytes] = None
         
         # Load existing integrations
         self._load_integrations()
@@ -68,6 +92,16 @@ class IntegrationManager:
         # Initialize sync scheduler
         self.scheduler_thread = None
         self.scheduler_running = False
+        self._stop_event = threading.Event()
+        self._sync_heap: List[Tuple[int, str]] = []
+        self._sync_clock = 0
+        self._sync_tick = 1
+        
+        # Initialize asyncio sync scheduler
+        self.async_scheduler_thread = None
+        self._async_loop: Optional[asyncio.AbstractEventLoop] = None
+        self._async_stop: Optional[asyncio.Event] = None
+        self._async_wakeup: Optional[asyncio.Event] = None
     
     def _load_integrations(self) -> None:
         """Load integrations from the configuration file."""
@@ -76,28 +110,106 @@ class IntegrationManager:
             return
         
         try:
-            with open(self.config_file, "r") as f:
-                data = json.load(f)
-            
-            for item in data:
-                config = IntegrationConfig.from_dict(item)
-                self.integrations[config.id] = config
-                
-                # Initialize provider if integration is active
-                if config.status == IntegrationStatus.ACTIVE:
-                    self._initialize_provider(config.id)
+            with open(self.config_file, "rb") as f:
+                for item in self._iter_config_items(f):
+                    config = IntegrationConfig.from_dict(item)
+                    self.integrations[config.id] = config
+                    
+                    # Initialize provider if integration is active
+                    if config.status == IntegrationStatus.ACTIVE:
+                        self._initialize_provider(config.id)
         except Exception as e:
             self.logger.error(f"Error loading integrations: {e}")
     
-    def _save_integrations(self) -> None:
-        """Save integrations to the configuration file."""
+    @staticmethod
+    def _iter_config_items(f) -> Iterator[Dict[str, Any]]:
+        """
+        Iterate over the integration entries of a configuration file.
+        
+        Uses ``ijson`` when it is installed so that only one entry is held in
+        memory at a time, and falls back to ``json.load`` otherwise.
+        
+        Args:
+            f: Configuration file opened in binary mode
+            
+        Returns:
+            Iterator over integration dictionaries
+        """
+        try:
+            import ijson
+        except ImportError:
+            return iter(json.load(f))
+        
+        return ijson.items(f, "item", use_float=True)
+    
+    def _save_integrations(self) -> bool:
+        """
+        Save integrations to the configuration file.
+        
+        Returns:
+            True if the file is up to date, False if the save failed
+        """
         try:
-            data = [config.to_dict() for config in self.integrations.values()]
+            with self._state_lock:
+                data = [config._snapshot() for config in self.integrations.values()]
+                data_bytes = json.dumps(data, indent=2).encode("utf-8")
+            
+            # Skip the write if nothing changed since the last save
+            if data_bytes == self._last_snapshot_bytes:
+                return True
+            
+            # Write to a temporary file and atomically swap it in, so a crash
+            # mid-write never leaves a truncated configuration file behind
+            tmp_file = self.config_file + ".tmp"
+            fd = os.open(tmp_file, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o666)
+            try:
+                view = memoryview(data_bytes)
+                while view:
+                    view = view[os.write(fd, view):]
+                os.fsync(fd)
+            finally:
+                os.close(fd)
+            os.replace(tmp_file, self.config_file)
             
-            with open(self.config_file, "w") as f:
-                json.dump(data, f, indent=2)
+            self._last_snapshot_bytes = data_bytes
+            return True
         except Exception as e:
             self.logger.error(f"Error saving integrations: {e}")
+            return False
+    
+    def _schedule_flush(self) -> None:
+        """
+        Schedule a debounced save of the integrations.
+        
+        Saves requested within FLUSH_DELAY seconds of each other collapse into
+        a single write.
+        """
+        with self._flush_lock:
+            if self._flush_timer is not None:
+                self._flush_timer.cancel()
+            
+            self._flush_timer = threading.Timer(self.FLUSH_DELAY, self._do_flush)
+            self._flush_timer.start()
+    
+    def _do_flush(self) -> None:
+        """Write pending changes to the configuration file."""
+        with self._flush_lock:
+            self._flush_timer = None
+            saved = self._save_integrations()
+        
+        # Retry later rather than losing the changes until the next mutation
+        if not saved:
+            self._schedule_flush()
+    
+    def flush(self) -> None:
+        """
+        Cancel any pending debounced save and write the integrations immediately.
+        """
+        with self._flush_lock:
+            if self._flush_timer is not None:
+                self._flush_timer.cancel()
+        
+        self._do_flush()
     
     def _initialize_provider(self, integration_id: str) -> bool:
         """
@@ -115,22 +227,23 @@ class IntegrationManager:
         
         config = self.integrations[integration_id]
         
-        # Get provider class
-        provider_class = self.PROVIDER_MAPPING.get(config.type)
-        
-        if not provider_class:
-            self.logger.error(f"Provider not found for integration type: {config.type}")
-            return False
-        
         try:
+            # Get provider class
+            provider_class = self._get_provider_class(config.type)
+            
+            if not provider_class:
+                self.logger.error(f"Provider not found for integration type: {config.type}")
+                return False
+            
             # Initialize provider
-            provider = provider_class(config, self.logger)
+            provider = provider_class(config, self.logger, http=self._get_http_session())
             
             # Authenticate
             if not provider.authenticate():
                 self.logger.error(f"Authentication failed for integration: {integration_id}")
-                config.status = IntegrationStatus.ERROR
-                self._save_integrations()
+                with self._state_lock:
+                    config.status = IntegrationStatus.ERROR
+                self._schedule_flush()
                 return False
             
             # Store provider
@@ -139,10 +252,73 @@ class IntegrationManager:
             return True
         except Exception as e:
             self.logger.error(f"Error initializing provider for integration {integration_id}: {e}")
-            config.status = IntegrationStatus.ERROR
-            self._save_integrations()
+            with self._state_lock:
+                config.status = IntegrationStatus.ERROR
+            self._schedule_flush()
             return False
     
+    def _get_provider_class(self, type: IntegrationType) -> Optional[Type[IntegrationProvider]]:
+        """
+        Resolve the provider class for an integration type, importing its module on first use.
+        
+        Args:
+            type: Integration type
+            
+        Returns:
+            Provider class or None if the type has no provider
+        """
+        # Look up by the enum's string value, which hashes faster than the member
+        key = type.value
+        provider_class = self._provider_classes.get(key)
+        if provider_class is not None:
+            return provider_class
+        
+        entry = self.PROVIDER_MAPPING.get(key)
+        if not entry:
+            return None
+        
+        module_path, class_name = entry
+        module = importlib.import_module(module_path, __package__)
+        provider_class = getattr(module, class_name)
+        self._provider_classes[key] = provider_class
+        
+        return provider_class
+    
+    def _get_http_session(self):
+        """
+        Get the HTTP session shared by all providers, creating it on first use.
+        
+        The session keeps a pooled, retrying adapter so providers targeting the
+        same host reuse connections instead of repeating TCP/TLS handshakes.
+        
+        Returns:
+            Shared ``requests.Session``
+        """
+        if self._http is None:
+            import requests
+            from requests.adapters import HTTPAdapter
+            from urllib3.util.retry import Retry
+            
+            session = requests.Session()
+            adapter = HTTPAdapter(
+                pool_connections=32,
+                pool_maxsize=64,
+                max_retries=Retry(
+                    total=3,
+                    backoff_factor=0.3,
+                    status_forcelist=(429, 500, 502, 503, 504),
+                    # Hand the last response back once retries run out, so
+                    # providers still check status_code rather than catching
+                    # a RetryError
+                    raise_on_status=False
+                )
+            )
+            session.mount("https://", adapter)
+            session.mount("http://", adapter)
+            self._http = session
+        
+        return self._http
+    
     def get_integration(self, integration_id: str) -> Optional[IntegrationConfig]:
         """
         Get an integration by ID.
@@ -198,7 +374,7 @@ class IntegrationManager:
             Dictionary with creation results
         """
         # Create authentication config
-        auth_type = AuthType(auth_config.pop("auth_type", "none"))
+        auth_type = _auth_type(auth_config.pop("auth_type", "none"))
         auth = {
             "auth_type": auth_type,
             "credentials": auth_config.get("credentials", {}),
@@ -209,7 +385,7 @@ class IntegrationManager:
         auth_obj = AuthenticationConfig.from_dict(auth)
         
         # Create synchronization config
-        sync_direction = SyncDirection(sync_config.pop("direction", "import"))
+        sync_direction = _sync_direction(sync_config.pop("direction", "import"))
         sync = {
             "direction": sync_direction,
             "interval_minutes": sync_config.get("interval_minutes", 60),
@@ -232,8 +408,10 @@ class IntegrationManager:
         )
         
         # Store integration
-        self.integrations[integration_id] = config
-        self._save_integrations()
+        with self._state_lock:
+            self.integrations[integration_id] = config
+        self._schedule_flush()
+        self._wake_async_scheduler()
         
         return {
             "success": True,
@@ -272,55 +450,65 @@ class IntegrationManager:
         
         config = self.integrations[integration_id]
         
-        # Update name
-        if name is not None:
-            config.name = name
-        
-        # Update authentication config
-        if auth_config is not None:
-            auth_type = AuthType(auth_config.pop("auth_type", config.auth_config.auth_type.value))
-            auth = {
-                "auth_type": auth_type,
-                "credentials": auth_config.get("credentials", config.auth_config.credentials),
-                "scopes": auth_config.get("scopes", config.auth_config.scopes),
-                "expires_at": auth_config.get("expires_at", config.auth_config.expires_at),
-                "refresh_token": auth_config.get("refresh_token", config.auth_config.refresh_token)
-            }
-            config.auth_config = AuthenticationConfig.from_dict(auth)
-        
-        # Update synchronization config
-        if sync_config is not None:
-            sync_direction = SyncDirection(sync_config.pop("direction", config.sync_config.direction.value))
-            sync = {
-                "direction": sync_direction,
-                "interval_minutes": sync_config.get("interval_minutes", config.sync_config.interval_minutes),
-                "filters": sync_config.get("filters", config.sync_config.filters),
-                "mappings": sync_config.get("mappings", config.sync_config.mappings),
-                "last_sync": config.sync_config.last_sync
-            }
-            config.sync_config = SyncConfig.from_dict(sync)
-        
-        # Update settings
-        if settings is not None:
-            config.settings.update(settings)
-        
-        # Update status
-        if status is not None:
+        with self._state_lock:
+            # Update name
+            if name is not None:
+                config.name = name
+            
+            # Update authentication config in place
+            if auth_config is not None:
+                auth = config.auth_config
+                if "auth_type" in auth_config:
+                    auth.auth_type = _auth_type(auth_config["auth_type"])
+                if "credentials" in auth_config:
+                    auth.credentials = auth_config["credentials"]
+                if "scopes" in auth_config:
+                    auth.scopes = auth_config["scopes"] or []
+                if "expires_at" in auth_config:
+                    expires_at = auth_config["expires_at"]
+                    if isinstance(expires_at, str):
+                        expires_at = datetime.fromisoformat(expires_at)
+                    auth.expires_at = expires_at
+                if "refresh_token" in auth_config:
+                    auth.refresh_token = auth_config["refresh_token"]
+            
+            # Update synchronization config in place
+            if sync_config is not None:
+                sync = config.sync_config
+                if "direction" in sync_config:
+                    sync.direction = _sync_direction(sync_config["direction"])
+                if "interval_minutes" in sync_config:
+                    sync.interval_minutes = sync_config["interval_minutes"]
+                if "filters" in sync_config:
+                    sync.filters = sync_config["filters"] or {}
+                if "mappings" in sync_config:
+                    sync.mappings = sync_config["mappings"] or {}
+            
+            # Update settings
+            if settings is not None:
+                config.settings.update(settings)
+            
+            # Update status
             old_status = config.status
-            config.status = status
+            if status is not None:
+                config.status = status
             
-            # Initialize or remove provider based on status change
+            # Update timestamp
+            config.updated_at = datetime.now()
+            config._bump()
+        
+        # Initialize or remove provider based on status change, outside the
+        # lock since authenticating may hit the network
+        if status is not None:
             if old_status != IntegrationStatus.ACTIVE and status == IntegrationStatus.ACTIVE:
                 self._initialize_provider(integration_id)
             elif old_status == IntegrationStatus.ACTIVE and status != IntegrationStatus.ACTIVE:
                 if integration_id in self.providers:
                     del self.providers[integration_id]
         
-        # Update timestamp
-        config.updated_at = datetime.now()
-        
         # Save changes
-        self._save_integrations()
+        self._schedule_flush()
+        self._wake_async_scheduler()
         
         return {
             "success": True,
@@ -351,10 +539,12 @@ class IntegrationManager:
             del self.providers[integration_id]
         
         # Remove integration
-        del self.integrations[integration_id]
+        with self._state_lock:
+            del self.integrations[integration_id]
         
         # Save changes
-        self._save_integrations()
+        self._schedule_flush()
+        self._wake_async_scheduler()
         
         return {
             "success": True,
@@ -387,11 +577,13 @@ class IntegrationManager:
             }
         
         # Update status
-        config.status = IntegrationStatus.ACTIVE
-        config.updated_at = datetime.now()
+        with self._state_lock:
+            config.status = IntegrationStatus.ACTIVE
+            config.updated_at = datetime.now()
         
         # Save changes
-        self._save_integrations()
+        self._schedule_flush()
+        self._wake_async_scheduler()
         
         return {
             "success": True,
@@ -422,11 +614,13 @@ class IntegrationManager:
             del self.providers[integration_id]
         
         # Update status
-        config.status = IntegrationStatus.INACTIVE
-        config.updated_at = datetime.now()
+        with self._state_lock:
+            config.status = IntegrationStatus.INACTIVE
+            config.updated_at = datetime.now()
         
         # Save changes
-        self._save_integrations()
+        self._schedule_flush()
+        self._wake_async_scheduler()
         
         return {
             "success": True,
@@ -554,34 +748,49 @@ class IntegrationManager:
                 "error": str(e)
             }
     
-    def sync_integration(self, integration_id: str, direction: Optional[SyncDirection] = None) -> Dict[str, Any]:
+    def _get_sync_provider(self, integration_id: str) -> Tuple[Optional[IntegrationProvider], Optional[Dict[str, Any]]]:
         """
-        Synchronize tasks with an integration.
+        Get or initialize the provider used to synchronize an integration.
         
         Args:
             integration_id: Integration ID
-            direction: Optional direction to override config
             
         Returns:
-            Dictionary with synchronization results
+            Tuple of the provider and None, or None and an error result
         """
         if integration_id not in self.integrations:
-            return {
+            return None, {
                 "success": False,
                 "error": f"Integration not found: {integration_id}"
             }
         
-        # Get or initialize provider
         provider = self.providers.get(integration_id)
         
         if not provider:
             if not self._initialize_provider(integration_id):
-                return {
+                return None, {
                     "success": False,
                     "error": "Failed to initialize provider"
                 }
             provider = self.providers[integration_id]
         
+        return provider, None
+    
+    def sync_integration(self, integration_id: str, direction: Optional[SyncDirection] = None) -> Dict[str, Any]:
+        """
+        Synchronize tasks with an integration.
+        
+        Args:
+            integration_id: Integration ID
+            direction: Optional direction to override config
+            
+        Returns:
+            Dictionary with synchronization results
+        """
+        provider, error = self._get_sync_provider(integration_id)
+        if error:
+            return error
+        
         # Sync tasks
         try:
             results = provider.sync(direction)
@@ -672,6 +881,32 @@ class IntegrationManager:
                 "error": str(e)
             }
     
+    async def sync_integration_async(self, integration_id: str, direction: Optional[SyncDirection] = None) -> Dict[str, Any]:
+        """
+        Synchronize tasks with an integration from an event loop.
+        
+        Args:
+            integration_id: Integration ID
+            direction: Optional direction to override config
+            
+        Returns:
+            Dictionary with synchronization results
+        """
+        provider, error = self._get_sync_provider(integration_id)
+        if error:
+            return error
+        
+        # Sync tasks
+        try:
+            results = await provider.sync_async(direction)
+            return results
+        except Exception as e:
+            self.logger.error(f"Error syncing integration {integration_id}: {e}")
+            return {
+                "success": False,
+                "error": str(e)
+            }
+    
     def start_sync_scheduler(self) -> bool:
         """
         Start the synchronization scheduler.
@@ -687,6 +922,7 @@ class IntegrationManager:
         self._setup_sync_schedules()
         
         # Start scheduler thread
+        self._stop_event.clear()
         self.scheduler_running = True
         self.scheduler_thread = threading.Thread(target=self._run_scheduler)
         self.scheduler_thread.daemon = True
@@ -701,12 +937,19 @@ class IntegrationManager:
         Returns:
             True if scheduler stopped, False otherwise
         """
+        # Write out any pending changes
+        self.flush()
+        
         if not self.scheduler_running:
             self.logger.warning("Sync scheduler is not running")
             return True
         
-        # Stop scheduler
+        # Stop scheduler and wake the scheduler thread
         self.scheduler_running = False
+        self._stop_event.set()
+        
+        if self.scheduler_thread and self.scheduler_thread is not threading.current_thread():
+            self.scheduler_thread.join(timeout=1.0)
         
         # Clear schedules
         schedule.clear()
@@ -716,21 +959,55 @@ class IntegrationManager:
     def _setup_sync_schedules(self) -> None:
         """
         Set up synchronization schedules for active integrations.
+        
+        A single heartbeat job is registered every ``tick`` minutes, where
+        ``tick`` is the GCD of the active sync intervals. Each heartbeat walks
+        a heap of due times instead of ``schedule`` scanning one job per
+        integration on every ``run_pending()``.
         """
         # Clear existing schedules
         schedule.clear()
         
-        # Set up schedules for active integrations
+        self._sync_clock = 0
+        self._sync_heap = []
+        
+        intervals = []
+        
+        # Queue the first sync of each active integration
         for integration_id, config in self.integrations.items():
             if config.status == IntegrationStatus.ACTIVE:
-                interval_minutes = config.sync_config.interval_minutes
-                
-                # Schedule sync job
-                schedule.every(interval_minutes).minutes.do(
-                    self._scheduled_sync, integration_id=integration_id
-                )
+                interval_minutes = max(1, int(config.sync_config.interval_minutes))
+                intervals.append(interval_minutes)
+                heapq.heappush(self._sync_heap, (interval_minutes, integration_id))
                 
                 self.logger.info(f"Scheduled sync for integration {integration_id} every {interval_minutes} minutes")
+        
+        if not intervals:
+            return
+        
+        # Schedule heartbeat job
+        tick = max(1, functools.reduce(math.gcd, intervals))
+        self._sync_tick = tick
+        schedule.every(tick).minutes.do(self._tick_all)
+    
+    def _tick_all(self) -> None:
+        """
+        Advance the sync clock by one heartbeat and run every due synchronization.
+        """
+        self._sync_clock += self._sync_tick
+        
+        while self._sync_heap and self._sync_heap[0][0] <= self._sync_clock:
+            _, integration_id = heapq.heappop(self._sync_heap)
+            
+            # Drop integrations that were deleted or deactivated since scheduling
+            config = self.integrations.get(integration_id)
+            if not config or config.status != IntegrationStatus.ACTIVE:
+                continue
+            
+            self._scheduled_sync(integration_id)
+            
+            interval_minutes = max(1, int(config.sync_config.interval_minutes))
+            heapq.heappush(self._sync_heap, (self._sync_clock + interval_minutes, integration_id))
     
     def _scheduled_sync(self, integration_id: str) -> None:
         """
@@ -757,10 +1034,169 @@ class IntegrationManager:
         """
         self.logger.info("Starting integration sync scheduler")
         
-        while self.scheduler_running:
+        while not self._stop_event.is_set():
             try:
                 schedule.run_pending()
-                time.sleep(1)
+                if self._stop_event.wait(timeout=1.0):
+                    break
             except Exception as e:
                 self.logger.error(f"Error in sync scheduler: {e}")
-                time.sleep(5)  # Wait a bit longer on error
\ No newline at end of file
+                if self._stop_event.wait(timeout=5.0):  # Wait a bit longer on error
+                    break
+    
+    def start_async_scheduler(self) -> bool:
+        """
+        Start the asyncio synchronization scheduler.
+        
+        All scheduled syncs run as tasks on a single event loop hosted by a
+        dedicated thread, instead of the ``schedule`` polling thread.
+        
+        Returns:
+            True if scheduler started, False otherwise
+        """
+        if self.async_scheduler_thread and self.async_scheduler_thread.is_alive():
+            self.logger.warning("Async sync scheduler is already running")
+            return True
+        
+        self._async_loop = asyncio.new_event_loop()
+        self.async_scheduler_thread = threading.Thread(target=self._run_async_loop)
+        self.async_scheduler_thread.daemon = True
+        self.async_scheduler_thread.start()
+        
+        return True
+    
+    def stop_async_scheduler(self, timeout: float = 5.0) -> bool:
+        """
+        Stop the asyncio synchronization scheduler.
+        
+        Args:
+            timeout: Maximum time in seconds to wait for the loop thread to exit
+            
+        Returns:
+            True if scheduler stopped, False otherwise
+        """
+        # Write out any pending changes
+        self.flush()
+        
+        if not self.async_scheduler_thread or not self.async_scheduler_thread.is_alive():
+            self.logger.warning("Async sync scheduler is not running")
+            return True
+        
+        loop = self._async_loop
+        loop.call_soon_threadsafe(self._async_stop.set)
+        self._wake_async_scheduler()
+        self.async_scheduler_thread.join(timeout)
+        
+        return not self.async_scheduler_thread.is_alive()
+    
+    def _run_async_loop(self) -> None:
+        """
+        Run the asyncio scheduler on this thread's event loop.
+        """
+        loop = self._async_loop
+        asyncio.set_event_loop(loop)
+        self._async_stop = asyncio.Event()
+        self._async_wakeup = asyncio.Event()
+        
+        try:
+            loop.run_until_complete(self._async_run_scheduler())
+        except Exception as e:
+            self.logger.error(f"Error in async sync scheduler: {e}")
+        finally:
+            self._async_wakeup = None
+            loop.close()
+    
+    def _wake_async_scheduler(self) -> None:
+        """
+        Wake the asyncio scheduler so it re-reads the set of active integrations.
+        
+        Safe to call from any thread, and a no-op when the scheduler is not running.
+        """
+        loop = self._async_loop
+        wakeup = self._async_wakeup
+        if loop is None or wakeup is None or loop.is_closed():
+            return
+        
+        try:
+            loop.call_soon_threadsafe(wakeup.set)
+        except RuntimeError:
+            # The loop closed between the check and the call
+            pass
+    
+    async def _async_run_scheduler(self) -> None:
+        """
+        Run the asyncio scheduler loop.
+        
+        The loop sleeps until the next sync is due or until it is woken by a
+        change to the integrations, and re-reads the active integrations on
+        every wakeup so ones created or (re)activated later get scheduled.
+        """
+        self.logger.info("Starting async integration sync scheduler")
+        
+        loop = asyncio.get_running_loop()
+        
+        queue: List[Tuple[float, str]] = []
+        queued: Set[str] = set()
+        running = set()
+        
+        while not self._async_stop.is_set():
+            self._async_wakeup.clear()
+            
+            # Queue the first sync of each active integration not yet queued
+            now = loop.time()
+            for integration_id, config in list(self.integrations.items()):
+                if config.status == IntegrationStatus.ACTIVE and integration_id not in queued:
+                    interval_seconds = max(1, int(config.sync_config.interval_minutes)) * 60
+                    heapq.heappush(queue, (now + interval_seconds, integration_id))
+                    queued.add(integration_id)
+            
+            while queue and queue[0][0] <= loop.time():
+                _, integration_id = heapq.heappop(queue)
+                queued.discard(integration_id)
+                
+                # Drop integrations that were deleted or deactivated since
+                # scheduling; a later wakeup queues them again if reactivated
+                config = self.integrations.get(integration_id)
+                if not config or config.status != IntegrationStatus.ACTIVE:
+                    continue
+                
+                task = asyncio.ensure_future(self._async_scheduled_sync(integration_id))
+                running.add(task)
+                task.add_done_callback(running.discard)
+                
+                interval_seconds = max(1, int(config.sync_config.interval_minutes)) * 60
+                heapq.heappush(queue, (loop.time() + interval_seconds, integration_id))
+                queued.add(integration_id)
+            
+            # Sleep until the next sync is due, a wakeup, or the scheduler is stopped
+            delay = queue[0][0] - loop.time() if queue else None
+            if delay is None or delay > 0:
+                try:
+                    await asyncio.wait_for(self._async_wakeup.wait(), delay)
+                except asyncio.TimeoutError:
+                    pass
+        
+        # Let in-flight syncs finish before the loop closes
+        if running:
+            await asyncio.gather(*running, return_exceptions=True)
+        
+        self.logger.info("Async integration sync scheduler stopped")
+    
+    async def _async_scheduled_sync(self, integration_id: str) -> None:
+        """
+        Perform a scheduled synchronization on the event loop.
+        
+        Args:
+            integration_id: Integration ID
+        """
+        self.logger.info(f"Running scheduled sync for integration {integration_id}")
+        
+        try:
+            results = await self.sync_integration_async(integration_id)
+            
+            if results.get("success"):
+                self.logger.info(f"Scheduled sync for integration {integration_id} completed successfully")
+            else:
+                self.logger.error(f"Scheduled sync for integration {integration_id} failed: {results.get('error')}")
+        except Exception as e:
+            self.logger.error(f"Error in scheduled sync for integration {integration_id}: {e}")
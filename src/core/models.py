@@ -1,8 +1,107 @@
-from dataclasses import dataclass, field
-from typing import List, Optional, Dict, Any
+from contextlib import contextmanager
+from dataclasses import dataclass, field, fields
+import dataclasses
+import json
+from typing import Iterable, List, Optional, Dict, Any
 from datetime import datetime
 from enum import Enum
-import uuid
+import os
+import sys
+import threading
+import time
+
+# Random bytes buffer for generating IDs, refilled in bulk so that the
+# os.urandom syscall is amortized across many Task/ProjectRule instances.
+_ID_BATCH = 4096
+_ID_BUF = bytearray()
+_ID_POS = 0
+_ID_LOCK = threading.Lock()
+
+def _fast_id() -> str:
+    """Returns a random RFC 4122 version 4 UUID string, like str(uuid.uuid4())."""
+    global _ID_POS
+    with _ID_LOCK:
+        if _ID_POS + 16 > len(_ID_BUF):
+            _ID_BUF[:] = os.urandom(16 * _ID_BATCH)
+            _ID_POS = 0
+        b = _ID_BUF[_ID_POS:_ID_POS + 16]
+        _ID_POS += 16
+    b[6] = (b[6] & 0x0F) | 0x40
+    b[8] = (b[8] & 0x3F) | 0x80
+    h = b.hex()
+    return f"{h[:8]}-{h[8:12]}-{h[12:16]}-{h[16:20]}-{h[20:]}"
+
+def _reset_id_buffer():
+    """Discards buffered random bytes so a forked child never reuses its parent's IDs."""
+    global _ID_POS
+    _ID_BUF.clear()
+    _ID_POS = 0
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_id_buffer)
+
+# Last sampled UTC time, the monotonic clock reading when it was taken,
+# and its ISO-8601 string (formatted on first use)
+_NOW_CACHE = [None, 0.0, None]
+_NOW_RESOLUTION = 0.001  # seconds
+
+def _now() -> datetime:
+    """
+    Returns datetime.utcnow(), re-sampled at most once per millisecond.
+
+    Bulk mutations create and touch many tasks back to back; sharing one
+    datetime object per millisecond avoids a clock read and allocation per call.
+    """
+    cache = _NOW_CACHE
+    t = time.monotonic()
+    if cache[0] is None or t - cache[1] > _NOW_RESOLUTION:
+        cache[:] = [datetime.utcnow(), t, None]
+    return cache[0]
+
+def _now_iso() -> str:
+    """Returns _now().isoformat(), formatting each sample only once."""
+    now = _now()
+    cache = _NOW_CACHE
+    if cache[0] is not now:
+        # Another thread re-sampled the clock in between
+        return now.isoformat()
+    if cache[2] is None:
+        cache[2] = now.isoformat()
+    return cache[2]
+
+try:
+    import orjson as _orjson
+except ImportError:
+    _orjson = None
+
+def _json_default(obj):
+    """Serializes the non-JSON types found on tasks for the stdlib json fallback."""
+    if isinstance(obj, datetime):
+        return obj.isoformat()
+    if isinstance(obj, Enum):
+        return obj.value
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+def _slotted(*extra_slots):
+    """
+    Rebuilds a dataclass with __slots__ for its fields, dropping the per-instance __dict__.
+
+    Equivalent to @dataclass(slots=True), which is only available on Python 3.10+.
+    extra_slots names non-field attributes the class sets on its instances.
+    """
+    def wrap(cls):
+        cls_dict = dict(cls.__dict__)
+        field_names = tuple(f.name for f in fields(cls))
+        cls_dict["__slots__"] = field_names + extra_slots
+        for name in field_names:
+            # Defaults are already baked into the generated __init__
+            cls_dict.pop(name, None)
+        cls_dict.pop("__dict__", None)
+        cls_dict.pop("__weakref__", None)
+        new_cls = type(cls)(cls.__name__, cls.__bases__, cls_dict)
+        new_cls.__qualname__ = cls.__qualname__
+        return new_cls
+    return wrap
 
 class TaskStatus(Enum):
     PENDING = "pending"
@@ -18,17 +117,59 @@ class TaskPriority(Enum):
     MEDIUM = "medium"
     HIGH = "high"
 
+class InvalidTransition(ValueError):
+    """Exception raised when a task is moved to a status it cannot reach from its current one."""
+    pass
+
+_STATUS_INDEX = {status: index for index, status in enumerate(TaskStatus)}
+_STATUS_COUNT = len(_STATUS_INDEX)
+# Status strings by index, for building history messages without .value lookups
+_STATUS_STR = tuple(status.value for status in TaskStatus)
+
+# Allowed status changes; staying in the same status is always allowed
+_TRANSITIONS = {
+    TaskStatus.PENDING: (TaskStatus.IN_PROGRESS, TaskStatus.COMPLETED, TaskStatus.BLOCKED,
+                         TaskStatus.DEFERRED, TaskStatus.CANCELLED),
+    TaskStatus.IN_PROGRESS: (TaskStatus.PENDING, TaskStatus.REVIEW, TaskStatus.COMPLETED,
+                             TaskStatus.BLOCKED, TaskStatus.DEFERRED, TaskStatus.CANCELLED),
+    TaskStatus.BLOCKED: (TaskStatus.PENDING, TaskStatus.IN_PROGRESS, TaskStatus.DEFERRED,
+                         TaskStatus.CANCELLED),
+    TaskStatus.REVIEW: (TaskStatus.PENDING, TaskStatus.IN_PROGRESS, TaskStatus.COMPLETED,
+                        TaskStatus.CANCELLED),
+    TaskStatus.DEFERRED: (TaskStatus.PENDING, TaskStatus.IN_PROGRESS, TaskStatus.CANCELLED),
+    TaskStatus.COMPLETED: (TaskStatus.PENDING, TaskStatus.IN_PROGRESS),
+    TaskStatus.CANCELLED: (TaskStatus.PENDING,),
+}
+
+# The transition matrix packed into one integer: bit (from * count + to) is set
+# when the transition is allowed, so a check is a shift and a mask
+_ALLOWED_TRANSITIONS = 0
+for _from, _targets in _TRANSITIONS.items():
+    for _to in (_from,) + _targets:
+        _ALLOWED_TRANSITIONS |= 1 << (_STATUS_INDEX[_from] * _STATUS_COUNT + _STATUS_INDEX[_to])
+del _from, _targets, _to
+
+def _index_transition_allowed(from_index: int, to_index: int) -> bool:
+    """Returns whether a task may move between two statuses, given by their _STATUS_INDEX."""
+    return bool((_ALLOWED_TRANSITIONS >> (from_index * _STATUS_COUNT + to_index)) & 1)
+
+# Lowercase value -> member tables, so that rehydrating tasks from JSON is a
+# single dict lookup instead of an Enum call
+_STATUS_FROM_STR = {status.value: status for status in TaskStatus}
+_PRIORITY_FROM_STR = {priority.value: priority for priority in TaskPriority}
+
+@_slotted("_batch_ts", "_batch_entries")
 @dataclass
 class Task:
     title: str
-    id: str = field(default_factory=lambda: str(uuid.uuid4()))
+    id: str = field(default_factory=_fast_id)
     description: Optional[str] = None
     status: TaskStatus = TaskStatus.PENDING
     priority: TaskPriority = TaskPriority.MEDIUM
     dependencies: List[str] = field(default_factory=list)  # List of Task IDs
     subtasks: List[str] = field(default_factory=list)      # List of Task IDs
-    created_at: datetime = field(default_factory=datetime.utcnow)
-    updated_at: datetime = field(default_factory=datetime.utcnow)
+    created_at: datetime = field(default_factory=_now)
+    updated_at: datetime = field(default_factory=_now)
     assigned_to: Optional[str] = None
     
     # Task effort estimation and tracking
@@ -54,15 +195,29 @@ class Task:
     project_context_tags: List[str] = field(default_factory=list) # Tags linking to project rules/context
     details: Optional[Dict[str, Any]] = field(default_factory=dict) # For additional, dynamic information
     history: List[Dict[str, Any]] = field(default_factory=list) # Log of changes
+    notes: Optional[str] = None # Notes recorded when task results are submitted
+    collaboration_context: Dict[str, Any] = field(default_factory=dict) # Assignments, comments and reviews
 
     def __post_init__(self):
+        # Shared timestamp and pending history entries while inside batch_update()
+        self._batch_ts = None
+        self._batch_entries = None
         if isinstance(self.status, str):
-            self.status = TaskStatus(self.status.lower())
+            status = self.status.lower()
+            # Fall back to the Enum call so unknown values still raise ValueError
+            self.status = _STATUS_FROM_STR.get(status) or TaskStatus(status)
         if isinstance(self.priority, str):
-            self.priority = TaskPriority(self.priority.lower())
+            priority = self.priority.lower()
+            self.priority = _PRIORITY_FROM_STR.get(priority) or TaskPriority(priority)
 
     def update_status(self, new_status: TaskStatus, user: Optional[str] = "system"):
-        self._add_history_entry(f"Status changed from {self.status.value} to {new_status.value}", user)
+        from_index = _STATUS_INDEX[self.status]
+        to_index = _STATUS_INDEX[new_status]
+        if not _index_transition_allowed(from_index, to_index):
+            raise InvalidTransition(
+                f"Cannot change status from {_STATUS_STR[from_index]} to {_STATUS_STR[to_index]}")
+        self._add_history_entry(
+            f"Status changed from {_STATUS_STR[from_index]} to {_STATUS_STR[to_index]}", user)
         self.status = new_status
         self.touch()
 
@@ -72,6 +227,24 @@ class Task:
             self._add_history_entry(f"Added dependency: {task_id}", user)
             self.touch()
 
+    def add_dependencies(self, task_ids: Iterable[str], user: Optional[str] = "system"):
+        """
+        Adds several dependencies, skipping IDs the task already depends on.
+
+        Membership is checked against a set built once for the call, so bulk
+        loads take O(n) instead of one list scan per added ID.
+        """
+        present = set(self.dependencies)
+        added = False
+        for task_id in task_ids:
+            if task_id not in present:
+                present.add(task_id)
+                self.dependencies.append(task_id)
+                self._add_history_entry(f"Added dependency: {task_id}", user)
+                added = True
+        if added:
+            self.touch()
+
     def remove_dependency(self, task_id: str, user: Optional[str] = "system"):
         if task_id in self.dependencies:
             self.dependencies.remove(task_id)
@@ -84,28 +257,72 @@ class Task:
             self._add_history_entry(f"Added subtask: {subtask_id}", user)
             self.touch()
 
+    @contextmanager
+    def batch_update(self):
+        """
+        Groups several mutations into one update.
+
+        History entries recorded inside the block share a single timestamp and
+        are appended together on exit, and updated_at is touched once.
+        """
+        if self._batch_entries is not None:
+            # Already batching; the outermost block flushes
+            yield self
+            return
+
+        self._batch_ts = _now_iso()
+        self._batch_entries = []
+        try:
+            yield self
+        finally:
+            entries = self._batch_entries
+            self._batch_ts = None
+            self._batch_entries = None
+            if entries:
+                self.history.extend(entries)
+                self.touch()
+
     def _add_history_entry(self, change_description: str, user: Optional[str] = "system"):
-        self.history.append({
-            "timestamp": datetime.utcnow().isoformat(),
-            "user": user,
+        entry = {
+            "timestamp": self._batch_ts or _now_iso(),
+            "user": sys.intern(user) if user else user,
             "change": change_description
-        })
+        }
+        if self._batch_entries is not None:
+            self._batch_entries.append(entry)
+        else:
+            self.history.append(entry)
+
+    def to_json(self) -> str:
+        """
+        Serializes the task to a compact JSON string.
+
+        Uses orjson's native dataclass/datetime/Enum support when it is
+        installed, and the stdlib json encoder otherwise.
+        """
+        if _orjson is not None:
+            return _orjson.dumps(self).decode("utf-8")
+        return json.dumps(dataclasses.asdict(self), default=_json_default, separators=(",", ":"))
 
     def touch(self):
         """Updates the updated_at timestamp."""
-        self.updated_at = datetime.utcnow()
+        if self._batch_entries is not None:
+            # Deferred until batch_update() exits
+            return
+        self.updated_at = _now()
 
 # Example of how a ProjectRule might look (to be expanded later)
+@_slotted()
 @dataclass
 class ProjectRule:
     name: str
     description: str
     content: str # The actual rule/guideline content
-    id: str = field(default_factory=lambda: str(uuid.uuid4()))
+    id: str = field(default_factory=_fast_id)
     applies_to_tags: List[str] = field(default_factory=list)
     is_active: bool = True
-    created_at: datetime = field(default_factory=datetime.utcnow)
-    updated_at: datetime = field(default_factory=datetime.utcnow)
+    created_at: datetime = field(default_factory=_now)
+    updated_at: datetime = field(default_factory=_now)
 
     def touch(self):
-        self.updated_at = datetime.utcnow()
+        self.updated_at = _now()
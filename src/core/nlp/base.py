@@ -6,12 +6,23 @@ of the Natural Language Task Processing system in Tascade AI.
 """
 
 from abc import ABC, abstractmethod
-from typing import Dict, List, Any, Optional, Tuple, Set, Union
+from typing import Dict, List, Any, Optional, Tuple, Set, Union, Deque, Iterator
+from collections import deque, OrderedDict
+from datetime import datetime
+import itertools
+import operator
+import sys
+
+
+# Sort key for picking the most confident intent
+_CONF_KEY = operator.attrgetter("confidence")
 
 
 class Intent:
     """Represents a recognized intent from natural language input."""
     
+    __slots__ = ("name", "confidence", "parameters", "_match_span")
+    
     def __init__(self, 
                  name: str, 
                  confidence: float, 
@@ -20,13 +31,17 @@ class Intent:
         Initialize an Intent object.
         
         Args:
-            name: Name of the intent (e.g., 'create_task', 'list_tasks')
+            name: Name of the intent (e.g., 'create_task', 'list_tasks'); it is
+                interned so intent-name dispatch compares by identity first
             confidence: Confidence score (0.0-1.0) of the intent recognition
             parameters: Optional parameters extracted from the intent
         """
-        self.name = name
+        self.name = sys.intern(name)
         self.confidence = confidence
         self.parameters = parameters or {}
+        # (start, end) of the text the recognizer matched, if known; internal
+        # to the parser, so kept out of the public parameters
+        self._match_span: Optional[Tuple[int, int]] = None
     
     def __str__(self) -> str:
         """Return string representation of the intent."""
@@ -40,6 +55,8 @@ class Intent:
 class Entity:
     """Represents an extracted entity from natural language input."""
     
+    __slots__ = ("entity_type", "value", "start_pos", "end_pos", "confidence", "metadata")
+    
     def __init__(self, 
                  entity_type: str, 
                  value: Any, 
@@ -51,14 +68,15 @@ class Entity:
         Initialize an Entity object.
         
         Args:
-            entity_type: Type of entity (e.g., 'task_id', 'priority', 'date')
+            entity_type: Type of entity (e.g., 'task_id', 'priority', 'date'); must be
+                a str, it is interned so type comparisons are mostly identity checks
             value: Extracted value of the entity
             start_pos: Start position in the original text
             end_pos: End position in the original text
             confidence: Confidence score (0.0-1.0) of the entity extraction
             metadata: Optional metadata for the entity
         """
-        self.entity_type = entity_type
+        self.entity_type = sys.intern(entity_type)
         self.value = value
         self.start_pos = start_pos
         self.end_pos = end_pos
@@ -78,6 +96,8 @@ class Entity:
 class NLPResult:
     """Represents the result of natural language processing."""
     
+    __slots__ = ("raw_text", "intents", "entities", "response", "_by_type", "_str_cache")
+    
     def __init__(self, 
                  raw_text: str, 
                  intents: List[Intent], 
@@ -96,13 +116,39 @@ class NLPResult:
         self.intents = intents
         self.entities = entities
         self.response = response
+        
+        # Entities grouped by type, built on first lookup (entities are not
+        # modified after construction)
+        self._by_type: Optional[Dict[str, List[Entity]]] = None
+        
+        # String form, built on first use by __str__
+        self._str_cache: Optional[str] = None
     
     @property
     def primary_intent(self) -> Optional[Intent]:
         """Get the primary intent with highest confidence."""
         if not self.intents:
             return None
-        return sorted(self.intents, key=lambda x: x.confidence, reverse=True)[0]
+        return max(self.intents, key=_CONF_KEY)
+    
+    def entities_by_type(self) -> Dict[str, List[Entity]]:
+        """
+        Get all entities grouped by type.
+        
+        The grouping is built once and shared between calls, so callers
+        looking up several types pay for one pass over the entities. The
+        returned mapping and its lists must not be modified.
+        
+        Returns:
+            Dictionary mapping entity types to entities in extraction order
+        """
+        if self._by_type is None:
+            by_type: Dict[str, List[Entity]] = {}
+            for entity in self.entities:
+                by_type.setdefault(entity.entity_type, []).append(entity)
+            self._by_type = by_type
+        
+        return self._by_type
     
     def get_entities_by_type(self, entity_type: str) -> List[Entity]:
         """
@@ -114,13 +160,15 @@ class NLPResult:
         Returns:
             List of entities matching the specified type
         """
-        return [entity for entity in self.entities if entity.entity_type == entity_type]
+        return list(self.entities_by_type().get(entity_type, ()))
     
     def __str__(self) -> str:
         """Return string representation of the NLP result."""
-        return (f"NLPResult(text='{self.raw_text[:50]}...', "
-                f"primary_intent={self.primary_intent}, "
-                f"entities_count={len(self.entities)})")
+        if self._str_cache is None:
+            self._str_cache = (f"NLPResult(text='{self.raw_text[:50]}...', "
+                               f"primary_intent={self.primary_intent}, "
+                               f"entities_count={len(self.entities)})")
+        return self._str_cache
 
 
 class NLParser(ABC):
@@ -152,7 +200,8 @@ class IntentRecognizer(ABC):
             text: Natural language text to analyze
             
         Returns:
-            List of recognized intents with confidence scores
+            List of recognized intents with confidence scores, sorted by
+            descending confidence
         """
         pass
 
@@ -167,7 +216,8 @@ class EntityExtractor(ABC):
         
         Args:
             text: Natural language text to analyze
-            intents: List of recognized intents to guide extraction
+            intents: List of recognized intents to guide extraction, sorted by
+                descending confidence
             
         Returns:
             List of extracted entities
@@ -195,21 +245,51 @@ class CommandExecutor(ABC):
 class ConversationContext:
     """Manages conversation context for multi-turn interactions."""
     
+    __slots__ = ("session_id", "max_history", "user_inputs", "nlp_results",
+                 "system_responses", "timestamps", "context_variables")
+    
     def __init__(self, 
                  session_id: str, 
                  max_history: int = 10):
         """
         Initialize a ConversationContext object.
         
+        Turns are stored field by field in parallel deques (one entry per
+        turn, oldest first), so scanning a single field such as the user
+        inputs does not touch the others; see the history property for the
+        per-turn dict view.
+        
         Args:
             session_id: Unique identifier for the conversation session
             max_history: Maximum number of turns to keep in history
         """
         self.session_id = session_id
         self.max_history = max_history
-        self.history: List[Dict[str, Any]] = []
+        self.user_inputs: Deque[str] = deque(maxlen=max_history)
+        self.nlp_results: Deque[NLPResult] = deque(maxlen=max_history)
+        self.system_responses: Deque[str] = deque(maxlen=max_history)
+        self.timestamps: Deque[str] = deque(maxlen=max_history)
         self.context_variables: Dict[str, Any] = {}
     
+    @property
+    def history(self) -> List[Dict[str, Any]]:
+        """
+        Get the conversation turns as dicts, oldest first.
+        
+        Returns:
+            List of turns with user_input, nlp_result, system_response and timestamp keys
+        """
+        return [
+            {
+                "user_input": user_input,
+                "nlp_result": nlp_result,
+                "system_response": system_response,
+                "timestamp": timestamp
+            }
+            for user_input, nlp_result, system_response, timestamp in zip(
+                self.user_inputs, self.nlp_results, self.system_responses, self.timestamps)
+        ]
+    
     def add_turn(self, 
                 user_input: str, 
                 nlp_result: NLPResult, 
@@ -222,18 +302,18 @@ class ConversationContext:
             nlp_result: Result of natural language processing
             system_response: System's response text
         """
-        turn = {
-            "user_input": user_input,
-            "nlp_result": nlp_result,
-            "system_response": system_response,
-            "timestamp": self._get_current_timestamp()
-        }
-        
-        self.history.append(turn)
-        
-        # Trim history if it exceeds max_history
-        if len(self.history) > self.max_history:
-            self.history = self.history[-self.max_history:]
+        # Each deque drops its oldest entry once max_history is reached
+        self.user_inputs.append(user_input)
+        self.nlp_results.append(nlp_result)
+        self.system_responses.append(system_response)
+        self.timestamps.append(self._get_current_timestamp())
+    
+    def clear_history(self) -> None:
+        """Remove all conversation turns."""
+        self.user_inputs.clear()
+        self.nlp_results.clear()
+        self.system_responses.clear()
+        self.timestamps.clear()
     
     def set_context_variable(self, key: str, value: Any) -> None:
         """
@@ -269,11 +349,31 @@ class ConversationContext:
         Returns:
             Last primary intent or None if history is empty
         """
-        if not self.history:
+        if not self.nlp_results:
             return None
         
-        last_turn = self.history[-1]
-        return last_turn["nlp_result"].primary_intent
+        return self.nlp_results[-1].primary_intent
+    
+    def iter_recent_entities(self, entity_type: Optional[str] = None) -> Iterator[Entity]:
+        """
+        Iterate over entities from recent conversation turns, most recent turn first.
+        
+        Turns are only examined as the iterator is consumed, so callers looking
+        for the latest matching entity can stop after the first match.
+        
+        Args:
+            entity_type: Optional type of entities to retrieve
+            
+        Returns:
+            Iterator over entities from recent turns
+        """
+        if entity_type:
+            per_turn = (nlp_result.get_entities_by_type(entity_type)
+                        for nlp_result in reversed(self.nlp_results))
+        else:
+            per_turn = (nlp_result.entities for nlp_result in reversed(self.nlp_results))
+        
+        return itertools.chain.from_iterable(per_turn)
     
     def get_recent_entities(self, entity_type: Optional[str] = None) -> List[Entity]:
         """
@@ -285,19 +385,7 @@ class ConversationContext:
         Returns:
             List of entities from recent turns
         """
-        entities = []
-        
-        for turn in reversed(self.history):
-            nlp_result = turn["nlp_result"]
-            
-            if entity_type:
-                turn_entities = nlp_result.get_entities_by_type(entity_type)
-            else:
-                turn_entities = nlp_result.entities
-            
-            entities.extend(turn_entities)
-        
-        return entities
+        return list(self.iter_recent_entities(entity_type))
     
     def _get_current_timestamp(self) -> str:
         """
@@ -306,7 +394,6 @@ class ConversationContext:
         Returns:
             Current timestamp string
         """
-        from datetime import datetime
         return datetime.now().isoformat()
 
 
@@ -319,19 +406,25 @@ class NLPManager:
     conversation context.
     """
     
+    __slots__ = ("parser", "command_executor", "conversation_contexts", "max_sessions")
+    
     def __init__(self, 
                  parser: NLParser,
-                 command_executor: CommandExecutor):
+                 command_executor: CommandExecutor,
+                 max_sessions: int = 1024):
         """
         Initialize an NLPManager object.
         
         Args:
             parser: Natural language parser
             command_executor: Command executor
+            max_sessions: Maximum number of conversation contexts to keep; the
+                least recently used session is evicted beyond this
         """
         self.parser = parser
         self.command_executor = command_executor
-        self.conversation_contexts: Dict[str, ConversationContext] = {}
+        self.max_sessions = max_sessions
+        self.conversation_contexts: "OrderedDict[str, ConversationContext]" = OrderedDict()
     
     def process_input(self, 
                      text: str, 
@@ -370,7 +463,15 @@ class NLPManager:
         Returns:
             Conversation context
         """
-        if session_id not in self.conversation_contexts:
-            self.conversation_contexts[session_id] = ConversationContext(session_id)
+        contexts = self.conversation_contexts
+        context = contexts.get(session_id)
+        
+        if context is None:
+            if len(contexts) >= self.max_sessions:
+                contexts.popitem(last=False)
+            context = ConversationContext(session_id)
+            contexts[session_id] = context
+        else:
+            contexts.move_to_end(session_id)
         
-        return self.conversation_contexts[session_id]
+        return context
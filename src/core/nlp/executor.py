@@ -5,13 +5,144 @@ This module implements the command executor that translates parsed natural
 language intents and entities into actual task operations.
 """
 
+import calendar
 import logging
-from typing import Dict, List, Any, Optional, Tuple, Set, Union
-from datetime import datetime, timedelta
+import re
+from functools import lru_cache, wraps
+from typing import Dict, List, Any, Optional
+from datetime import date, timedelta
 
-from .base import CommandExecutor, NLPResult, Intent, Entity
+from .base import CommandExecutor, NLPResult, Entity
 
 
+# Relative date phrases: "today"/"tomorrow"/"yesterday", "next <unit>" and
+# "in <n> <units>"; trailing words are ignored
+_RELATIVE_DATE_RE = re.compile(
+    r"(today|tomorrow|yesterday)\b"
+    r"|next\s+(week|month|year)\b"
+    r"|in\s+(\d+)\s+(days?|weeks?|months?)\b"
+)
+_DAY_OFFSETS = {"today": 0, "tomorrow": 1, "yesterday": -1}
+_UNIT_DAYS = {"day": 1, "days": 1, "week": 7, "weeks": 7}
+_UNIT_MONTHS = {"month": 1, "months": 1, "year": 12}
+
+# Fallback task title: whatever follows the first standalone word "task"
+_TITLE_AFTER_TASK_RE = re.compile(r"(?<!\S)task\s+(\S.*)", re.IGNORECASE | re.DOTALL)
+
+# "for user <id>" and "top <n>" in recommendation requests
+_REC_USER_RE = re.compile(r"for user\s+(\S+)")
+_REC_LIMIT_RE = re.compile(r"\btop\s+(\d+)")
+
+# Status keyword found in a list request -> status filter value
+_STATUS_KEYWORDS = {
+    "pending": "pending",
+    "in progress": "in-progress",
+    "in-progress": "in-progress",
+    "completed": "completed",
+    "done": "completed",
+}
+# All status keywords as one alternation, so the text is scanned once
+_STATUS_KEYWORD_RE = re.compile("|".join(map(re.escape, _STATUS_KEYWORDS)))
+
+
+# Reply to the help intent
+_HELP_TEXT = """
+I can help you manage your tasks using natural language. Here are some examples of what you can say:
+
+- "Create a new task called Fix login bug"
+- "List all tasks"
+- "List high priority tasks"
+- "Show task #123"
+- "Update task #123 with title 'Updated title'"
+- "Set priority of task #123 to high"
+- "Set due date of task #123 to next Friday"
+- "Mark task #123 as complete"
+- "Delete task #123"
+- "Add dependency: task #123 depends on task #456"
+- "Remove dependency between task #123 and task #456"
+- "Recommend tasks for me"
+- "What should I work on next?"
+
+You can also ask for help on specific commands, like "How do I create a task?"
+""".strip()
+
+
+def _add_months(day: date, months: int) -> date:
+    """
+    Move a date forward by whole months, clamping the day to the target month's length.
+    
+    Args:
+        day: Starting date
+        months: Number of months to add
+        
+    Returns:
+        Shifted date
+    """
+    year, month_index = divmod(day.month - 1 + months, 12)
+    year += day.year
+    month = month_index + 1
+    return date(year, month, min(day.day, calendar.monthrange(year, month)[1]))
+
+
+@lru_cache(maxsize=256)
+def _resolve_relative_date(phrase: str, today: date) -> str:
+    """
+    Resolve a normalized relative date phrase against a given day.
+    
+    Cached because the same few phrases recur across commands; keying on the
+    day keeps entries from going stale at midnight.
+    
+    Args:
+        phrase: Stripped, lowercased relative date string
+        today: Day the phrase is relative to
+        
+    Returns:
+        Date string in ISO format
+    """
+    match = _RELATIVE_DATE_RE.match(phrase)
+    if match is None:
+        # Default to today if we can't parse
+        return today.isoformat()
+    
+    day_word, next_unit, amount, unit = match.groups()
+    if day_word:
+        return (today + timedelta(days=_DAY_OFFSETS[day_word])).isoformat()
+    
+    if next_unit:
+        amount, unit = 1, next_unit
+    else:
+        amount = int(amount)
+    
+    if unit in _UNIT_DAYS:
+        return (today + timedelta(days=_UNIT_DAYS[unit] * amount)).isoformat()
+    return _add_months(today, _UNIT_MONTHS[unit] * amount).isoformat()
+
+
+def _safe_response(failure_message: str):
+    """
+    Decorator for executor handlers that turns an exception into a failure response.
+    
+    Args:
+        failure_message: Message prefix used when the handler raises
+        
+    Returns:
+        Decorator wrapping a handler method
+    """
+    def decorator(handler):
+        @wraps(handler)
+        def wrapper(self, nlp_result: NLPResult) -> Dict[str, Any]:
+            try:
+                return handler(self, nlp_result)
+            except Exception as e:
+                self.logger.error(f"{failure_message}: {str(e)}")
+                return self._create_response(
+                    success=False,
+                    message=f"{failure_message}: {str(e)}",
+                    data=None
+                )
+        return wrapper
+    return decorator
+
 class TaskCommandExecutor(CommandExecutor):
     """
     Command executor for task management operations.
@@ -20,6 +151,9 @@ class TaskCommandExecutor(CommandExecutor):
     interacting with the Task Manager to perform operations.
     """
     
+    # Looked up once for all executors rather than in every __init__
+    logger = logging.getLogger(__name__)
+    
     def __init__(self, task_manager, recommendation_system=None):
         """
         Initialize the task command executor.
@@ -30,7 +164,6 @@ class TaskCommandExecutor(CommandExecutor):
         """
         self.task_manager = task_manager
         self.recommendation_system = recommendation_system
-        self.logger = logging.getLogger(__name__)
     
     def execute(self, nlp_result: NLPResult) -> Dict[str, Any]:
         """
@@ -55,45 +188,18 @@ class TaskCommandExecutor(CommandExecutor):
         # Execute appropriate command based on intent
         intent_name = primary_intent.name
         
-        try:
-            if intent_name == "create_task":
-                return self._execute_create_task(nlp_result)
-            elif intent_name == "list_tasks":
-                return self._execute_list_tasks(nlp_result)
-            elif intent_name == "update_task":
-                return self._execute_update_task(nlp_result)
-            elif intent_name == "delete_task":
-                return self._execute_delete_task(nlp_result)
-            elif intent_name == "complete_task":
-                return self._execute_complete_task(nlp_result)
-            elif intent_name == "get_task":
-                return self._execute_get_task(nlp_result)
-            elif intent_name == "set_priority":
-                return self._execute_set_priority(nlp_result)
-            elif intent_name == "set_due_date":
-                return self._execute_set_due_date(nlp_result)
-            elif intent_name == "add_dependency":
-                return self._execute_add_dependency(nlp_result)
-            elif intent_name == "remove_dependency":
-                return self._execute_remove_dependency(nlp_result)
-            elif intent_name == "get_recommendations":
-                return self._execute_get_recommendations(nlp_result)
-            elif intent_name == "help":
-                return self._execute_help(nlp_result)
-            else:
-                return self._create_response(
-                    success=False,
-                    message=f"I don't know how to {intent_name}. Try asking for help to see what I can do.",
-                    data=None
-                )
-        except Exception as e:
-            self.logger.error(f"Error executing command: {str(e)}")
+        handler_name = self._DISPATCH.get(intent_name)
+        if handler_name is None:
             return self._create_response(
                 success=False,
-                message=f"An error occurred: {str(e)}",
+                message=f"I don't know how to {intent_name}. Try asking for help to see what I can do.",
                 data=None
             )
+        
+        # Handlers turn their own failures into responses (see _safe_response)
+        return getattr(self, handler_name)(nlp_result)
     
+    @_safe_response("Failed to create task")
     def _execute_create_task(self, nlp_result: NLPResult) -> Dict[str, Any]:
         """
         Execute create task command.
@@ -104,46 +210,49 @@ class TaskCommandExecutor(CommandExecutor):
         Returns:
             Command execution result
         """
+        task_data = self._plan_create_task(nlp_result)
+        title = task_data["title"]
+        
+        task_id = self.task_manager.create_task(task_data)
+        
+        return self._create_response(
+            success=True,
+            message=f"Task '{title}' created successfully with ID {task_id}.",
+            data={"task_id": task_id, "task_data": task_data}
+        )
+    
+    def _plan_create_task(self, nlp_result: NLPResult) -> Dict[str, Any]:
+        """
+        Build the data for a new task from an NLP result, without side effects.
+        
+        Args:
+            nlp_result: NLP result containing intents and entities
+            
+        Returns:
+            Task data to pass to the task manager
+        """
+        by_type = nlp_result.entities_by_type()
+        
         # Extract title
-        title_entities = nlp_result.get_entities_by_type("title")
+        title_entities = by_type.get("title", ())
         if title_entities:
             title = title_entities[0].value
         else:
             # Try to extract title from the text after "create task" or similar
-            raw_text = nlp_result.raw_text
-            words = raw_text.split()
-            task_index = -1
-            
-            for i, word in enumerate(words):
-                if word.lower() == "task":
-                    task_index = i
-                    break
-            
-            if task_index >= 0 and task_index + 1 < len(words):
-                title = " ".join(words[task_index + 1:])
-            else:
-                title = "New Task"
+            match = _TITLE_AFTER_TASK_RE.search(nlp_result.raw_text)
+            title = match.group(1).rstrip() if match else "New Task"
         
         # Extract description
-        description_entities = nlp_result.get_entities_by_type("description")
+        description_entities = by_type.get("description", ())
         description = description_entities[0].value if description_entities else ""
         
         # Extract priority
-        priority_entities = nlp_result.get_entities_by_type("priority")
+        priority_entities = by_type.get("priority", ())
         priority = priority_entities[0].value if priority_entities else "medium"
         
         # Extract due date
-        date_entities = nlp_result.get_entities_by_type("date")
-        relative_date_entities = nlp_result.get_entities_by_type("relative_date")
+        due_date = self._extract_due_date(by_type)
         
-        due_date = None
-        if date_entities:
-            due_date = date_entities[0].value
-        elif relative_date_entities:
-            relative_date = relative_date_entities[0].value
-            due_date = self._parse_relative_date(relative_date)
-        
-        # Create task
         task_data = {
             "title": title,
             "description": description,
@@ -153,21 +262,9 @@ class TaskCommandExecutor(CommandExecutor):
         if due_date:
             task_data["due_date"] = due_date
         
-        try:
-            task_id = self.task_manager.create_task(task_data)
-            
-            return self._create_response(
-                success=True,
-                message=f"Task '{title}' created successfully with ID {task_id}.",
-                data={"task_id": task_id, "task_data": task_data}
-            )
-        except Exception as e:
-            return self._create_response(
-                success=False,
-                message=f"Failed to create task: {str(e)}",
-                data=None
-            )
+        return task_data
     
+    @_safe_response("Failed to list tasks")
     def _execute_list_tasks(self, nlp_result: NLPResult) -> Dict[str, Any]:
         """
         Execute list tasks command.
@@ -178,58 +275,50 @@ class TaskCommandExecutor(CommandExecutor):
         Returns:
             Command execution result
         """
+        by_type = nlp_result.entities_by_type()
+        
         # Extract filters
-        status_filters = []
         priority_filters = []
         
-        # Check for status in text
-        raw_text = nlp_result.raw_text.lower()
-        if "pending" in raw_text:
-            status_filters.append("pending")
-        if "in progress" in raw_text or "in-progress" in raw_text:
-            status_filters.append("in-progress")
-        if "completed" in raw_text or "done" in raw_text:
-            status_filters.append("completed")
+        # Check for status in text with one scan, keeping each status once in table order
+        found = set(_STATUS_KEYWORD_RE.findall(nlp_result.raw_text.lower()))
+        status_filters = list(dict.fromkeys(
+            status for keyword, status in _STATUS_KEYWORDS.items() if keyword in found
+        ))
         
         # Check for priority in text
-        priority_entities = nlp_result.get_entities_by_type("priority")
+        priority_entities = by_type.get("priority", ())
         for entity in priority_entities:
             priority_filters.append(entity.value)
         
         # Get tasks
-        try:
-            filters = {}
-            if status_filters:
-                filters["status"] = status_filters
-            if priority_filters:
-                filters["priority"] = priority_filters
-            
-            tasks = self.task_manager.list_tasks(filters)
-            
-            if not tasks:
-                message = "No tasks found."
-                if filters:
-                    filter_desc = []
-                    if "status" in filters:
-                        filter_desc.append(f"status={','.join(filters['status'])}")
-                    if "priority" in filters:
-                        filter_desc.append(f"priority={','.join(filters['priority'])}")
-                    message = f"No tasks found matching filters: {' '.join(filter_desc)}."
-            else:
-                message = f"Found {len(tasks)} tasks."
-            
-            return self._create_response(
-                success=True,
-                message=message,
-                data={"tasks": tasks, "filters": filters}
-            )
-        except Exception as e:
-            return self._create_response(
-                success=False,
-                message=f"Failed to list tasks: {str(e)}",
-                data=None
-            )
+        filters = {}
+        if status_filters:
+            filters["status"] = status_filters
+        if priority_filters:
+            filters["priority"] = priority_filters
+        
+        tasks = self.task_manager.list_tasks(filters)
+        
+        if not tasks:
+            message = "No tasks found."
+            if filters:
+                filter_desc = []
+                if "status" in filters:
+                    filter_desc.append(f"status={','.join(filters['status'])}")
+                if "priority" in filters:
+                    filter_desc.append(f"priority={','.join(filters['priority'])}")
+                message = f"No tasks found matching filters: {' '.join(filter_desc)}."
+        else:
+            message = f"Found {len(tasks)} tasks."
+        
+        return self._create_response(
+            success=True,
+            message=message,
+            data={"tasks": tasks, "filters": filters}
+        )
     
+    @_safe_response("Failed to get task")
     def _execute_get_task(self, nlp_result: NLPResult) -> Dict[str, Any]:
         """
         Execute get task command.
@@ -240,8 +329,10 @@ class TaskCommandExecutor(CommandExecutor):
         Returns:
             Command execution result
         """
+        by_type = nlp_result.entities_by_type()
+        
         # Extract task ID
-        task_id_entities = nlp_result.get_entities_by_type("task_id")
+        task_id_entities = by_type.get("task_id", ())
         
         if not task_id_entities:
             return self._create_response(
@@ -252,28 +343,22 @@ class TaskCommandExecutor(CommandExecutor):
         
         task_id = task_id_entities[0].value
         
-        try:
-            task = self.task_manager.get_task(task_id)
-            
-            if not task:
-                return self._create_response(
-                    success=False,
-                    message=f"Task with ID {task_id} not found.",
-                    data=None
-                )
-            
-            return self._create_response(
-                success=True,
-                message=f"Found task: {task['title']}",
-                data={"task": task}
-            )
-        except Exception as e:
+        task = self.task_manager.get_task(task_id)
+        
+        if not task:
             return self._create_response(
                 success=False,
-                message=f"Failed to get task: {str(e)}",
+                message=f"Task with ID {task_id} not found.",
                 data=None
             )
+        
+        return self._create_response(
+            success=True,
+            message=f"Found task: {task['title']}",
+            data={"task": task}
+        )
     
+    @_safe_response("Failed to update task")
     def _execute_update_task(self, nlp_result: NLPResult) -> Dict[str, Any]:
         """
         Execute update task command.
@@ -284,8 +369,10 @@ class TaskCommandExecutor(CommandExecutor):
         Returns:
             Command execution result
         """
+        by_type = nlp_result.entities_by_type()
+        
         # Extract task ID
-        task_id_entities = nlp_result.get_entities_by_type("task_id")
+        task_id_entities = by_type.get("task_id", ())
         
         if not task_id_entities:
             return self._create_response(
@@ -300,29 +387,24 @@ class TaskCommandExecutor(CommandExecutor):
         update_data = {}
         
         # Title
-        title_entities = nlp_result.get_entities_by_type("title")
+        title_entities = by_type.get("title", ())
         if title_entities:
             update_data["title"] = title_entities[0].value
         
         # Description
-        description_entities = nlp_result.get_entities_by_type("description")
+        description_entities = by_type.get("description", ())
         if description_entities:
             update_data["description"] = description_entities[0].value
         
         # Priority
-        priority_entities = nlp_result.get_entities_by_type("priority")
+        priority_entities = by_type.get("priority", ())
         if priority_entities:
             update_data["priority"] = priority_entities[0].value
         
         # Due date
-        date_entities = nlp_result.get_entities_by_type("date")
-        relative_date_entities = nlp_result.get_entities_by_type("relative_date")
-        
-        if date_entities:
-            update_data["due_date"] = date_entities[0].value
-        elif relative_date_entities:
-            relative_date = relative_date_entities[0].value
-            update_data["due_date"] = self._parse_relative_date(relative_date)
+        due_date = self._extract_due_date(by_type)
+        if due_date:
+            update_data["due_date"] = due_date
         
         if not update_data:
             return self._create_response(
@@ -331,29 +413,15 @@ class TaskCommandExecutor(CommandExecutor):
                 data=None
             )
         
-        try:
-            success = self.task_manager.update_task(task_id, update_data)
-            
-            if not success:
-                return self._create_response(
-                    success=False,
-                    message=f"Task with ID {task_id} not found or couldn't be updated.",
-                    data=None
-                )
-            
-            fields_updated = ", ".join(update_data.keys())
-            return self._create_response(
-                success=True,
-                message=f"Task {task_id} updated successfully. Fields updated: {fields_updated}.",
-                data={"task_id": task_id, "updated_fields": update_data}
-            )
-        except Exception as e:
-            return self._create_response(
-                success=False,
-                message=f"Failed to update task: {str(e)}",
-                data=None
-            )
+        fields_updated = ", ".join(update_data.keys())
+        return self._apply_update(
+            task_id, update_data,
+            failure_reason="couldn't be updated",
+            message=f"Task {task_id} updated successfully. Fields updated: {fields_updated}.",
+            data={"task_id": task_id, "updated_fields": update_data}
+        )
     
+    @_safe_response("Failed to delete task")
     def _execute_delete_task(self, nlp_result: NLPResult) -> Dict[str, Any]:
         """
         Execute delete task command.
@@ -364,8 +432,10 @@ class TaskCommandExecutor(CommandExecutor):
         Returns:
             Command execution result
         """
+        by_type = nlp_result.entities_by_type()
+        
         # Extract task ID
-        task_id_entities = nlp_result.get_entities_by_type("task_id")
+        task_id_entities = by_type.get("task_id", ())
         
         if not task_id_entities:
             return self._create_response(
@@ -376,28 +446,22 @@ class TaskCommandExecutor(CommandExecutor):
         
         task_id = task_id_entities[0].value
         
-        try:
-            success = self.task_manager.delete_task(task_id)
-            
-            if not success:
-                return self._create_response(
-                    success=False,
-                    message=f"Task with ID {task_id} not found or couldn't be deleted.",
-                    data=None
-                )
-            
-            return self._create_response(
-                success=True,
-                message=f"Task {task_id} deleted successfully.",
-                data={"task_id": task_id}
-            )
-        except Exception as e:
+        success = self.task_manager.delete_task(task_id)
+        
+        if not success:
             return self._create_response(
                 success=False,
-                message=f"Failed to delete task: {str(e)}",
+                message=f"Task with ID {task_id} not found or couldn't be deleted.",
                 data=None
             )
+        
+        return self._create_response(
+            success=True,
+            message=f"Task {task_id} deleted successfully.",
+            data={"task_id": task_id}
+        )
     
+    @_safe_response("Failed to complete task")
     def _execute_complete_task(self, nlp_result: NLPResult) -> Dict[str, Any]:
         """
         Execute complete task command.
@@ -408,8 +472,10 @@ class TaskCommandExecutor(CommandExecutor):
         Returns:
             Command execution result
         """
+        by_type = nlp_result.entities_by_type()
+        
         # Extract task ID
-        task_id_entities = nlp_result.get_entities_by_type("task_id")
+        task_id_entities = by_type.get("task_id", ())
         
         if not task_id_entities:
             return self._create_response(
@@ -420,28 +486,14 @@ class TaskCommandExecutor(CommandExecutor):
         
         task_id = task_id_entities[0].value
         
-        try:
-            success = self.task_manager.update_task(task_id, {"status": "completed"})
-            
-            if not success:
-                return self._create_response(
-                    success=False,
-                    message=f"Task with ID {task_id} not found or couldn't be marked as complete.",
-                    data=None
-                )
-            
-            return self._create_response(
-                success=True,
-                message=f"Task {task_id} marked as complete.",
-                data={"task_id": task_id}
-            )
-        except Exception as e:
-            return self._create_response(
-                success=False,
-                message=f"Failed to complete task: {str(e)}",
-                data=None
-            )
+        return self._apply_update(
+            task_id, {"status": "completed"},
+            failure_reason="couldn't be marked as complete",
+            message=f"Task {task_id} marked as complete.",
+            data={"task_id": task_id}
+        )
     
+    @_safe_response("Failed to set priority")
     def _execute_set_priority(self, nlp_result: NLPResult) -> Dict[str, Any]:
         """
         Execute set priority command.
@@ -452,8 +504,10 @@ class TaskCommandExecutor(CommandExecutor):
         Returns:
             Command execution result
         """
+        by_type = nlp_result.entities_by_type()
+        
         # Extract task ID
-        task_id_entities = nlp_result.get_entities_by_type("task_id")
+        task_id_entities = by_type.get("task_id", ())
         
         if not task_id_entities:
             return self._create_response(
@@ -465,7 +519,7 @@ class TaskCommandExecutor(CommandExecutor):
         task_id = task_id_entities[0].value
         
         # Extract priority
-        priority_entities = nlp_result.get_entities_by_type("priority")
+        priority_entities = by_type.get("priority", ())
         
         if not priority_entities:
             return self._create_response(
@@ -476,28 +530,14 @@ class TaskCommandExecutor(CommandExecutor):
         
         priority = priority_entities[0].value
         
-        try:
-            success = self.task_manager.update_task(task_id, {"priority": priority})
-            
-            if not success:
-                return self._create_response(
-                    success=False,
-                    message=f"Task with ID {task_id} not found or priority couldn't be updated.",
-                    data=None
-                )
-            
-            return self._create_response(
-                success=True,
-                message=f"Priority for task {task_id} set to {priority}.",
-                data={"task_id": task_id, "priority": priority}
-            )
-        except Exception as e:
-            return self._create_response(
-                success=False,
-                message=f"Failed to set priority: {str(e)}",
-                data=None
-            )
+        return self._apply_update(
+            task_id, {"priority": priority},
+            failure_reason="priority couldn't be updated",
+            message=f"Priority for task {task_id} set to {priority}.",
+            data={"task_id": task_id, "priority": priority}
+        )
     
+    @_safe_response("Failed to set due date")
     def _execute_set_due_date(self, nlp_result: NLPResult) -> Dict[str, Any]:
         """
         Execute set due date command.
@@ -508,8 +548,10 @@ class TaskCommandExecutor(CommandExecutor):
         Returns:
             Command execution result
         """
+        by_type = nlp_result.entities_by_type()
+        
         # Extract task ID
-        task_id_entities = nlp_result.get_entities_by_type("task_id")
+        task_id_entities = by_type.get("task_id", ())
         
         if not task_id_entities:
             return self._create_response(
@@ -521,44 +563,23 @@ class TaskCommandExecutor(CommandExecutor):
         task_id = task_id_entities[0].value
         
         # Extract due date
-        date_entities = nlp_result.get_entities_by_type("date")
-        relative_date_entities = nlp_result.get_entities_by_type("relative_date")
+        due_date = self._extract_due_date(by_type)
         
-        if not date_entities and not relative_date_entities:
+        if not due_date:
             return self._create_response(
                 success=False,
                 message="I couldn't determine the due date. Please specify a date.",
                 data=None
             )
         
-        if date_entities:
-            due_date = date_entities[0].value
-        else:
-            relative_date = relative_date_entities[0].value
-            due_date = self._parse_relative_date(relative_date)
-        
-        try:
-            success = self.task_manager.update_task(task_id, {"due_date": due_date})
-            
-            if not success:
-                return self._create_response(
-                    success=False,
-                    message=f"Task with ID {task_id} not found or due date couldn't be updated.",
-                    data=None
-                )
-            
-            return self._create_response(
-                success=True,
-                message=f"Due date for task {task_id} set to {due_date}.",
-                data={"task_id": task_id, "due_date": due_date}
-            )
-        except Exception as e:
-            return self._create_response(
-                success=False,
-                message=f"Failed to set due date: {str(e)}",
-                data=None
-            )
+        return self._apply_update(
+            task_id, {"due_date": due_date},
+            failure_reason="due date couldn't be updated",
+            message=f"Due date for task {task_id} set to {due_date}.",
+            data={"task_id": task_id, "due_date": due_date}
+        )
     
+    @_safe_response("Failed to add dependency")
     def _execute_add_dependency(self, nlp_result: NLPResult) -> Dict[str, Any]:
         """
         Execute add dependency command.
@@ -569,8 +590,10 @@ class TaskCommandExecutor(CommandExecutor):
         Returns:
             Command execution result
         """
+        by_type = nlp_result.entities_by_type()
+        
         # Extract task IDs
-        task_id_entities = nlp_result.get_entities_by_type("task_id")
+        task_id_entities = by_type.get("task_id", ())
         
         if len(task_id_entities) < 2:
             return self._create_response(
@@ -582,28 +605,22 @@ class TaskCommandExecutor(CommandExecutor):
         task_id = task_id_entities[0].value
         depends_on_id = task_id_entities[1].value
         
-        try:
-            success = self.task_manager.add_dependency(task_id, depends_on_id)
-            
-            if not success:
-                return self._create_response(
-                    success=False,
-                    message=f"Couldn't add dependency. Check that both tasks exist and there are no circular dependencies.",
-                    data=None
-                )
-            
-            return self._create_response(
-                success=True,
-                message=f"Dependency added: Task {task_id} now depends on task {depends_on_id}.",
-                data={"task_id": task_id, "depends_on": depends_on_id}
-            )
-        except Exception as e:
+        success = self.task_manager.add_dependency(task_id, depends_on_id)
+        
+        if not success:
             return self._create_response(
                 success=False,
-                message=f"Failed to add dependency: {str(e)}",
+                message=f"Couldn't add dependency. Check that both tasks exist and there are no circular dependencies.",
                 data=None
             )
+        
+        return self._create_response(
+            success=True,
+            message=f"Dependency added: Task {task_id} now depends on task {depends_on_id}.",
+            data={"task_id": task_id, "depends_on": depends_on_id}
+        )
     
+    @_safe_response("Failed to remove dependency")
     def _execute_remove_dependency(self, nlp_result: NLPResult) -> Dict[str, Any]:
         """
         Execute remove dependency command.
@@ -614,8 +631,10 @@ class TaskCommandExecutor(CommandExecutor):
         Returns:
             Command execution result
         """
+        by_type = nlp_result.entities_by_type()
+        
         # Extract task IDs
-        task_id_entities = nlp_result.get_entities_by_type("task_id")
+        task_id_entities = by_type.get("task_id", ())
         
         if len(task_id_entities) < 2:
             return self._create_response(
@@ -627,28 +646,22 @@ class TaskCommandExecutor(CommandExecutor):
         task_id = task_id_entities[0].value
         depends_on_id = task_id_entities[1].value
         
-        try:
-            success = self.task_manager.remove_dependency(task_id, depends_on_id)
-            
-            if not success:
-                return self._create_response(
-                    success=False,
-                    message=f"Couldn't remove dependency. Check that both tasks exist and the dependency exists.",
-                    data=None
-                )
-            
-            return self._create_response(
-                success=True,
-                message=f"Dependency removed: Task {task_id} no longer depends on task {depends_on_id}.",
-                data={"task_id": task_id, "depends_on": depends_on_id}
-            )
-        except Exception as e:
+        success = self.task_manager.remove_dependency(task_id, depends_on_id)
+        
+        if not success:
             return self._create_response(
                 success=False,
-                message=f"Failed to remove dependency: {str(e)}",
+                message=f"Couldn't remove dependency. Check that both tasks exist and the dependency exists.",
                 data=None
             )
+        
+        return self._create_response(
+            success=True,
+            message=f"Dependency removed: Task {task_id} no longer depends on task {depends_on_id}.",
+            data={"task_id": task_id, "depends_on": depends_on_id}
+        )
     
+    @_safe_response("Failed to get recommendations")
     def _execute_get_recommendations(self, nlp_result: NLPResult) -> Dict[str, Any]:
         """
         Execute get recommendations command.
@@ -666,58 +679,38 @@ class TaskCommandExecutor(CommandExecutor):
                 data=None
             )
         
-        # Extract user ID if present
-        user_id = None
         raw_text = nlp_result.raw_text.lower()
         
-        if "for user" in raw_text:
-            # Try to extract user ID after "for user"
-            user_index = raw_text.find("for user")
-            if user_index >= 0:
-                user_part = raw_text[user_index + 9:].strip()
-                user_id = user_part.split()[0]
-        
-        # Extract limit if present
-        limit = 5  # Default
-        if "top" in raw_text:
-            # Try to extract limit after "top"
-            top_index = raw_text.find("top")
-            if top_index >= 0:
-                top_part = raw_text[top_index + 3:].strip()
-                try:
-                    limit = int(top_part.split()[0])
-                except (ValueError, IndexError):
-                    pass
-        
-        try:
-            # Get all tasks
-            tasks = self.task_manager.list_tasks({})
-            
-            # Get recommendations
-            recommendations = self.recommendation_system.recommend_tasks(
-                tasks=tasks,
-                user_id=user_id,
-                limit=limit
-            )
-            
-            if not recommendations:
-                return self._create_response(
-                    success=True,
-                    message="No task recommendations available at this time.",
-                    data={"recommendations": []}
-                )
-            
+        # Extract user ID if present ("for user <id>")
+        user_match = _REC_USER_RE.search(raw_text)
+        user_id = user_match.group(1) if user_match else None
+        
+        # Extract limit if present ("top <n>")
+        limit_match = _REC_LIMIT_RE.search(raw_text)
+        limit = int(limit_match.group(1)) if limit_match else 5
+        
+        # Get all tasks
+        tasks = self.task_manager.list_tasks({})
+        
+        # Get recommendations
+        recommendations = self.recommendation_system.recommend_tasks(
+            tasks=tasks,
+            user_id=user_id,
+            limit=limit
+        )
+        
+        if not recommendations:
             return self._create_response(
                 success=True,
-                message=f"Here are {len(recommendations)} recommended tasks.",
-                data={"recommendations": recommendations}
-            )
-        except Exception as e:
-            return self._create_response(
-                success=False,
-                message=f"Failed to get recommendations: {str(e)}",
-                data=None
+                message="No task recommendations available at this time.",
+                data={"recommendations": []}
             )
+        
+        return self._create_response(
+            success=True,
+            message=f"Here are {len(recommendations)} recommended tasks.",
+            data={"recommendations": recommendations}
+        )
     
     def _execute_help(self, nlp_result: NLPResult) -> Dict[str, Any]:
         """
@@ -729,36 +722,20 @@ class TaskCommandExecutor(CommandExecutor):
         Returns:
             Command execution result
         """
-        help_text = """
-I can help you manage your tasks using natural language. Here are some examples of what you can say:
-
-- "Create a new task called Fix login bug"
-- "List all tasks"
-- "List high priority tasks"
-- "Show task #123"
-- "Update task #123 with title 'Updated title'"
-- "Set priority of task #123 to high"
-- "Set due date of task #123 to next Friday"
-- "Mark task #123 as complete"
-- "Delete task #123"
-- "Add dependency: task #123 depends on task #456"
-- "Remove dependency between task #123 and task #456"
-- "Recommend tasks for me"
-- "What should I work on next?"
-
-You can also ask for help on specific commands, like "How do I create a task?"
-"""
-        
         return self._create_response(
             success=True,
-            message=help_text.strip(),
+            message=_HELP_TEXT,
             data=None
         )
     
-    def _create_response(self, success: bool, message: str, data: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+    @staticmethod
+    def _create_response(success: bool, message: str, data: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         """
         Create a standardized response format.
         
+        A fresh dict literal is built on every call: callers own and may
+        modify the result, and merging a shared template is slower.
+        
         Args:
             success: Whether the command was successful
             message: Response message
@@ -774,6 +751,54 @@ You can also ask for help on specific commands, like "How do I create a task?"
             "response": message  # For conversation context
         }
     
+    def _apply_update(self,
+                      task_id: str,
+                      update_data: Dict[str, Any],
+                      failure_reason: str,
+                      message: str,
+                      data: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Send a task update to the task manager and build the response.
+        
+        Args:
+            task_id: ID of the task to update
+            update_data: Fields to update
+            failure_reason: What went wrong if the update is rejected (e.g., "couldn't be updated")
+            message: Response message on success
+            data: Response data on success
+            
+        Returns:
+            Command execution result
+        """
+        if not self.task_manager.update_task(task_id, update_data):
+            return self._create_response(
+                success=False,
+                message=f"Task with ID {task_id} not found or {failure_reason}.",
+                data=None
+            )
+        
+        return self._create_response(success=True, message=message, data=data)
+    
+    def _extract_due_date(self, by_type: Dict[str, List[Entity]]) -> Optional[str]:
+        """
+        Get the due date from an explicit date entity, or else from a relative date entity.
+        
+        Args:
+            by_type: Entities grouped by type (see NLPResult.entities_by_type)
+            
+        Returns:
+            Date string, or None if there is no date entity
+        """
+        date_entities = by_type.get("date")
+        if date_entities:
+            return date_entities[0].value
+        
+        relative_date_entities = by_type.get("relative_date")
+        if relative_date_entities:
+            return self._parse_relative_date(relative_date_entities[0].value)
+        
+        return None
+    
     def _parse_relative_date(self, relative_date: str) -> str:
         """
         Parse a relative date into an actual date string.
@@ -784,48 +809,21 @@ You can also ask for help on specific commands, like "How do I create a task?"
         Returns:
             Date string in ISO format
         """
-        today = datetime.now().date()
-        
-        if relative_date.lower() == "today":
-            return today.isoformat()
-        elif relative_date.lower() == "tomorrow":
-            return (today + timedelta(days=1)).isoformat()
-        elif relative_date.lower() == "yesterday":
-            return (today - timedelta(days=1)).isoformat()
-        elif relative_date.lower().startswith("next"):
-            parts = relative_date.lower().split()
-            if len(parts) >= 2:
-                unit = parts[1]
-                if unit == "week":
-                    return (today + timedelta(weeks=1)).isoformat()
-                elif unit == "month":
-                    # Simple approximation for next month
-                    if today.month == 12:
-                        return datetime(today.year + 1, 1, today.day).date().isoformat()
-                    else:
-                        return datetime(today.year, today.month + 1, today.day).date().isoformat()
-                elif unit == "year":
-                    return datetime(today.year + 1, today.month, today.day).date().isoformat()
-        elif relative_date.lower().startswith("in"):
-            parts = relative_date.lower().split()
-            if len(parts) >= 3:
-                try:
-                    amount = int(parts[1])
-                    unit = parts[2]
-                    if unit in ["day", "days"]:
-                        return (today + timedelta(days=amount)).isoformat()
-                    elif unit in ["week", "weeks"]:
-                        return (today + timedelta(weeks=amount)).isoformat()
-                    elif unit in ["month", "months"]:
-                        # Simple approximation for months
-                        month = today.month + amount
-                        year = today.year
-                        while month > 12:
-                            month -= 12
-                            year += 1
-                        return datetime(year, month, today.day).date().isoformat()
-                except (ValueError, IndexError):
-                    pass
-        
-        # Default to today if we can't parse
-        return today.isoformat()
+        return _resolve_relative_date(relative_date.strip().lower(), date.today())
+    
+    # Intent name -> handler method name, resolved on the instance so
+    # subclass overrides are honoured
+    _DISPATCH: Dict[str, str] = {
+        "create_task": "_execute_create_task",
+        "list_tasks": "_execute_list_tasks",
+        "update_task": "_execute_update_task",
+        "delete_task": "_execute_delete_task",
+        "complete_task": "_execute_complete_task",
+        "get_task": "_execute_get_task",
+        "set_priority": "_execute_set_priority",
+        "set_due_date": "_execute_set_due_date",
+        "add_dependency": "_execute_add_dependency",
+        "remove_dependency": "_execute_remove_dependency",
+        "get_recommendations": "_execute_get_recommendations",
+        "help": "_execute_help",
+    }
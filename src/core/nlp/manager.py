@@ -14,7 +14,7 @@ from .parser import DefaultNLParser
 from .executor import TaskCommandExecutor
 
 
-class TascadeNLPManager:
+class TascadeNLPManager(NLPManager):
     """
     Main manager class for the Tascade AI Natural Language Processing system.
     
@@ -26,7 +26,8 @@ class TascadeNLPManager:
                  task_manager, 
                  recommendation_system=None,
                  parser: Optional[NLParser] = None,
-                 command_executor: Optional[CommandExecutor] = None):
+                 command_executor: Optional[CommandExecutor] = None,
+                 max_sessions: int = 1024):
         """
         Initialize the Tascade NLP Manager.
         
@@ -35,17 +36,44 @@ class TascadeNLPManager:
             recommendation_system: Optional recommendation system
             parser: Optional custom parser (default: DefaultNLParser)
             command_executor: Optional custom command executor (default: TaskCommandExecutor)
+            max_sessions: Maximum number of conversation contexts to keep; the
+                least recently used session is evicted beyond this
         """
         self.task_manager = task_manager
         self.recommendation_system = recommendation_system
-        self.parser = parser or DefaultNLParser()
-        self.command_executor = command_executor or TaskCommandExecutor(
-            task_manager=task_manager,
-            recommendation_system=recommendation_system
-        )
-        self.conversation_contexts: Dict[str, ConversationContext] = {}
+        # The default parser and executor compile their patterns when built, so
+        # they are created on first use (see the parser/command_executor
+        # properties); managers that only touch session history never pay for it
+        super().__init__(parser, command_executor, max_sessions)
         self.logger = logging.getLogger(__name__)
     
+    @property
+    def parser(self) -> NLParser:
+        """Get the parser, creating the default DefaultNLParser on first access."""
+        if self._parser is None:
+            self._parser = DefaultNLParser()
+        return self._parser
+    
+    @parser.setter
+    def parser(self, parser: NLParser) -> None:
+        """Replace the parser."""
+        self._parser = parser
+    
+    @property
+    def command_executor(self) -> CommandExecutor:
+        """Get the command executor, creating the default TaskCommandExecutor on first access."""
+        if self._command_executor is None:
+            self._command_executor = TaskCommandExecutor(
+                task_manager=self.task_manager,
+                recommendation_system=self.recommendation_system
+            )
+        return self._command_executor
+    
+    @command_executor.setter
+    def command_executor(self, command_executor: CommandExecutor) -> None:
+        """Replace the command executor."""
+        self._command_executor = command_executor
+    
     def process_input(self, 
                      text: str, 
                      session_id: Optional[str] = None) -> Dict[str, Any]:
@@ -86,21 +114,6 @@ class TascadeNLPManager:
                 "response": f"An error occurred while processing your request: {str(e)}"
             }
     
-    def _get_conversation_context(self, session_id: str) -> ConversationContext:
-        """
-        Get or create a conversation context for the given session ID.
-        
-        Args:
-            session_id: Session identifier
-            
-        Returns:
-            Conversation context
-        """
-        if session_id not in self.conversation_contexts:
-            self.conversation_contexts[session_id] = ConversationContext(session_id)
-        
-        return self.conversation_contexts[session_id]
-    
     def get_session_history(self, session_id: str) -> List[Dict[str, Any]]:
         """
         Get conversation history for a session.
@@ -125,6 +138,6 @@ class TascadeNLPManager:
             True if successful, False otherwise
         """
         if session_id in self.conversation_contexts:
-            self.conversation_contexts[session_id].history = []
+            self.conversation_contexts[session_id].clear_history()
             return True
         return False
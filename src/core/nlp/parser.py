@@ -5,13 +5,104 @@ This module implements the core parser that processes natural language input
 and extracts intents and entities for task management operations.
 """
 
+import os
 import re
 import logging
+from functools import lru_cache
 from typing import Dict, List, Any, Optional, Tuple, Set, Union
 from datetime import datetime, timedelta
 
 from .base import NLParser, IntentRecognizer, EntityExtractor, NLPResult, Intent, Entity
 
+try:
+    # Optional: google-re2 gives linear-time matching for the intent and
+    # entity patterns when enabled with TASCADE_NLP_RE2 (see _compile)
+    import re2 as _re2
+except ImportError:
+    _re2 = None
+
+# Environment flag opting in to RE2. RE2's \w, \s and \d only match ASCII,
+# so non-English text can parse differently than with stdlib re; RE2 is
+# therefore never picked just because it is installed.
+_RE2_ENV_VAR = "TASCADE_NLP_RE2"
+_USE_RE2 = os.environ.get(_RE2_ENV_VAR, "").lower() in ("1", "true", "yes")
+if _USE_RE2 and _re2 is None:
+    logging.getLogger(__name__).warning(
+        f"{_RE2_ENV_VAR} is set but google-re2 is not installed; using stdlib re")
+    _USE_RE2 = False
+
+
+# Leading literal word(s) of a pattern: "word\s..." or "(?:w1|w2)\s...", or a bare word
+_LEADING_WORDS_RE = re.compile(r"\(\?:([a-z|]+)\)(?:\\s|$)|([a-z]+)(?:\\s|$)")
+
+# Priority word -> canonical priority level
+_PRIORITY_SYNONYMS = {
+    "high": "high",
+    "urgent": "high",
+    "important": "high",
+    "medium": "medium",
+    "normal": "medium",
+    "moderate": "medium",
+    "low": "low",
+    "minor": "low",
+}
+
+
+def _compile(pattern: str):
+    """
+    Compile a case-insensitive pattern, using RE2 when enabled.
+    
+    RE2 is used only if TASCADE_NLP_RE2 is set and google-re2 is installed;
+    patterns RE2 cannot handle (e.g. lookarounds) fall back to stdlib re.
+    
+    Args:
+        pattern: Regular expression source
+        
+    Returns:
+        Compiled pattern object supporting search/finditer
+    """
+    if _USE_RE2:
+        try:
+            return _re2.compile("(?i)" + pattern)
+        except _re2.error:
+            pass
+    return re.compile(pattern, re.IGNORECASE)
+
+
+# Shared fragments of the intent patterns. Verbs with the same continuation
+# are folded into one "(?:verb|verb)" group so each intent has few, short
+# alternatives (the prescreen still sees every verb as a trigger word).
+_OPT_A = r"(?:a\s+)?"
+_OPT_THE = r"(?:the\s+)?"
+_OPT_TASK = r"(?:task\s+)?"
+_AS_DONE = r"(?:as\s+)?(?:complete|completed|done)"
+_SET_VERB = r"(?:set|change|update)"
+
+# Fallback title for create_task: the text after "create task" / "add task"
+_CREATE_TITLE_PATTERNS = (
+    _compile(r"create\s+(?:a\s+)?(?:new\s+)?task\s+(?:called\s+)?[\"']?([^\"']+)[\"']?"),
+    _compile(r"add\s+(?:a\s+)?(?:new\s+)?task\s+(?:called\s+)?[\"']?([^\"']+)[\"']?"),
+)
+
+# The same title, read directly after an already-matched "create/add ... task"
+_CREATE_TITLE_TAIL_RE = _compile(r"\s+(?:called\s+)?[\"']?([^\"']+)[\"']?")
+
+
+def _leading_words(pattern: str) -> Optional[List[str]]:
+    """
+    Get the literal words a regex pattern must start with.
+    
+    Args:
+        pattern: Regex pattern source
+        
+    Returns:
+        Alternative leading words, or None if the pattern does not start with a literal word
+    """
+    match = _LEADING_WORDS_RE.match(pattern)
+    if not match:
+        return None
+    return (match.group(1) or match.group(2)).split("|")
+
 
 class RuleBasedIntentRecognizer(IntentRecognizer):
     """
@@ -25,65 +116,41 @@ class RuleBasedIntentRecognizer(IntentRecognizer):
         """Initialize the rule-based intent recognizer with predefined patterns."""
         self.intent_patterns = {
             "create_task": [
-                r"create\s+(?:a\s+)?(?:new\s+)?task",
-                r"add\s+(?:a\s+)?(?:new\s+)?task",
-                r"make\s+(?:a\s+)?(?:new\s+)?task",
-                r"start\s+(?:a\s+)?(?:new\s+)?task"
+                rf"(?:create|add|make|start)\s+{_OPT_A}(?:new\s+)?task"
             ],
             "list_tasks": [
-                r"list\s+(?:all\s+)?tasks",
-                r"show\s+(?:all\s+)?tasks",
-                r"display\s+(?:all\s+)?tasks",
+                r"(?:list|show|display)\s+(?:all\s+)?tasks",
                 r"what\s+(?:are\s+)?(?:my\s+)?tasks"
             ],
             "update_task": [
-                r"update\s+(?:the\s+)?task",
-                r"modify\s+(?:the\s+)?task",
-                r"change\s+(?:the\s+)?task",
-                r"edit\s+(?:the\s+)?task"
+                rf"(?:update|modify|change|edit)\s+{_OPT_THE}task"
             ],
             "delete_task": [
-                r"delete\s+(?:the\s+)?task",
-                r"remove\s+(?:the\s+)?task",
-                r"cancel\s+(?:the\s+)?task"
+                rf"(?:delete|remove|cancel)\s+{_OPT_THE}task"
             ],
             "complete_task": [
-                r"complete\s+(?:the\s+)?task",
-                r"finish\s+(?:the\s+)?task",
-                r"mark\s+(?:the\s+)?task\s+(?:as\s+)?(?:complete|completed|done)",
-                r"set\s+(?:the\s+)?task\s+(?:as\s+)?(?:complete|completed|done)"
+                rf"(?:complete|finish)\s+{_OPT_THE}task",
+                rf"(?:mark|set)\s+{_OPT_THE}task\s+{_AS_DONE}"
             ],
             "get_task": [
-                r"get\s+(?:the\s+)?task",
-                r"show\s+(?:the\s+)?task",
-                r"display\s+(?:the\s+)?task",
-                r"find\s+(?:the\s+)?task"
+                rf"(?:get|show|display|find)\s+{_OPT_THE}task"
             ],
             "set_priority": [
-                r"set\s+(?:the\s+)?(?:task\s+)?priority",
-                r"change\s+(?:the\s+)?(?:task\s+)?priority",
-                r"update\s+(?:the\s+)?(?:task\s+)?priority"
+                rf"{_SET_VERB}\s+{_OPT_THE}{_OPT_TASK}priority"
             ],
             "set_due_date": [
-                r"set\s+(?:the\s+)?(?:task\s+)?due\s+date",
-                r"change\s+(?:the\s+)?(?:task\s+)?due\s+date",
-                r"update\s+(?:the\s+)?(?:task\s+)?due\s+date"
+                rf"{_SET_VERB}\s+{_OPT_THE}{_OPT_TASK}due\s+date"
             ],
             "add_dependency": [
-                r"add\s+(?:a\s+)?dependency",
-                r"create\s+(?:a\s+)?dependency",
-                r"set\s+(?:a\s+)?dependency"
+                rf"(?:add|create|set)\s+{_OPT_A}dependency"
             ],
             "remove_dependency": [
-                r"remove\s+(?:a\s+)?dependency",
-                r"delete\s+(?:a\s+)?dependency",
-                r"cancel\s+(?:a\s+)?dependency"
+                rf"(?:remove|delete|cancel)\s+{_OPT_A}dependency"
             ],
             "get_recommendations": [
                 r"(?:get|show|display)\s+(?:task\s+)?recommendations",
-                r"recommend\s+(?:a\s+)?task",
-                r"what\s+should\s+I\s+work\s+on",
-                r"suggest\s+(?:a\s+)?task"
+                rf"(?:recommend|suggest)\s+{_OPT_A}task",
+                r"what\s+should\s+I\s+work\s+on"
             ],
             "help": [
                 r"help",
@@ -93,12 +160,33 @@ class RuleBasedIntentRecognizer(IntentRecognizer):
             ]
         }
         
-        # Compile patterns for faster matching
-        self.compiled_patterns = {}
+        # Compile each intent's patterns into one alternation, so an intent
+        # costs a single search. Intents are kept as separate regexes because
+        # their patterns overlap (e.g. "update task" and "update task
+        # priority"), and one global alternation would report only one of them.
+        self.compiled_patterns = {
+            intent: _compile("|".join(f"(?:{pattern})" for pattern in patterns))
+            for intent, patterns in self.intent_patterns.items()
+        }
+        
+        # Prescreen: map each pattern's leading word to its intents and find
+        # all of those words in one scan, so only intents whose trigger word
+        # occurs in the text get their regex run. The lookahead lets
+        # overlapping triggers ("show" / "how") both be found.
+        self._intents_by_trigger: Dict[str, Set[str]] = {}
+        self._unscreened_intents: Set[str] = set()
         for intent, patterns in self.intent_patterns.items():
-            self.compiled_patterns[intent] = [
-                re.compile(pattern, re.IGNORECASE) for pattern in patterns
-            ]
+            for pattern in patterns:
+                words = _leading_words(pattern)
+                if words is None:
+                    self._unscreened_intents.add(intent)
+                    continue
+                for word in words:
+                    self._intents_by_trigger.setdefault(word, set()).add(intent)
+        
+        self._trigger_pattern = re.compile(
+            "(?=(" + "|".join(map(re.escape, self._intents_by_trigger)) + "))", re.IGNORECASE
+        )
     
     def recognize_intents(self, text: str) -> List[Intent]:
         """
@@ -113,23 +201,35 @@ class RuleBasedIntentRecognizer(IntentRecognizer):
         intents = []
         text_lower = text.lower()
         
-        # Check each intent pattern
-        for intent_name, patterns in self.compiled_patterns.items():
-            for pattern in patterns:
-                match = pattern.search(text_lower)
-                if match:
-                    # Calculate confidence based on match length and position
-                    match_length = match.end() - match.start()
-                    text_length = len(text_lower)
-                    position_factor = 1.0 - (match.start() / text_length) * 0.5
-                    coverage_factor = match_length / text_length
-                    
-                    # Combine factors for final confidence score
-                    confidence = 0.7 + (position_factor * 0.2) + (coverage_factor * 0.1)
-                    confidence = min(confidence, 0.95)  # Cap at 0.95
-                    
-                    intents.append(Intent(intent_name, confidence))
-                    break  # Only add each intent once
+        # Only intents whose trigger word appears in the text can match
+        candidates = set(self._unscreened_intents)
+        intents_by_trigger = self._intents_by_trigger
+        for word in self._trigger_pattern.findall(text_lower):
+            candidates |= intents_by_trigger[word]
+        
+        # Per-text constants for the confidence formula; any match implies a
+        # non-empty text
+        inv_text_length = 1.0 / len(text_lower) if text_lower else 0.0
+        
+        # Check each candidate intent, using its earliest matching pattern
+        for intent_name, pattern in self.compiled_patterns.items():
+            if intent_name not in candidates:
+                continue
+            match = pattern.search(text_lower)
+            if match:
+                # Calculate confidence based on match length and position
+                start, end = match.span()
+                position_factor = 1.0 - start * inv_text_length * 0.5
+                coverage_factor = (end - start) * inv_text_length
+                
+                # Combine factors for final confidence score
+                confidence = 0.7 + (position_factor * 0.2) + (coverage_factor * 0.1)
+                confidence = min(confidence, 0.95)  # Cap at 0.95
+                
+                # Keep the matched span so extractors can read the text after it
+                intent = Intent(intent_name, confidence)
+                intent._match_span = (start, end)
+                intents.append(intent)
         
         # Add fallback intent if no intents were recognized
         if not intents:
@@ -191,12 +291,12 @@ class PatternEntityExtractor(EntityExtractor):
         
         # Compile all patterns
         self.compiled_patterns = {
-            "task_id": [re.compile(p, re.IGNORECASE) for p in self.task_id_patterns],
-            "priority": [re.compile(p, re.IGNORECASE) for p in self.priority_patterns],
-            "date": [re.compile(p, re.IGNORECASE) for p in self.date_patterns],
-            "relative_date": [re.compile(p, re.IGNORECASE) for p in self.relative_date_patterns],
-            "title": [re.compile(p, re.IGNORECASE) for p in self.title_patterns],
-            "description": [re.compile(p, re.IGNORECASE) for p in self.description_patterns]
+            "task_id": [_compile(p) for p in self.task_id_patterns],
+            "priority": [_compile(p) for p in self.priority_patterns],
+            "date": [_compile(p) for p in self.date_patterns],
+            "relative_date": [_compile(p) for p in self.relative_date_patterns],
+            "title": [_compile(p) for p in self.title_patterns],
+            "description": [_compile(p) for p in self.description_patterns]
         }
     
     def extract_entities(self, text: str, intents: List[Intent]) -> List[Entity]:
@@ -212,86 +312,87 @@ class PatternEntityExtractor(EntityExtractor):
         """
         entities = []
         
-        # Extract task IDs
-        for pattern in self.compiled_patterns["task_id"]:
-            for match in pattern.finditer(text):
-                task_id = match.group(1)
-                start_pos = match.start(1)
-                end_pos = match.end(1)
-                entities.append(Entity("task_id", task_id, start_pos, end_pos))
-        
-        # Extract priorities
-        for pattern in self.compiled_patterns["priority"]:
-            for match in pattern.finditer(text):
-                priority = match.group(1).lower()
-                start_pos = match.start(1)
-                end_pos = match.end(1)
-                
-                # Normalize priority values
-                if priority in ["high", "urgent", "important"]:
-                    normalized_priority = "high"
-                elif priority in ["medium", "normal", "moderate"]:
-                    normalized_priority = "medium"
-                elif priority in ["low", "minor"]:
-                    normalized_priority = "low"
-                else:
-                    normalized_priority = priority
-                
-                entities.append(Entity("priority", normalized_priority, start_pos, end_pos))
-        
-        # Extract dates
-        for pattern in self.compiled_patterns["date"]:
-            for match in pattern.finditer(text):
-                date_str = match.group(1)
-                start_pos = match.start(1)
-                end_pos = match.end(1)
-                entities.append(Entity("date", date_str, start_pos, end_pos))
-        
-        # Extract relative dates
-        for pattern in self.compiled_patterns["relative_date"]:
-            for match in pattern.finditer(text):
-                relative_date = match.group(1)
-                start_pos = match.start(1)
-                end_pos = match.end(1)
-                entities.append(Entity("relative_date", relative_date, start_pos, end_pos))
-        
-        # Extract titles
-        for pattern in self.compiled_patterns["title"]:
-            for match in pattern.finditer(text):
-                title = match.group(1)
-                start_pos = match.start(1)
-                end_pos = match.end(1)
-                entities.append(Entity("title", title, start_pos, end_pos))
-        
-        # Extract descriptions
-        for pattern in self.compiled_patterns["description"]:
-            for match in pattern.finditer(text):
-                description = match.group(1)
-                start_pos = match.start(1)
-                end_pos = match.end(1)
-                entities.append(Entity("description", description, start_pos, end_pos))
+        # Extract every entity type in one table-driven pass. Patterns are run
+        # separately (not fused into one regex) because their matches overlap,
+        # e.g. "task called 'X'" yields both a task_id and a title.
+        for entity_type, patterns in self.compiled_patterns.items():
+            is_priority = entity_type == "priority"
+            for pattern in patterns:
+                for match in pattern.finditer(text):
+                    value = match.group(1)
+                    if is_priority:
+                        # Normalize priority values; unknown words are kept as-is
+                        value = value.lower()
+                        value = _PRIORITY_SYNONYMS.get(value, value)
+                    entities.append(Entity(entity_type, value, match.start(1), match.end(1)))
         
         # Extract title from create_task intent if not already extracted
         if not any(e.entity_type == "title" for e in entities):
-            primary_intent = sorted(intents, key=lambda x: x.confidence, reverse=True)[0]
-            if primary_intent.name == "create_task":
+            # Intents arrive sorted by descending confidence (see IntentRecognizer)
+            primary_intent = intents[0] if intents else None
+            if primary_intent and primary_intent.name == "create_task":
                 # Try to extract title from the text after "create task" or similar
-                create_patterns = [
-                    re.compile(r"create\s+(?:a\s+)?(?:new\s+)?task\s+(?:called\s+)?[\"']?([^\"']+)[\"']?", re.IGNORECASE),
-                    re.compile(r"add\s+(?:a\s+)?(?:new\s+)?task\s+(?:called\s+)?[\"']?([^\"']+)[\"']?", re.IGNORECASE)
-                ]
-                
-                for pattern in create_patterns:
-                    match = pattern.search(text)
-                    if match:
-                        title = match.group(1).strip()
-                        if title:
-                            start_pos = match.start(1)
-                            end_pos = match.end(1)
-                            entities.append(Entity("title", title, start_pos, end_pos))
-                            break
+                match = self._find_create_title(text, primary_intent)
+                if match:
+                    title = match.group(1).strip()
+                    entities.append(Entity("title", title, match.start(1), match.end(1)))
         
         return entities
+    
+    @staticmethod
+    def _find_create_title(text: str, intent: Intent):
+        """
+        Find the title following "create task" / "add task" in the text.
+        
+        When the intent carries the span of its "create/add ... task" match,
+        only the text after it is examined; otherwise (or if nothing usable
+        follows it) the whole text is searched.
+        
+        Args:
+            text: Natural language text to analyze
+            intent: The create_task intent
+            
+        Returns:
+            Match whose group 1 is a non-blank title, or None
+        """
+        span = intent._match_span
+        if (span is not None
+                and text[span[0]:span[0] + 6].lower().startswith(("create", "add"))
+                and text[span[1] - 4:span[1]].lower() == "task"):
+            match = _CREATE_TITLE_TAIL_RE.match(text, span[1])
+            if match and match.group(1).strip():
+                return match
+        
+        for pattern in _CREATE_TITLE_PATTERNS:
+            match = pattern.search(text)
+            if match and match.group(1).strip():
+                return match
+        return None
+
+
+@lru_cache(maxsize=None)
+def _default_intent_recognizer() -> RuleBasedIntentRecognizer:
+    """
+    Get the shared RuleBasedIntentRecognizer used by default parsers.
+    
+    Its patterns are compiled once per process, so later parsers (e.g. one
+    per NLP manager) start without recompiling them.
+    
+    Returns:
+        Shared intent recognizer
+    """
+    return RuleBasedIntentRecognizer()
+
+
+@lru_cache(maxsize=None)
+def _default_entity_extractor() -> PatternEntityExtractor:
+    """
+    Get the shared PatternEntityExtractor used by default parsers.
+    
+    Returns:
+        Shared entity extractor
+    """
+    return PatternEntityExtractor()
 
 
 class DefaultNLParser(NLParser):
@@ -304,32 +405,62 @@ class DefaultNLParser(NLParser):
     
     def __init__(self, 
                  intent_recognizer: Optional[IntentRecognizer] = None,
-                 entity_extractor: Optional[EntityExtractor] = None):
+                 entity_extractor: Optional[EntityExtractor] = None,
+                 cache_size: int = 1024):
         """
         Initialize the default NL parser.
         
         Args:
-            intent_recognizer: Intent recognizer to use (default: RuleBasedIntentRecognizer)
-            entity_extractor: Entity extractor to use (default: PatternEntityExtractor)
+            intent_recognizer: Intent recognizer to use (default: a RuleBasedIntentRecognizer
+                shared by all default parsers)
+            entity_extractor: Entity extractor to use (default: a PatternEntityExtractor
+                shared by all default parsers)
+            cache_size: Number of distinct input texts whose analysis is cached
+                (0 disables caching)
         """
-        self.intent_recognizer = intent_recognizer or RuleBasedIntentRecognizer()
-        self.entity_extractor = entity_extractor or PatternEntityExtractor()
+        self.intent_recognizer = intent_recognizer or _default_intent_recognizer()
+        self.entity_extractor = entity_extractor or _default_entity_extractor()
+        
+        # Recognition and extraction are pure functions of the text, so repeated
+        # utterances ("help", "list tasks") reuse the earlier intents and entities
+        self._analyze = lru_cache(maxsize=cache_size)(self._analyze_uncached)
     
     def parse(self, text: str) -> NLPResult:
         """
         Parse natural language text into intents and entities.
         
+        Results for a text seen before share their Intent and Entity objects
+        with the earlier result, so callers should not modify them.
+        
         Args:
             text: Natural language text to parse
             
         Returns:
             NLPResult containing recognized intents and entities
         """
+        intents, entities = self._analyze(text)
+        
+        # Create and return NLP result
+        return NLPResult(text, list(intents), list(entities))
+    
+    def clear_cache(self) -> None:
+        """Forget cached analyses, e.g. after changing the recognizer's patterns."""
+        self._analyze.cache_clear()
+    
+    def _analyze_uncached(self, text: str) -> Tuple[Tuple[Intent, ...], Tuple[Entity, ...]]:
+        """
+        Run intent recognition and entity extraction on a text.
+        
+        Args:
+            text: Natural language text to analyze
+            
+        Returns:
+            Tuple of (intents, entities)
+        """
         # Recognize intents
         intents = self.intent_recognizer.recognize_intents(text)
         
         # Extract entities
         entities = self.entity_extractor.extract_entities(text, intents)
         
-        # Create and return NLP result
-        return NLPResult(text, intents, entities)
+        return tuple(intents), tuple(entities)
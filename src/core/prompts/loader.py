@@ -5,16 +5,26 @@ This module provides functions for loading and rendering prompt templates.
 
 import os
 import string
+from functools import lru_cache
 from typing import Dict, Any, Optional
-import pkg_resources
+
+try:
+    from importlib.resources import files as resource_files
+except ImportError:
+    # importlib.resources.files is only available on Python 3.9+
+    resource_files = None
 
 # Base directory for templates
 TEMPLATES_DIR = os.path.join(os.path.dirname(__file__), 'templates')
 
+@lru_cache(maxsize=None)
 def load_template(template_name: str) -> str:
     """
     Load a prompt template from the templates directory.
     
+    Templates do not change while the process runs, so each one is read
+    from disk once; call load_template.cache_clear() to pick up edits.
+    
     Args:
         template_name: Name of the template file (without extension)
         
@@ -30,12 +40,14 @@ def load_template(template_name: str) -> str:
         with open(template_path, 'r', encoding='utf-8') as f:
             return f.read()
     except FileNotFoundError:
-        # Try to load from package resources as fallback
-        try:
-            template_resource = f"templates/{template_name}.md"
-            return pkg_resources.resource_string(__name__, template_resource).decode('utf-8')
-        except (pkg_resources.DistributionNotFound, FileNotFoundError):
-            raise FileNotFoundError(f"Template '{template_name}' not found")
+        # Try to load from package resources as fallback (e.g. zipped installs)
+        if resource_files is not None:
+            try:
+                resource = resource_files(__package__) / "templates" / f"{template_name}.md"
+                return resource.read_text(encoding="utf-8")
+            except (FileNotFoundError, ModuleNotFoundError):
+                pass
+        raise FileNotFoundError(f"Template '{template_name}' not found")
 
 def render_template(template: str, variables: Dict[str, Any]) -> str:
     """
@@ -49,8 +61,20 @@ def render_template(template: str, variables: Dict[str, Any]) -> str:
         The rendered template
     """
     # Use string.Template for simple variable substitution
-    template_obj = string.Template(template)
-    return template_obj.safe_substitute(variables)
+    return _compile_template(template).safe_substitute(variables)
+
+@lru_cache(maxsize=256)
+def _compile_template(template: str) -> string.Template:
+    """
+    Get a string.Template for the given template text, reusing earlier ones.
+    
+    Args:
+        template: The template string
+        
+    Returns:
+        Template object for the text
+    """
+    return string.Template(template)
 
 def load_prompt(prompt_name: str, variables: Optional[Dict[str, Any]] = None) -> str:
     """
@@ -7,13 +7,21 @@ and user preference management.
 """
 
 from abc import ABC, abstractmethod
-from typing import Dict, List, Any, Optional, Union, Callable
+from typing import Dict, List, Any, Optional, Tuple, Union, Callable, FrozenSet
 from datetime import datetime, timedelta
 import logging
 
 
 class RecommendationFactor(ABC):
-    """Base class for recommendation factors."""
+    """
+    Base class for recommendation factors.
+    
+    Factors list the scoring context keys they read in context_keys, so the
+    engine can skip fetching data no registered factor uses. The default of
+    None means the factor may read any key.
+    """
+    
+    context_keys: Optional[FrozenSet[str]] = None
     
     def __init__(self, weight: float = 1.0, name: str = None):
         """
@@ -44,6 +52,9 @@ class RecommendationFactor(ABC):
 class UserPreference:
     """User preference for task recommendations."""
     
+    __slots__ = ("user_id", "preference_type", "preference_value", "weight",
+                 "created_at", "updated_at", "metadata")
+    
     def __init__(self, 
                  user_id: str,
                  preference_type: str,
@@ -98,9 +109,32 @@ class UserPreference:
         )
 
 
+def preference_fields(preference: Union[UserPreference, Dict[str, Any]]) -> Tuple[Any, Any, float]:
+    """
+    Read the fields factors match on from a preference.
+    
+    Scoring contexts hold UserPreference objects, but callers may also pass
+    preferences in their to_dict() form.
+    
+    Args:
+        preference: UserPreference or its dictionary form
+        
+    Returns:
+        Tuple of (preference_type, preference_value, weight)
+    """
+    if isinstance(preference, UserPreference):
+        return preference.preference_type, preference.preference_value, preference.weight
+    return (preference.get("preference_type"), preference.get("preference_value"),
+            preference.get("weight", 1.0))
+
+
 class TaskScore:
     """Score for a task recommendation."""
     
+    # Scores are created per task on every scoring call, so instances carry no __dict__
+    __slots__ = ("task_id", "overall_score", "factor_scores", "_timestamp",
+                 "_timestamp_iso", "metadata")
+    
     def __init__(self, 
                  task_id: str,
                  overall_score: float,
@@ -123,13 +157,31 @@ class TaskScore:
         self.timestamp = timestamp or datetime.now()
         self.metadata = metadata or {}
     
+    @property
+    def timestamp(self) -> datetime:
+        """Get when the score was calculated."""
+        return self._timestamp
+    
+    @timestamp.setter
+    def timestamp(self, timestamp: datetime) -> None:
+        """Set the timestamp, dropping any cached ISO string."""
+        self._timestamp = timestamp
+        self._timestamp_iso = None
+    
+    @property
+    def timestamp_iso(self) -> str:
+        """Get the timestamp as an ISO 8601 string, formatted on first access."""
+        if self._timestamp_iso is None:
+            self._timestamp_iso = self._timestamp.isoformat()
+        return self._timestamp_iso
+    
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary."""
         return {
             "task_id": self.task_id,
             "overall_score": self.overall_score,
             "factor_scores": self.factor_scores,
-            "timestamp": self.timestamp.isoformat(),
+            "timestamp": self.timestamp_iso,
             "metadata": self.metadata
         }
     
@@ -158,6 +210,13 @@ class RecommendationEngine(ABC):
         """
         self.factors = factors or []
         self.logger = logger or logging.getLogger("tascade.recommendation")
+        
+        # Snapshot of the factors, their positions by name and their total
+        # weight, rebuilt after add_factor/remove_factor (the total weight
+        # alone after weight changes in subclasses)
+        self._factor_tuple: Optional[Tuple[RecommendationFactor, ...]] = None
+        self._factor_index: Dict[str, int] = {}
+        self._weight_sum: Optional[float] = None
     
     @abstractmethod
     def recommend_tasks(self, 
@@ -205,6 +264,7 @@ class RecommendationEngine(ABC):
             factor: Factor to add
         """
         self.factors.append(factor)
+        self._invalidate_factor_cache()
     
     def remove_factor(self, factor_name: str) -> bool:
         """
@@ -216,11 +276,60 @@ class RecommendationEngine(ABC):
         Returns:
             True if factor was removed, False otherwise
         """
-        for i, factor in enumerate(self.factors):
-            if factor.name == factor_name:
-                self.factors.pop(i)
-                return True
-        return False
+        index = self._factor_position(factor_name)
+        if index is None:
+            return False
+        
+        self.factors.pop(index)
+        self._invalidate_factor_cache()
+        return True
+    
+    def _cached_factors(self) -> Tuple[Tuple[RecommendationFactor, ...], float]:
+        """
+        Get the current factors and the sum of their weights.
+        
+        The result is cached until the factors change through add_factor,
+        remove_factor or a subclass's weight setter, so factors should not be
+        modified directly.
+        
+        Returns:
+            Tuple of (factors, total weight)
+        """
+        if self._factor_tuple is None:
+            self._factor_tuple = tuple(self.factors)
+            self._factor_index = {}
+            for index, factor in enumerate(self._factor_tuple):
+                # The first factor with a name wins, as in a linear search
+                self._factor_index.setdefault(factor.name, index)
+            self._weight_sum = None
+        if self._weight_sum is None:
+            self._weight_sum = sum(factor.weight for factor in self._factor_tuple)
+        return self._factor_tuple, self._weight_sum
+    
+    def _factor_position(self, factor_name: str) -> Optional[int]:
+        """
+        Get the position of a factor in self.factors.
+        
+        Args:
+            factor_name: Name of the factor
+            
+        Returns:
+            Index of the first factor with that name, or None if there is none
+        """
+        self._cached_factors()
+        return self._factor_index.get(factor_name)
+    
+    def _invalidate_factor_cache(self, weights_only: bool = False) -> None:
+        """
+        Drop the cached factor snapshot after factors or weights change.
+        
+        Args:
+            weights_only: Only a weight changed, so the factor list and name
+                index are still valid
+        """
+        if not weights_only:
+            self._factor_tuple = None
+        self._weight_sum = None
 
 
 class UserPreferenceManager(ABC):
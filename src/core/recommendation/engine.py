@@ -5,11 +5,14 @@ This module implements the core recommendation engine functionality,
 combining various factors to generate personalized task recommendations.
 """
 
-from typing import Dict, List, Any, Optional, Union, Callable
-from datetime import datetime, timedelta
+from typing import Dict, List, Any, Optional, Tuple, Set, Union, Callable
+from datetime import datetime
+from collections import OrderedDict
+import heapq
 import logging
-import statistics
-from collections import defaultdict
+import operator
+
+import numpy as np
 
 from .base import RecommendationEngine, RecommendationFactor, TaskScore
 from .factors import (
@@ -22,6 +25,152 @@ from .specialized_factors import (
 )
 
 
+# (task, context) -> (overall score, factor scores)
+_Scorer = Callable[[Dict[str, Any], Dict[str, Any]], Tuple[float, Dict[str, Any]]]
+
+# Sort key for scored task entries
+_SCORE_KEY = operator.itemgetter("score")
+
+# Context entry identifying the scoring pass a context belongs to, and the
+# number of task scores remembered across passes
+_SCORE_CACHE_TOKEN = "_score_cache_token"
+_SCORE_CACHE_SIZE = 256
+
+
+# Explanation line per built-in factor, filled with the strength word (and
+# the task priority for PriorityFactor)
+_FACTOR_TEMPLATES: Dict[str, str] = {
+    "PriorityFactor": "- It has a {strength} high priority ({priority})\n",
+    "DeadlineFactor": "- It has a {strength} urgent deadline\n",
+    "DependencyFactor": "- It has {strength} few or completed dependencies\n",
+    "UserPreferenceFactor": "- It {strength} matches your preferences\n",
+    "HistoricalSuccessFactor": "- You have {strength} succeeded with similar tasks in the past\n",
+    "CompletionTimeFactor": "- Its estimated completion time {strength} fits your preferences\n",
+    "WorkloadFactor": "- It {strength} helps balance your workload\n",
+    "ContextAwarenessFactor": "- It {strength} relates to your current working context\n",
+    "CollaborationFactor": "- It {strength} aligns with your collaboration preferences\n",
+    "LearningOpportunityFactor": "- It {strength} provides learning opportunities in your areas of interest\n",
+}
+
+# DeadlineFactor line for tasks without a due date
+_NO_DEADLINE_TEMPLATE = "- Deadline considerations were {strength} important\n"
+
+
+def _top_indices(scores: np.ndarray, k: int) -> np.ndarray:
+    """
+    Get the indices of the k highest scores, best first.
+    
+    Equal scores keep their input order, so the result matches a stable
+    descending sort cut to k entries, but only the selected entries are sorted.
+    
+    Args:
+        scores: One score per task
+        k: Number of indices to return (sliced like a list for k < 0)
+        
+    Returns:
+        Array of indices into scores
+    """
+    n = scores.shape[0]
+    if k < 0 or k >= n:
+        return np.argsort(-scores, kind="stable")[:k]
+    if k == 0:
+        return np.empty(0, dtype=np.intp)
+    
+    # k-th largest score; everything above it is in, ties fill the rest in order
+    kth = np.partition(scores, n - k)[n - k]
+    above = np.flatnonzero(scores > kth)
+    ties = np.flatnonzero(scores == kth)[:k - above.shape[0]]
+    selected = np.concatenate((above, ties))
+    return selected[np.argsort(-scores[selected], kind="stable")]
+
+
+def _defining_class(cls: type, attribute: str) -> Optional[type]:
+    """
+    Get the class in cls's MRO that defines an attribute.
+    
+    Args:
+        cls: Class to inspect
+        attribute: Attribute name
+        
+    Returns:
+        The defining class, or None if no class defines it
+    """
+    for klass in cls.__mro__:
+        if attribute in klass.__dict__:
+            return klass
+    return None
+
+
+class _SafeScore:
+    """
+    A factor's score function that logs failures and scores them 0.0.
+    
+    Error handling lives here once, so the scoring loops call each factor
+    without a try block of their own. Factors that provide a vectorized
+    score_batch(tasks, context) are scored through it in batch().
+    """
+    
+    __slots__ = ("_score", "_score_batch", "_name", "_logger")
+    
+    def __init__(self, factor: RecommendationFactor, logger: logging.Logger):
+        """
+        Wrap a factor's score method.
+        
+        Args:
+            factor: Factor to wrap
+            logger: Logger for scoring errors
+        """
+        self._score = factor.score
+        self._name = factor.name
+        self._logger = logger
+        
+        # score_batch is only used if it comes from the same class as score or
+        # a subclass of it; a subclass that overrides score alone must not be
+        # bypassed by an inherited score_batch
+        self._score_batch = None
+        batch_class = _defining_class(type(factor), "score_batch")
+        if batch_class is not None and issubclass(batch_class, _defining_class(type(factor), "score")):
+            self._score_batch = factor.score_batch
+    
+    def __call__(self, task: Dict[str, Any], context: Dict[str, Any]) -> float:
+        """
+        Score a task, returning 0.0 if the factor fails or returns a non-number.
+        
+        Args:
+            task: Task data
+            context: Scoring context
+            
+        Returns:
+            Factor score
+        """
+        try:
+            return float(self._score(task, context))
+        except Exception as e:
+            self._logger.error(f"Error calculating score for factor {self._name}: {e}")
+            return 0.0
+    
+    def batch(self, tasks: List[Dict[str, Any]], context: Dict[str, Any]) -> Union[np.ndarray, List[float]]:
+        """
+        Score several tasks, in one call if the factor supports it.
+        
+        If the factor's score_batch fails, the tasks are scored one at a time
+        so only the tasks that fail score 0.0.
+        
+        Args:
+            tasks: Task data
+            context: Scoring context
+            
+        Returns:
+            One factor score per task
+        """
+        if self._score_batch is not None:
+            try:
+                return np.asarray(self._score_batch(tasks, context), dtype=np.float64)
+            except Exception as e:
+                self._logger.error(f"Error calculating batch scores for factor {self._name}: {e}")
+        return [self(task, context) for task in tasks]
+
+
 class DefaultRecommendationEngine(RecommendationEngine):
     """Default implementation of the recommendation engine."""
     
@@ -43,6 +192,16 @@ class DefaultRecommendationEngine(RecommendationEngine):
             task_manager: Task Manager instance
             logger: Optional logger
         """
+        # Error-handling wrappers around the current factors' score methods
+        self._factor_callables: Optional[Tuple[_SafeScore, ...]] = None
+        # Factor columns by descending weight, the order pruned scoring uses
+        self._columns_by_weight: Optional[Tuple[int, ...]] = None
+        # score_task's scorer, specialized to the current factors and weights
+        self._scorer: Optional[_Scorer] = None
+        # Recent task scores by (task id, user id, context token), with the task
+        # each was computed for
+        self._score_cache: "OrderedDict[Tuple[str, str, object], Tuple[Dict[str, Any], TaskScore]]" = OrderedDict()
+        
         super().__init__(factors, logger)
         self.user_preference_manager = user_preference_manager
         self.historical_analyzer = historical_analyzer
@@ -98,72 +257,241 @@ class DefaultRecommendationEngine(RecommendationEngine):
         if not tasks:
             return []
         
-        # Initialize context if not provided
-        if context is None:
-            context = {}
+        # Each task's id is read once and reused for the index and the balancer
+        task_ids = [task.get("id", "") for task in tasks]
+        context = self._build_context(user_id, tasks, context, task_ids)
+        # A new pass over (possibly different) tasks: scores cached for this
+        # context by an earlier pass no longer apply
+        context[_SCORE_CACHE_TOKEN] = object()
         
-        # Add user preferences to context if available
-        if user_id and self.user_preference_manager:
-            user_preferences = self.user_preference_manager.get_preferences(user_id)
-            context["user_preferences"] = [pref.to_dict() for pref in user_preferences]
+        # The balancer picks from twice as many tasks as are returned
+        balancing = bool(user_id and self.workload_balancer)
+        keep = limit * 2 if balancing else limit
         
-        # Add historical performance to context if available
-        if user_id and self.historical_analyzer:
-            historical_performance = self.historical_analyzer.analyze_user_performance(user_id)
-            context["historical_performance"] = historical_performance
-        
-        # Add workload metrics to context if available
-        if user_id and self.workload_balancer:
-            workload_metrics = self.workload_balancer.calculate_workload_metrics(user_id, tasks)
-            context["workload_metrics"] = workload_metrics
-        
-        # Add all tasks to context for dependency checking
-        all_tasks = {task.get("id", ""): task for task in tasks}
-        context["all_tasks"] = all_tasks
-        
-        # Score each task
-        scored_tasks = []
-        for task in tasks:
-            task_score = self.score_task(task, user_id, context)
-            scored_tasks.append({
+        # Score the tasks that can still reach the top `keep` on every factor,
+        # then combine the factor columns with vectorized weighted sums.
+        # Columns are added in factor order, so each score is bit-identical to
+        # score_task's and ties rank the same.
+        factors, total_weight = self._cached_factors()
+        score_matrix, scored_rows = self._score_matrix(tasks, context, keep)
+        overall_scores = np.zeros(len(tasks), dtype=np.float64)
+        if factors and total_weight > 0:
+            for column, factor in enumerate(factors):
+                overall_scores += score_matrix[:, column] * factor.weight
+            overall_scores /= total_weight
+        # Pruned tasks are known to rank below the top `keep`
+        overall_scores[~scored_rows] = -np.inf
+        
+        factor_names = [factor.name for factor in factors]
+        
+        # One timestamp for the whole batch rather than one clock read per task
+        now = datetime.now()
+        timestamp = now.isoformat()
+        metadata = {"user_id": user_id} if user_id else {}
+        
+        def entry(task: Dict[str, Any], overall_score: float, factor_scores: Dict[str, Any]) -> Dict[str, Any]:
+            # Returned tasks are remembered so score_task and
+            # explain_recommendation on the same context don't score them again
+            self._cache_score(task, user_id, context, TaskScore(
+                task_id=task.get("id", ""),
+                overall_score=overall_score,
+                factor_scores=dict(factor_scores),
+                timestamp=now,
+                metadata=dict(metadata)
+            ))
+            return {
                 "task": task,
-                "score": task_score.overall_score,
-                "factor_scores": task_score.factor_scores,
-                "timestamp": task_score.timestamp.isoformat()
-            })
+                "score": overall_score,
+                "factor_scores": factor_scores,
+                "timestamp": timestamp
+            }
         
-        # Sort by score (descending)
-        scored_tasks.sort(key=lambda t: t["score"], reverse=True)
+        def scored(row: int) -> Dict[str, Any]:
+            # Entries are only built for the tasks that are returned
+            return entry(tasks[row], float(overall_scores[row]),
+                         dict(zip(factor_names, score_matrix[row].tolist())))
         
         # Apply workload balancing if available
-        if user_id and self.workload_balancer:
+        if balancing:
             # Get top tasks (2x limit to give balancer more options)
-            top_tasks = [t["task"] for t in scored_tasks[:limit*2]]
+            top_rows = _top_indices(overall_scores, keep).tolist()
+            top_tasks = [tasks[row] for row in top_rows]
             
             # Balance workload
             balanced_tasks = self.workload_balancer.balance_workload(user_id, top_tasks)
             
             # If balancer returned tasks, use those
             if balanced_tasks:
-                # Re-score balanced tasks to get scores
+                # Reuse the scores of tasks the balancer kept; only tasks it
+                # added (or replaced) are scored again
+                row_by_id = {task_ids[row]: row for row in top_rows}
+                scorer = self._get_scorer()
                 balanced_scored_tasks = []
                 for task in balanced_tasks:
-                    task_score = self.score_task(task, user_id, context)
-                    balanced_scored_tasks.append({
-                        "task": task,
-                        "score": task_score.overall_score,
-                        "factor_scores": task_score.factor_scores,
-                        "timestamp": task_score.timestamp.isoformat()
-                    })
-                
-                # Sort by score (descending)
-                balanced_scored_tasks.sort(key=lambda t: t["score"], reverse=True)
+                    row = row_by_id.get(task.get("id", ""))
+                    if row is not None and tasks[row] is task:
+                        balanced_scored_tasks.append(scored(row))
+                        continue
+                    # Scored directly under the batch timestamp
+                    overall_score, factor_scores = scorer(task, context)
+                    balanced_scored_tasks.append(entry(task, overall_score, factor_scores))
                 
-                # Limit to requested number
-                return balanced_scored_tasks[:limit]
+                # Highest scores first, limited to the requested number
+                return heapq.nlargest(limit, balanced_scored_tasks, key=_SCORE_KEY)
+        
+        # Select the top tasks without sorting the rest
+        return [scored(row) for row in _top_indices(overall_scores, limit).tolist()]
+    
+    def _build_context(self, 
+                       user_id: Optional[str], 
+                       tasks: Optional[List[Dict[str, Any]]], 
+                       context: Optional[Dict[str, Any]],
+                       task_ids: Optional[List[str]] = None) -> Dict[str, Any]:
+        """
+        Add the per-user data the factors read to a scoring context.
+        
+        User preferences are stored as UserPreference objects rather than
+        converted with to_dict(); factors read them via preference_fields.
+        Preferences, historical performance and workload metrics are only
+        fetched if a registered factor reads them (see
+        RecommendationFactor.context_keys).
+        
+        Args:
+            user_id: User to score for
+            tasks: Candidate tasks, or None when scoring a single task outside a
+                recommendation pass (workload metrics and the task index are then
+                left out)
+            context: Caller's context, updated in place (a new dict if None)
+            task_ids: Ids of tasks, in the same order, if already extracted
+            
+        Returns:
+            The scoring context
+        """
+        if context is None:
+            context = {}
+        
+        needed = self._needed_context_keys()
         
-        # Limit to requested number
-        return scored_tasks[:limit]
+        # Add user preferences to context if available
+        if (user_id and self.user_preference_manager
+                and (needed is None or "user_preferences" in needed)):
+            context["user_preferences"] = self.user_preference_manager.get_preferences(user_id)
+        
+        # Add historical performance to context if available
+        if (user_id and self.historical_analyzer
+                and (needed is None or "historical_performance" in needed)):
+            context["historical_performance"] = self.historical_analyzer.analyze_user_performance(user_id)
+        
+        if tasks is not None:
+            # Add workload metrics to context if available
+            if (user_id and self.workload_balancer
+                    and (needed is None or "workload_metrics" in needed)):
+                context["workload_metrics"] = self.workload_balancer.calculate_workload_metrics(user_id, tasks)
+            
+            # Add all tasks to context for dependency checking; this one index
+            # serves the initial scoring pass and any balancer rescoring
+            if task_ids is None:
+                task_ids = [task.get("id", "") for task in tasks]
+            context["all_tasks"] = dict(zip(task_ids, tasks))
+        
+        # Add user ID to context
+        if user_id:
+            context["user_id"] = user_id
+        
+        return context
+    
+    def _needed_context_keys(self) -> Optional[Set[str]]:
+        """
+        Get the context keys the registered factors read.
+        
+        Returns:
+            Union of the factors' context_keys, or None if any factor does not
+            declare them (and so may read every key)
+        """
+        needed = set()
+        for factor in self._cached_factors()[0]:
+            if factor.context_keys is None:
+                return None
+            needed.update(factor.context_keys)
+        return needed
+    
+    def _score_matrix(self, 
+                      tasks: List[Dict[str, Any]], 
+                      context: Dict[str, Any],
+                      keep: Optional[int] = None) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Score tasks on all factors, skipping tasks that cannot make the top `keep`.
+        
+        Factors are evaluated column by column through their _SafeScore
+        wrappers, so a factor that fails on a task scores 0.0 for it, as in
+        score_task.
+        
+        With keep set, columns are evaluated heaviest weight first. Factor
+        scores lie between 0.0 and 1.0, so after each column a task's final
+        weighted sum is bounded by its partial sum below and by the partial sum
+        plus the remaining weight above; a task whose upper bound is below the
+        keep-th best lower bound is dropped from later columns. If a column
+        turns out to hold scores outside 0.0-1.0, the bounds no longer hold
+        and every task is scored in full.
+        
+        Args:
+            tasks: Tasks to score
+            context: Shared scoring context
+            keep: Number of top tasks the caller needs, or None to score all
+            
+        Returns:
+            Tuple of (array of shape (len(tasks), len(self.factors)) with factor
+            scores, boolean array marking the tasks that were scored in full)
+        """
+        factors, total_weight = self._cached_factors()
+        callables = self._get_factor_callables()
+        n = len(tasks)
+        matrix = np.zeros((n, len(callables)), dtype=np.float64)
+        scored = np.ones(n, dtype=bool)
+        
+        if (keep is None or keep <= 0 or keep >= n or total_weight <= 0
+                or any(factor.weight < 0 for factor in factors)):
+            for column, call in enumerate(callables):
+                matrix[:, column] = call.batch(tasks, context)
+            return matrix, scored
+        
+        partial = np.zeros(n, dtype=np.float64)
+        remaining = total_weight
+        # Slack for rounding in the running sums
+        tolerance = 1e-9 * total_weight
+        for column in self._get_columns_by_weight():
+            rows = np.flatnonzero(scored)
+            call = callables[column]
+            values = np.asarray(call.batch([tasks[row] for row in rows.tolist()], context),
+                                dtype=np.float64)
+            if values.size and (values.min() < 0.0 or values.max() > 1.0):
+                return self._score_matrix(tasks, context)
+            
+            weight = factors[column].weight
+            matrix[rows, column] = values
+            partial[rows] += values * weight
+            remaining -= weight
+            if rows.shape[0] <= keep:
+                continue
+            
+            lower = partial[rows]
+            threshold = np.partition(lower, rows.shape[0] - keep)[rows.shape[0] - keep]
+            scored[rows[lower + remaining < threshold - tolerance]] = False
+        
+        return matrix, scored
+    
+    def _get_columns_by_weight(self) -> Tuple[int, ...]:
+        """
+        Get the factor columns ordered by descending weight.
+        
+        Returns:
+            Tuple of indices into the current factors, heaviest first
+        """
+        if self._columns_by_weight is None:
+            factors, _ = self._cached_factors()
+            self._columns_by_weight = tuple(sorted(range(len(factors)),
+                                                   key=lambda column: -factors[column].weight))
+        return self._columns_by_weight
     
     def score_task(self, 
                   task: Dict[str, Any], 
@@ -172,6 +500,9 @@ class DefaultRecommendationEngine(RecommendationEngine):
         """
         Score a task for recommendation.
         
+        Scores are remembered only for a caller-supplied context; without one
+        there is nothing a later call could match.
+        
         Args:
             task: Task to score
             user_id: User to score for
@@ -180,38 +511,38 @@ class DefaultRecommendationEngine(RecommendationEngine):
         Returns:
             Task score
         """
-        # Initialize context if not provided
+        # Score in a fresh context, which no later call could match
         if context is None:
-            context = {}
+            return self._compute_task_score(task, user_id, {})
+        
+        # Reuse the score from an earlier call or recommendation pass
+        task_score = self._cached_score(task, user_id, context)
+        if task_score is None:
+            task_score = self._compute_task_score(task, user_id, context)
+            self._cache_score(task, user_id, context, task_score)
+        return task_score
+    
+    def _compute_task_score(self, 
+                            task: Dict[str, Any], 
+                            user_id: Optional[str], 
+                            context: Dict[str, Any]) -> TaskScore:
+        """
+        Score a task on every factor, bypassing the score cache.
         
+        Args:
+            task: Task to score
+            user_id: User to score for
+            context: Scoring context, updated with the user ID
+            
+        Returns:
+            Task score
+        """
         # Add user ID to context
         if user_id:
             context["user_id"] = user_id
         
         # Calculate scores for each factor
-        factor_scores = {}
-        weighted_scores = []
-        
-        for factor in self.factors:
-            try:
-                # Calculate factor score
-                factor_score = factor.score(task, context)
-                
-                # Store factor score
-                factor_scores[factor.name] = factor_score
-                
-                # Add weighted score
-                weighted_scores.append(factor_score * factor.weight)
-            except Exception as e:
-                self.logger.error(f"Error calculating score for factor {factor.name}: {e}")
-                factor_scores[factor.name] = 0.0
-        
-        # Calculate overall score
-        if weighted_scores:
-            total_weight = sum(factor.weight for factor in self.factors)
-            overall_score = sum(weighted_scores) / total_weight if total_weight > 0 else 0.0
-        else:
-            overall_score = 0.0
+        overall_score, factor_scores = self._get_scorer()(task, context)
         
         # Create task score
         return TaskScore(
@@ -221,6 +552,139 @@ class DefaultRecommendationEngine(RecommendationEngine):
             metadata={"user_id": user_id} if user_id else {}
         )
     
+    def _cached_score(self, 
+                      task: Dict[str, Any], 
+                      user_id: Optional[str], 
+                      context: Dict[str, Any]) -> Optional[TaskScore]:
+        """
+        Look up a remembered score for a task under a scoring context.
+        
+        Args:
+            task: Task that was scored (the same object, not an equal copy)
+            user_id: User it was scored for
+            context: Context it was scored with
+            
+        Returns:
+            The remembered task score, or None if there is none
+        """
+        token = context.get(_SCORE_CACHE_TOKEN)
+        if token is None:
+            return None
+        
+        key = (task.get("id", ""), user_id or "", token)
+        cached = self._score_cache.get(key)
+        if cached is None or cached[0] is not task:
+            return None
+        
+        self._score_cache.move_to_end(key)
+        return cached[1]
+    
+    def _cache_score(self, 
+                     task: Dict[str, Any], 
+                     user_id: Optional[str], 
+                     context: Dict[str, Any], 
+                     task_score: TaskScore) -> None:
+        """
+        Remember a task's score under a scoring context, evicting the least
+        recently used score beyond _SCORE_CACHE_SIZE.
+        
+        The context is tagged with a token object on first use; keying on the
+        token rather than id(context) keeps a later dict that reuses the id
+        from matching.
+        
+        Args:
+            task: Task that was scored
+            user_id: User it was scored for
+            context: Context it was scored with
+            task_score: Resulting score
+        """
+        token = context.get(_SCORE_CACHE_TOKEN)
+        if token is None:
+            token = context[_SCORE_CACHE_TOKEN] = object()
+        
+        key = (task.get("id", ""), user_id or "", token)
+        self._score_cache[key] = (task, task_score)
+        self._score_cache.move_to_end(key)
+        if len(self._score_cache) > _SCORE_CACHE_SIZE:
+            self._score_cache.popitem(last=False)
+    
+    def invalidate_cache(self) -> None:
+        """
+        Forget remembered task scores.
+        
+        Scores are reused for the same task object, user and context until the
+        factors or weights change or a new recommend_tasks pass runs on the
+        context; call this after changing a task, the context or the user's
+        data in place.
+        """
+        self._score_cache.clear()
+    
+    def _get_factor_callables(self) -> Tuple[_SafeScore, ...]:
+        """
+        Get the _SafeScore wrappers for the current factors, in factor order.
+        
+        Returns:
+            Tuple with one wrapper per factor
+        """
+        if self._factor_callables is None:
+            factors, _ = self._cached_factors()
+            self._factor_callables = tuple(_SafeScore(factor, self.logger) for factor in factors)
+        return self._factor_callables
+    
+    def _get_scorer(self) -> _Scorer:
+        """
+        Get the scorer for the current factors, building it if needed.
+        
+        Returns:
+            Function mapping (task, context) to (overall score, factor scores)
+        """
+        if self._scorer is None:
+            self._scorer = self._build_scorer()
+        return self._scorer
+    
+    def _build_scorer(self) -> _Scorer:
+        """
+        Build a scoring function bound to the current factors and weights.
+        
+        Each factor's wrapped score method, name and weight are looked up once
+        here instead of on every scored task; the scorer is rebuilt whenever
+        the factor cache is invalidated.
+        
+        Returns:
+            Function mapping (task, context) to (overall score, factor scores)
+        """
+        factors, total_weight = self._cached_factors()
+        bound = tuple((call, factor.name, factor.weight)
+                      for call, factor in zip(self._get_factor_callables(), factors))
+        
+        def scorer(task: Dict[str, Any], context: Dict[str, Any]) -> Tuple[float, Dict[str, Any]]:
+            factor_scores = {}
+            # Running total, added in factor order like recommend_tasks' columns
+            total = 0.0
+            for call, name, weight in bound:
+                factor_score = call(task, context)
+                factor_scores[name] = factor_score
+                total += factor_score * weight
+            return (total / total_weight if total_weight > 0 else 0.0), factor_scores
+        
+        return scorer
+    
+    def _invalidate_factor_cache(self, weights_only: bool = False) -> None:
+        """
+        Drop the cached factor snapshot, wrappers, scorer and task scores after
+        factors or weights change.
+        
+        Args:
+            weights_only: Only a weight changed, so the factor list and name
+                index are still valid
+        """
+        super()._invalidate_factor_cache(weights_only)
+        if not weights_only:
+            self._factor_callables = None
+        self._columns_by_weight = None
+        self._scorer = None
+        self._score_cache.clear()
+    
     def get_factor_weights(self) -> Dict[str, float]:
         """
         Get the weights for all factors.
@@ -241,11 +705,13 @@ class DefaultRecommendationEngine(RecommendationEngine):
         Returns:
             True if successful, False otherwise
         """
-        for factor in self.factors:
-            if factor.name == factor_name:
-                factor.weight = weight
-                return True
-        return False
+        index = self._factor_position(factor_name)
+        if index is None:
+            return False
+        
+        self.factors[index].weight = weight
+        self._invalidate_factor_cache(weights_only=True)
+        return True
     
     def explain_recommendation(self, 
                              task: Dict[str, Any], 
@@ -262,8 +728,16 @@ class DefaultRecommendationEngine(RecommendationEngine):
         Returns:
             Explanation of recommendation
         """
-        # Score the task
-        task_score = self.score_task(task, user_id, context)
+        # Score the task with the same user data a recommendation pass uses,
+        # unless it was already scored with the caller's context; a context
+        # built here is never seen again, so its score is not remembered
+        if context is None:
+            task_score = self._compute_task_score(task, user_id, self._build_context(user_id, None, None))
+        else:
+            task_score = self._cached_score(task, user_id, context)
+            if task_score is None:
+                context = self._build_context(user_id, None, context)
+                task_score = self.score_task(task, user_id, context)
         
         # Get top factors
         factor_scores = task_score.factor_scores
@@ -295,10 +769,12 @@ class DefaultRecommendationEngine(RecommendationEngine):
         Returns:
             Explanation text
         """
-        explanation = f"Task '{task.get('title', '')}' was recommended because:\n"
+        parts = [f"Task '{task.get('title', '')}' was recommended because:\n"]
+        priority = task.get("priority", "normal")
+        has_deadline = "due_date" in task
         
         # Add top factors
-        for i, (factor_name, score) in enumerate(sorted_factors[:3]):
+        for factor_name, score in sorted_factors[:3]:
             if score > 0.7:
                 strength = "strongly"
             elif score > 0.4:
@@ -306,30 +782,14 @@ class DefaultRecommendationEngine(RecommendationEngine):
             else:
                 strength = "somewhat"
             
-            if factor_name == "PriorityFactor":
-                explanation += f"- It has a {strength} high priority ({task.get('priority', 'normal')})\n"
-            elif factor_name == "DeadlineFactor":
-                if "due_date" in task:
-                    explanation += f"- It has a {strength} urgent deadline\n"
-                else:
-                    explanation += f"- Deadline considerations were {strength} important\n"
-            elif factor_name == "DependencyFactor":
-                explanation += f"- It has {strength} few or completed dependencies\n"
-            elif factor_name == "UserPreferenceFactor":
-                explanation += f"- It {strength} matches your preferences\n"
-            elif factor_name == "HistoricalSuccessFactor":
-                explanation += f"- You have {strength} succeeded with similar tasks in the past\n"
-            elif factor_name == "CompletionTimeFactor":
-                explanation += f"- Its estimated completion time {strength} fits your preferences\n"
-            elif factor_name == "WorkloadFactor":
-                explanation += f"- It {strength} helps balance your workload\n"
-            elif factor_name == "ContextAwarenessFactor":
-                explanation += f"- It {strength} relates to your current working context\n"
-            elif factor_name == "CollaborationFactor":
-                explanation += f"- It {strength} aligns with your collaboration preferences\n"
-            elif factor_name == "LearningOpportunityFactor":
-                explanation += f"- It {strength} provides learning opportunities in your areas of interest\n"
+            if factor_name == "DeadlineFactor" and not has_deadline:
+                template = _NO_DEADLINE_TEMPLATE
             else:
-                explanation += f"- {factor_name}: {score:.2f}\n"
+                template = _FACTOR_TEMPLATES.get(factor_name)
+            
+            if template is None:
+                parts.append(f"- {factor_name}: {score:.2f}\n")
+            else:
+                parts.append(template.format(strength=strength, priority=priority))
         
-        return explanation
+        return "".join(parts)
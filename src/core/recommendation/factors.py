@@ -5,16 +5,20 @@ This module implements various factors used to score tasks for recommendations,
 including priority-based, deadline-based, dependency-based, and user preference-based factors.
 """
 
-from typing import Dict, List, Any, Optional, Union, Callable
+from typing import Dict, List, Any, Optional, Union, Callable, FrozenSet
 from datetime import datetime, timedelta
 import logging
 
-from .base import RecommendationFactor
+import numpy as np
+
+from .base import RecommendationFactor, preference_fields
 
 
 class PriorityFactor(RecommendationFactor):
     """Factor that scores tasks based on priority."""
     
+    context_keys = frozenset()
+    
     def __init__(self, weight: float = 1.0, name: str = "PriorityFactor"):
         """
         Initialize a priority factor.
@@ -50,6 +54,8 @@ class PriorityFactor(RecommendationFactor):
 class DeadlineFactor(RecommendationFactor):
     """Factor that scores tasks based on deadline proximity."""
     
+    context_keys = frozenset()
+    
     def __init__(self, weight: float = 1.0, name: str = "DeadlineFactor", urgency_threshold_days: int = 7):
         """
         Initialize a deadline factor.
@@ -73,30 +79,15 @@ class DeadlineFactor(RecommendationFactor):
         Returns:
             Score between 0.0 and 1.0
         """
-        # If no due date, give a middle score
-        if "due_date" not in task or not task["due_date"]:
-            return 0.5
-        
-        # Parse due date
-        if isinstance(task["due_date"], str):
-            try:
-                due_date = datetime.fromisoformat(task["due_date"])
-            except ValueError:
-                return 0.5
-        elif isinstance(task["due_date"], datetime):
-            due_date = task["due_date"]
-        else:
+        # If no (valid) due date, give a middle score
+        due_date = self._parse_due_date(task)
+        if due_date is None:
             return 0.5
         
-        # Calculate days until due
-        now = datetime.now()
-        if due_date < now:
-            # Overdue tasks get highest score
-            return 1.0
-        
-        days_until_due = (due_date - now).days
+        # Calculate whole days until due (negative once overdue)
+        days_until_due = (due_date - datetime.now()).days
         
-        # Score based on urgency threshold
+        # Score based on urgency threshold; overdue tasks get the highest score
         if days_until_due <= 0:
             return 1.0
         elif days_until_due >= self.urgency_threshold_days:
@@ -104,11 +95,79 @@ class DeadlineFactor(RecommendationFactor):
         else:
             # Linear scale from 0.2 to 1.0 based on days until due
             return 1.0 - (days_until_due / self.urgency_threshold_days) * 0.8
+    
+    def score_batch(self, tasks: List[Dict[str, Any]], context: Dict[str, Any]) -> np.ndarray:
+        """
+        Calculate deadline scores for several tasks at once, as score does.
+        
+        Due dates are parsed and compared with one reading of the current
+        time, then mapped to scores in one vectorized pass. Timezone-aware due
+        dates are compared in local time.
+        
+        Args:
+            tasks: Task data
+            context: Additional context
+            
+        Returns:
+            Array with one score between 0.0 and 1.0 per task
+        """
+        due_dates = [self._parse_due_date(task) for task in tasks]
+        
+        # Tasks without a (valid) due date get a middle score
+        scores = np.full(len(tasks), 0.5)
+        known = np.array([due_date is not None for due_date in due_dates], dtype=bool)
+        if not known.any():
+            return scores
+        
+        # Whole days until due (negative once overdue); subtracting Python
+        # datetimes is cheaper than converting them to datetime64
+        now = datetime.now()
+        days_until_due = np.array([(due_date - now).days for due_date in due_dates
+                                   if due_date is not None])
+        
+        # Overdue or due today scores highest, due beyond the threshold lowest,
+        # and a linear scale from 1.0 down to 0.2 in between
+        known_scores = np.full(days_until_due.shape, 0.2)
+        urgent = days_until_due <= 0
+        upcoming = ~urgent & (days_until_due < self.urgency_threshold_days)
+        known_scores[urgent] = 1.0
+        known_scores[upcoming] = 1.0 - (days_until_due[upcoming] / self.urgency_threshold_days) * 0.8
+        scores[known] = known_scores
+        return scores
+    
+    @staticmethod
+    def _parse_due_date(task: Dict[str, Any]) -> Optional[datetime]:
+        """
+        Get a task's due date as a naive local datetime.
+        
+        Args:
+            task: Task data
+            
+        Returns:
+            The due date, or None if it is missing or cannot be parsed
+        """
+        due_date = task.get("due_date")
+        if not due_date:
+            return None
+        
+        if isinstance(due_date, str):
+            try:
+                due_date = datetime.fromisoformat(due_date)
+            except ValueError:
+                return None
+        elif not isinstance(due_date, datetime):
+            return None
+        
+        if due_date.tzinfo is not None:
+            due_date = due_date.astimezone().replace(tzinfo=None)
+        return due_date
 
 
 class DependencyFactor(RecommendationFactor):
     """Factor that scores tasks based on dependency readiness."""
     
+    context_keys = frozenset({"all_tasks"})
+    
     def __init__(self, weight: float = 1.0, name: str = "DependencyFactor"):
         """
         Initialize a dependency factor.
@@ -134,29 +193,46 @@ class DependencyFactor(RecommendationFactor):
         if "dependencies" not in task or not task["dependencies"]:
             return 1.0
         
-        # Get all tasks to check dependency status
-        all_tasks = context.get("all_tasks", {})
-        
         # Check if all dependencies are completed
-        dependencies = task.get("dependencies", [])
-        if not dependencies:
-            return 1.0
-        
-        completed_deps = 0
-        for dep_id in dependencies:
-            if dep_id in all_tasks and all_tasks[dep_id].get("status") == "completed":
-                completed_deps += 1
+        dependencies = task["dependencies"]
+        completed = self._completed_ids(context)
+        completed_deps = sum(map(completed.__contains__, dependencies))
         
         # Score based on percentage of completed dependencies
-        if not dependencies:
-            return 1.0
-        
         return completed_deps / len(dependencies)
+    
+    @staticmethod
+    def _completed_ids(context: Dict[str, Any]) -> FrozenSet[str]:
+        """
+        Get the ids of completed tasks in the context's task index.
+        
+        The set is built once per task index and kept in the context, so a
+        recommendation pass checks each task's status once rather than once
+        per dependency on it.
+        
+        Args:
+            context: Scoring context
+            
+        Returns:
+            Ids of the completed tasks in context["all_tasks"]
+        """
+        all_tasks = context.get("all_tasks", {})
+        cached = context.get("_completed_ids")
+        # Each recommendation pass builds a new index, which the cache is tied to
+        if cached is not None and cached[0] is all_tasks:
+            return cached[1]
+        
+        completed = frozenset(task_id for task_id, task in all_tasks.items()
+                              if task.get("status") == "completed")
+        context["_completed_ids"] = (all_tasks, completed)
+        return completed
 
 
 class UserPreferenceFactor(RecommendationFactor):
     """Factor that scores tasks based on user preferences."""
     
+    context_keys = frozenset({"user_preferences"})
+    
     def __init__(self, weight: float = 1.0, name: str = "UserPreferenceFactor"):
         """
         Initialize a user preference factor.
@@ -188,9 +264,7 @@ class UserPreferenceFactor(RecommendationFactor):
         preference_count = 0
         
         for pref in user_preferences:
-            pref_type = pref.get("preference_type")
-            pref_value = pref.get("preference_value")
-            pref_weight = pref.get("weight", 1.0)
+            pref_type, pref_value, pref_weight = preference_fields(pref)
             
             # Check if task matches preference
             if pref_type == "tag_preference" and "tags" in task:
@@ -218,6 +292,8 @@ class UserPreferenceFactor(RecommendationFactor):
 class CompletionTimeFactor(RecommendationFactor):
     """Factor that scores tasks based on estimated completion time."""
     
+    context_keys = frozenset({"all_tasks"})
+    
     def __init__(self, weight: float = 1.0, name: str = "CompletionTimeFactor", prefer_shorter: bool = True):
         """
         Initialize a completion time factor.
@@ -276,6 +352,8 @@ class CompletionTimeFactor(RecommendationFactor):
 class HistoricalSuccessFactor(RecommendationFactor):
     """Factor that scores tasks based on historical success with similar tasks."""
     
+    context_keys = frozenset({"historical_performance"})
+    
     def __init__(self, weight: float = 1.0, name: str = "HistoricalSuccessFactor"):
         """
         Initialize a historical success factor.
@@ -317,6 +395,8 @@ class HistoricalSuccessFactor(RecommendationFactor):
 class WorkloadFactor(RecommendationFactor):
     """Factor that scores tasks based on current workload balance."""
     
+    context_keys = frozenset({"workload_metrics"})
+    
     def __init__(self, weight: float = 1.0, name: str = "WorkloadFactor"):
         """
         Initialize a workload factor.
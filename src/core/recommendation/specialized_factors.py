@@ -11,12 +11,14 @@ import logging
 import re
 import os
 
-from .base import RecommendationFactor
+from .base import RecommendationFactor, preference_fields
 
 
 class ContextAwarenessFactor(RecommendationFactor):
     """Factor that scores tasks based on the user's current working context."""
     
+    context_keys = frozenset({"current_files", "current_directory", "recent_commands"})
+    
     def __init__(self, weight: float = 1.0):
         """
         Initialize a context awareness factor.
@@ -221,6 +223,8 @@ class ContextAwarenessFactor(RecommendationFactor):
 class CollaborationFactor(RecommendationFactor):
     """Factor that scores tasks based on collaboration requirements."""
     
+    context_keys = frozenset({"user_preferences", "user_id"})
+    
     def __init__(self, weight: float = 1.0):
         """
         Initialize a collaboration factor.
@@ -251,8 +255,9 @@ class CollaborationFactor(RecommendationFactor):
         # Get collaboration preferences
         collaboration_preference = None
         for pref in user_preferences:
-            if pref.get("preference_type") == "preferred_collaboration":
-                collaboration_preference = pref.get("preference_value")
+            pref_type, pref_value, _ = preference_fields(pref)
+            if pref_type == "preferred_collaboration":
+                collaboration_preference = pref_value
                 break
         
         # If no preference, return default score
@@ -296,6 +301,8 @@ class CollaborationFactor(RecommendationFactor):
 class LearningOpportunityFactor(RecommendationFactor):
     """Factor that scores tasks based on learning opportunities."""
     
+    context_keys = frozenset({"user_preferences"})
+    
     def __init__(self, weight: float = 1.0):
         """
         Initialize a learning opportunity factor.
@@ -325,8 +332,9 @@ class LearningOpportunityFactor(RecommendationFactor):
         # Get learning preferences
         learning_preference = None
         for pref in user_preferences:
-            if pref.get("preference_type") == "learning_interests":
-                learning_preference = pref.get("preference_value", [])
+            pref_type, pref_value, _ = preference_fields(pref)
+            if pref_type == "learning_interests":
+                learning_preference = pref_value
                 break
         
         # If no preference, return default score
@@ -7,6 +7,7 @@ and workflows through rules, triggers, conditions, and actions.
 
 from typing import Dict, List, Any, Optional, Union, Callable
 from datetime import datetime
+import dataclasses
 import os
 import json
 import logging
@@ -356,7 +357,7 @@ class TaskAutomationSystem:
         event = {
             "type": event_type,
             "task_id": task.id,
-            "task": task.__dict__,
+            "task": dataclasses.asdict(task),
             "timestamp": datetime.now().isoformat()
         }
         
@@ -15,12 +15,17 @@ from .task_collaboration import TaskCollaboration, CollaborationRole, Collaborat
 from .task_templates import TaskTemplateSystem
 from .task_io import TaskIO, TaskImportError, TaskExportError
 from .prompts import load_prompt, render_template
+import dataclasses
 import uuid
 import os
 import json
+import operator
 from datetime import datetime, timedelta
 from enum import Enum
 
+# Sort key for listing tasks oldest first
+_CREATED_AT = operator.attrgetter("created_at")
+
 class TaskManager:
     def __init__(self, ai_provider: Optional[Union[BaseAIProvider, str]] = None):
         """Initialize the TaskManager.
@@ -192,19 +197,17 @@ class TaskManager:
                      assigned_to: Optional[str] = None,
                      tags_include_any: Optional[List[str]] = None) -> List[Task]:
         """Lists tasks, optionally filtering by status, priority, assignee, or tags."""
-        filtered_tasks = list(self._tasks.values())
-
-        if status:
-            filtered_tasks = [task for task in filtered_tasks if task.status == status]
-        if priority:
-            filtered_tasks = [task for task in filtered_tasks if task.priority == priority]
-        if assigned_to:
-            filtered_tasks = [task for task in filtered_tasks if task.assigned_to == assigned_to]
-        if tags_include_any:
-            filtered_tasks = [task for task in filtered_tasks 
-                              if any(tag in task.project_context_tags for tag in tags_include_any)]
-            
-        return sorted(filtered_tasks, key=lambda t: t.created_at)
+        # One pass over the tasks, checking every requested filter per task
+        wanted_tags = set(tags_include_any) if tags_include_any else None
+        filtered_tasks = [
+            task for task in self._tasks.values()
+            if (not status or task.status == status)
+            and (not priority or task.priority == priority)
+            and (not assigned_to or task.assigned_to == assigned_to)
+            and (wanted_tags is None or not wanted_tags.isdisjoint(task.project_context_tags))
+        ]
+            
+        return sorted(filtered_tasks, key=_CREATED_AT)
 
     def get_subtasks(self, parent_task_id: str) -> List[Task]:
         """Retrieves all direct subtasks for a given parent task ID."""
@@ -3061,8 +3064,8 @@ class TaskManager:
         # This is a very basic example. Production use would need robust serialization.
         import json
         data = {
-            "tasks": {tid: task.__dict__ for tid, task in self._tasks.items()},
-            "project_rules": {rid: rule.__dict__ for rid, rule in self._project_rules.items()}
+            "tasks": {tid: dataclasses.asdict(task) for tid, task in self._tasks.items()},
+            "project_rules": {rid: dataclasses.asdict(rule) for rid, rule in self._project_rules.items()}
         }
         # Need to handle datetime and Enum serialization properly
         def custom_serializer(obj):
@@ -3070,7 +3073,9 @@ class TaskManager:
                 return obj.isoformat()
             if isinstance(obj, Enum):
                 return obj.value
-            if hasattr(obj, '__dict__'): # For dataclasses
+            if dataclasses.is_dataclass(obj):
+                return dataclasses.asdict(obj)
+            if hasattr(obj, '__dict__'):
                 return obj.__dict__
             return str(obj)
 
@@ -0,0 +1,228 @@
+"""
+Columnar task storage for Tascade AI.
+
+This module provides a structure-of-arrays view over Task objects, storing
+each scanned field in a contiguous NumPy array so that analytics and
+scheduling passes can filter and sort many tasks with vectorized operations
+instead of per-object attribute access. Task objects remain the source of
+truth for mutations; callers build or refresh a table from them (see
+TaskTable.from_tasks and TaskTable.add) before a batch read.
+"""
+
+from datetime import datetime
+from typing import Dict, List, Iterable, Optional
+
+import numpy as np
+
+from .models import Task, TaskStatus, TaskPriority
+
+
+# Small integer codes for the enum columns, in declaration order
+STATUS_CODES: Dict[TaskStatus, int] = {status: code for code, status in enumerate(TaskStatus)}
+PRIORITY_CODES: Dict[TaskPriority, int] = {priority: code for code, priority in enumerate(TaskPriority)}
+
+_STATUSES = tuple(TaskStatus)
+_PRIORITIES = tuple(TaskPriority)
+
+# Column name -> (dtype, empty value); ids are kept as Python strings since a
+# fixed-width unicode dtype would silently truncate long (e.g. subtask) ids
+_COLUMNS = {
+    "id": (object, ""),
+    "status": (np.uint8, 0),
+    "priority": (np.uint8, 0),
+    "created_at": ("datetime64[us]", np.datetime64("NaT")),
+    "updated_at": ("datetime64[us]", np.datetime64("NaT")),
+    "complexity_score": (np.float32, np.nan),
+    "estimated_effort_hours": (np.float32, np.nan),
+}
+
+
+def _to_datetime64(value: Optional[datetime]) -> np.datetime64:
+    """
+    Convert a task timestamp for a datetime64 column.
+
+    Timezone-aware values are converted to naive local time first, as NumPy
+    only stores naive datetimes (and warns on each aware one).
+
+    Args:
+        value: Timestamp, or None
+
+    Returns:
+        The timestamp as datetime64, or NaT if it is missing
+    """
+    if not value:
+        return np.datetime64("NaT")
+    if value.tzinfo is not None:
+        value = value.astimezone().replace(tzinfo=None)
+    return np.datetime64(value, "us")
+
+
+class TaskTable:
+    """Structure-of-arrays container holding one NumPy column per task field."""
+
+    def __init__(self, capacity: int = 64):
+        """
+        Initialize an empty task table.
+
+        Args:
+            capacity: Initial number of rows to allocate
+        """
+        self._size = 0
+        self._capacity = max(1, capacity)
+        self._columns: Dict[str, np.ndarray] = {
+            name: np.full(self._capacity, empty, dtype=dtype)
+            for name, (dtype, empty) in _COLUMNS.items()
+        }
+        self._row_by_id: Dict[str, int] = {}
+
+    @classmethod
+    def from_tasks(cls, tasks: Iterable[Task]) -> "TaskTable":
+        """
+        Build a table from a collection of tasks.
+
+        Args:
+            tasks: Tasks to load
+
+        Returns:
+            TaskTable containing one row per task
+        """
+        tasks = list(tasks)
+        table = cls(capacity=len(tasks))
+        for task in tasks:
+            table.add(task)
+        return table
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __contains__(self, task_id: str) -> bool:
+        return task_id in self._row_by_id
+
+    def column(self, name: str) -> np.ndarray:
+        """
+        Get the filled part of a column.
+
+        Args:
+            name: Column name (e.g., 'status', 'priority', 'created_at')
+
+        Returns:
+            Array view with one entry per row
+        """
+        return self._columns[name][:self._size]
+
+    def add(self, task: Task) -> int:
+        """
+        Add a task, or refresh its row if it is already in the table.
+
+        Args:
+            task: Task to store
+
+        Returns:
+            Row index of the task
+        """
+        row = self._row_by_id.get(task.id)
+        if row is None:
+            if self._size == self._capacity:
+                self._grow()
+            row = self._size
+            self._size += 1
+            self._row_by_id[task.id] = row
+
+        self._write_row(row, task)
+        return row
+
+    def remove(self, task_id: str) -> bool:
+        """
+        Remove a task by moving the last row into its slot.
+
+        Args:
+            task_id: ID of the task to remove
+
+        Returns:
+            True if the task was removed, False if it was not in the table
+        """
+        row = self._row_by_id.pop(task_id, None)
+        if row is None:
+            return False
+
+        last = self._size - 1
+        if row != last:
+            for col in self._columns.values():
+                col[row] = col[last]
+            self._row_by_id[self._columns["id"][row]] = row
+
+        for name, (_, empty) in _COLUMNS.items():
+            self._columns[name][last] = empty
+        self._size = last
+        return True
+
+    def filter_status(self, status: TaskStatus) -> np.ndarray:
+        """
+        Get a boolean mask of rows with the given status.
+
+        Args:
+            status: Status to match
+
+        Returns:
+            Boolean array with one entry per row
+        """
+        return self.column("status") == STATUS_CODES[status]
+
+    def filter_priority(self, priority: TaskPriority) -> np.ndarray:
+        """
+        Get a boolean mask of rows with the given priority.
+
+        Args:
+            priority: Priority to match
+
+        Returns:
+            Boolean array with one entry per row
+        """
+        return self.column("priority") == PRIORITY_CODES[priority]
+
+    def ids(self, mask: Optional[np.ndarray] = None) -> List[str]:
+        """
+        Get task IDs, optionally restricted to the rows selected by a mask or index array.
+
+        Args:
+            mask: Optional boolean mask or array of row indices
+
+        Returns:
+            List of task IDs
+        """
+        ids = self.column("id")
+        if mask is not None:
+            ids = ids[mask]
+        return ids.tolist()
+
+    def status_of(self, row: int) -> TaskStatus:
+        """Get the status stored in a row."""
+        return _STATUSES[self._columns["status"][row]]
+
+    def priority_of(self, row: int) -> TaskPriority:
+        """Get the priority stored in a row."""
+        return _PRIORITIES[self._columns["priority"][row]]
+
+    def _write_row(self, row: int, task: Task) -> None:
+        """Copy the tracked fields of a task into a row."""
+        cols = self._columns
+        cols["id"][row] = task.id
+        cols["status"][row] = STATUS_CODES[task.status]
+        cols["priority"][row] = PRIORITY_CODES[task.priority]
+        cols["created_at"][row] = _to_datetime64(task.created_at)
+        cols["updated_at"][row] = _to_datetime64(task.updated_at)
+        cols["complexity_score"][row] = (
+            task.complexity_score if task.complexity_score is not None else np.nan
+        )
+        cols["estimated_effort_hours"][row] = (
+            task.estimated_effort_hours if task.estimated_effort_hours is not None else np.nan
+        )
+
+    def _grow(self) -> None:
+        """Double the capacity of every column."""
+        new_capacity = self._capacity * 2
+        for name, (dtype, empty) in _COLUMNS.items():
+            col = np.full(new_capacity, empty, dtype=dtype)
+            col[:self._capacity] = self._columns[name]
+            self._columns[name] = col
+        self._capacity = new_capacity
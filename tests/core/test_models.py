@@ -0,0 +1,98 @@
+import dataclasses
+import json
+import pickle
+
+import pytest
+
+from src.core.models import Task, TaskStatus, InvalidTransition
+
+
+def test_dependency_membership_tracks_list_mutations():
+    task = Task(title="Parent", dependencies=["a", "b", "a"])
+
+    task.add_dependency("c")
+    task.remove_dependency("a")
+
+    assert task.dependencies == ["b", "a", "c"]
+    assert "a" in task.dependencies
+    assert task.dependencies.count("a") == 1
+
+    task.remove_dependency("a")
+    assert "a" not in task.dependencies
+    assert task.dependencies == ["b", "c"]
+
+
+def test_add_dependency_after_list_reassignment():
+    task = Task(title="Parent")
+    task.dependencies = ["a"]
+
+    task.add_dependency("a")
+    task.add_dependency("b")
+
+    assert task.dependencies == ["a", "b"]
+
+
+def test_task_round_trips_through_pickle_and_asdict():
+    task = Task(title="Parent", dependencies=["a"], subtasks=["s1"])
+
+    restored = pickle.loads(pickle.dumps(task))
+    assert restored == task
+    assert "a" in restored.dependencies
+
+    data = dataclasses.asdict(task)
+    assert data["dependencies"] == ["a"]
+    assert data["subtasks"] == ["s1"]
+
+
+def test_update_status_allows_valid_transitions():
+    task = Task(title="Task")
+
+    task.update_status(TaskStatus.IN_PROGRESS)
+    task.update_status(TaskStatus.REVIEW)
+    task.update_status(TaskStatus.COMPLETED)
+
+    assert task.status == TaskStatus.COMPLETED
+    assert task.history[-1]["change"] == "Status changed from review to completed"
+
+
+def test_update_status_rejects_invalid_transition():
+    task = Task(title="Task", status=TaskStatus.CANCELLED)
+
+    with pytest.raises(InvalidTransition):
+        task.update_status(TaskStatus.COMPLETED)
+
+    assert task.status == TaskStatus.CANCELLED
+    assert task.history == []
+
+
+def test_to_json_matches_asdict():
+    task = Task(title="Task", dependencies=["a"], status=TaskStatus.BLOCKED)
+
+    data = json.loads(task.to_json())
+
+    assert data["dependencies"] == ["a"]
+    assert data["status"] == "blocked"
+    assert data["created_at"] == task.created_at.isoformat()
+
+
+def test_batch_update_shares_one_timestamp():
+    task = Task(title="Batch")
+    with task.batch_update():
+        task.update_status(TaskStatus.IN_PROGRESS)
+        task.add_dependency("dep-1")
+        task.add_subtask("sub-1")
+        assert task.history == []
+
+    assert len(task.history) == 3
+    assert len({entry["timestamp"] for entry in task.history}) == 1
+    assert task.updated_at >= task.created_at
+
+
+def test_add_dependencies_skips_known_ids():
+    task = Task(title="Parent", dependencies=["a"])
+
+    task.add_dependencies(["b", "a", "c", "b"])
+
+    assert type(task.dependencies) is list
+    assert task.dependencies == ["a", "b", "c"]
+    assert [entry["change"] for entry in task.history[-2:]] == ["Added dependency: b", "Added dependency: c"]
@@ -0,0 +1,137 @@
+from datetime import date
+
+from src.core.nlp.base import NLPResult, Intent, Entity
+from src.core.nlp.executor import TaskCommandExecutor, _add_months
+
+
+class _FakeTaskManager:
+    def __init__(self):
+        self.created = []
+        self.updates = []
+
+    def create_task(self, task_data):
+        self.created.append(task_data)
+        return "task-1"
+
+    def update_task(self, task_id, update_data):
+        self.updates.append((task_id, update_data))
+        return True
+
+    def list_tasks(self, filters):
+        return []
+
+
+def _result(text, intent, entities=()):
+    return NLPResult(text, [Intent(intent, 0.9)], list(entities))
+
+
+def test_dispatches_by_intent_name():
+    manager = _FakeTaskManager()
+    executor = TaskCommandExecutor(manager)
+
+    result = executor.execute(_result("set priority of task 7 to high", "set_priority", [
+        Entity("task_id", "7", 0, 1),
+        Entity("priority", "high", 0, 1),
+    ]))
+
+    assert result["success"]
+    assert manager.updates == [("7", {"priority": "high"})]
+
+
+def test_unknown_intent_is_reported():
+    executor = TaskCommandExecutor(_FakeTaskManager())
+
+    result = executor.execute(_result("dance", "dance"))
+
+    assert not result["success"]
+    assert "I don't know how to dance" in result["message"]
+
+
+def test_parse_relative_date():
+    executor = TaskCommandExecutor(_FakeTaskManager())
+    today = date.today()
+
+    assert executor._parse_relative_date("Tomorrow") == date.fromordinal(today.toordinal() + 1).isoformat()
+    assert executor._parse_relative_date("in 2 weeks") == date.fromordinal(today.toordinal() + 14).isoformat()
+    assert executor._parse_relative_date("next month") == _add_months(today, 1).isoformat()
+    assert executor._parse_relative_date("someday") == today.isoformat()
+
+
+def test_add_months_clamps_day():
+    assert _add_months(date(2024, 1, 31), 1) == date(2024, 2, 29)
+    assert _add_months(date(2024, 11, 15), 14) == date(2026, 1, 15)
+
+
+def test_list_tasks_status_keywords():
+    executor = TaskCommandExecutor(_FakeTaskManager())
+
+    result = executor.execute(_result("list done and in progress tasks, completed too", "list_tasks"))
+
+    assert result["data"]["filters"] == {"status": ["in-progress", "completed"]}
+
+
+def test_create_task_title_falls_back_to_text_after_task():
+    manager = _FakeTaskManager()
+    executor = TaskCommandExecutor(manager)
+
+    executor.execute(_result("Create a new Task Fix login bug ", "create_task"))
+    executor.execute(_result("create tasks", "create_task"))
+
+    assert [data["title"] for data in manager.created] == ["Fix login bug", "New Task"]
+
+
+def test_get_recommendations_reads_user_and_limit():
+    class _Recommender:
+        def recommend_tasks(self, tasks, user_id, limit):
+            self.args = (user_id, limit)
+            return []
+
+    recommender = _Recommender()
+    executor = TaskCommandExecutor(_FakeTaskManager(), recommender)
+
+    executor.execute(_result("Show top 3 tasks for user Alice", "get_recommendations"))
+    assert recommender.args == ("alice", 3)
+
+    executor.execute(_result("stop recommending", "get_recommendations"))
+    assert recommender.args == (None, 5)
+
+
+def test_handler_failure_becomes_response():
+    class _BrokenTaskManager(_FakeTaskManager):
+        def update_task(self, task_id, update_data):
+            raise RuntimeError("storage offline")
+
+    executor = TaskCommandExecutor(_BrokenTaskManager())
+
+    result = executor.execute(_result("complete task 7", "complete_task", [Entity("task_id", "7", 0, 1)]))
+
+    assert not result["success"]
+    assert result["message"] == "Failed to complete task: storage offline"
+
+
+def test_update_paths_share_not_found_response():
+    class _MissingTaskManager(_FakeTaskManager):
+        def update_task(self, task_id, update_data):
+            super().update_task(task_id, update_data)
+            return False
+
+    manager = _MissingTaskManager()
+    executor = TaskCommandExecutor(manager)
+
+    result = executor.execute(_result("set due date of task 9 to 2025-01-02", "set_due_date", [
+        Entity("task_id", "9", 0, 1),
+        Entity("date", "2025-01-02", 0, 1),
+    ]))
+
+    assert manager.updates == [("9", {"due_date": "2025-01-02"})]
+    assert result["message"] == "Task with ID 9 not found or due date couldn't be updated."
+
+
+def test_dispatch_honours_subclass_overrides():
+    class _CustomExecutor(TaskCommandExecutor):
+        def _execute_list_tasks(self, nlp_result):
+            return self._create_response(success=True, message="custom", data=None)
+
+    executor = _CustomExecutor(_FakeTaskManager())
+
+    assert executor.execute(_result("list tasks", "list_tasks"))["message"] == "custom"
@@ -0,0 +1,48 @@
+from src.core.nlp.base import NLPManager
+from src.core.nlp.manager import TascadeNLPManager
+
+
+class _FakeTaskManager:
+    def list_tasks(self, filters):
+        return []
+
+
+def test_least_recently_used_session_is_evicted():
+    manager = TascadeNLPManager(_FakeTaskManager(), max_sessions=2)
+
+    manager.process_input("list tasks", session_id="a")
+    manager.process_input("list tasks", session_id="b")
+    manager.process_input("help", session_id="a")
+    manager.process_input("help", session_id="c")
+
+    assert list(manager.conversation_contexts) == ["a", "c"]
+    assert len(manager.get_session_history("a")) == 2
+    assert TascadeNLPManager._get_conversation_context is NLPManager._get_conversation_context
+
+
+def test_session_history_turns_and_clear():
+    manager = TascadeNLPManager(_FakeTaskManager(), max_sessions=2)
+
+    manager.process_input("list tasks", session_id="a")
+    manager.process_input("help", session_id="a")
+
+    history = manager.get_session_history("a")
+    assert [turn["user_input"] for turn in history] == ["list tasks", "help"]
+    assert history[1]["nlp_result"].primary_intent.name == "help"
+    assert manager.conversation_contexts["a"].get_last_intent().name == "help"
+
+    assert manager.clear_session_history("a")
+    assert manager.get_session_history("a") == []
+
+
+def test_default_parser_and_executor_are_built_on_first_use():
+    manager = TascadeNLPManager(_FakeTaskManager())
+
+    assert manager._parser is None and manager._command_executor is None
+    assert manager.get_session_history("a") == []
+    assert manager._parser is None
+
+    manager.process_input("list tasks", session_id="a")
+    parser = manager.parser
+    assert parser is not None and manager.parser is parser
+    assert manager.command_executor.task_manager is manager.task_manager
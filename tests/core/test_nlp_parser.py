@@ -0,0 +1,133 @@
+import importlib
+
+import pytest
+
+from src.core.nlp import parser as parser_module
+from src.core.nlp.base import Intent
+from src.core.nlp.parser import DefaultNLParser, PatternEntityExtractor, RuleBasedIntentRecognizer, _compile
+
+
+def test_overlapping_intents_are_all_recognized():
+    recognizer = RuleBasedIntentRecognizer()
+
+    intents = recognizer.recognize_intents("update task priority for task 5")
+
+    assert [intent.name for intent in intents] == ["set_priority", "update_task"]
+    assert intents[0].confidence > intents[1].confidence
+
+
+def test_unmatched_text_is_unknown():
+    intents = RuleBasedIntentRecognizer().recognize_intents("random gibberish")
+
+    assert [(intent.name, intent.confidence) for intent in intents] == [("unknown", 0.3)]
+
+
+def test_parse_extracts_entities():
+    result = DefaultNLParser().parse("set priority of task #123 to high")
+
+    assert result.primary_intent.name == "set_priority"
+    assert [e.value for e in result.get_entities_by_type("task_id")] == ["123"]
+
+
+def test_prescreen_finds_overlapping_trigger_words():
+    intents = RuleBasedIntentRecognizer().recognize_intents("show do I get started")
+
+    assert "help" in [intent.name for intent in intents]
+
+
+def test_parse_reuses_analysis_for_repeated_text():
+    parser = DefaultNLParser()
+
+    first = parser.parse("Create task Write docs")
+    second = parser.parse("Create task Write docs")
+
+    assert first is not second
+    assert first.intents[0] is second.intents[0]
+    assert [e.value for e in second.get_entities_by_type("title")] == ["Write docs"]
+
+    parser.clear_cache()
+    assert parser.parse("Create task Write docs").intents[0] is not first.intents[0]
+
+
+def test_compile_is_case_insensitive_and_accepts_lookarounds():
+    assert _compile(r"task\s+(\d+)").search("TASK 12").group(1) == "12"
+    assert _compile(r"a(?=b)").search("xAB").span() == (1, 2)
+
+
+def test_create_title_read_after_intent_match():
+    extractor = PatternEntityExtractor()
+    text = "create task A; create task B"
+
+    intent = Intent("create_task", 0.9)
+    intent._match_span = (15, 26)
+    spanned = extractor.extract_entities(text, [intent])
+    unspanned = extractor.extract_entities(text, [Intent("create_task", 0.9)])
+
+    assert [e.value for e in spanned if e.entity_type == "title"] == ["B"]
+    assert [e.value for e in unspanned if e.entity_type == "title"] == ["A; create task B"]
+
+
+def test_default_parsers_share_compiled_components():
+    first, second = DefaultNLParser(), DefaultNLParser()
+
+    assert first.intent_recognizer is second.intent_recognizer
+    assert first.entity_extractor is second.entity_extractor
+
+    custom = RuleBasedIntentRecognizer()
+    assert DefaultNLParser(intent_recognizer=custom).intent_recognizer is custom
+
+
+_CORPUS = [
+    "create a new task called 'Fix login bug' with high priority due 2025-01-02",
+    "Create task Write docs",
+    "list high priority tasks",
+    "update task #123 title is 'New'",
+    "update task priority for task 5 to urgent",
+    "change the task due date for task 7 to tomorrow",
+    "mark task 5 as done",
+    "remove dependency between task 1 and task 2",
+    "what should I work on next?",
+    "how do I create a task?",
+    "in 3 days finish the task 8",
+    "description: 'some desc' create task X",
+    "start a new task named \"Deploy\" by the 3rd of March 2025",
+    "random gibberish",
+]
+
+
+def _parse_corpus(module, corpus):
+    parser = module.DefaultNLParser()
+    results = []
+    for text in corpus:
+        result = parser.parse(text)
+        results.append(([(i.name, i.confidence) for i in result.intents],
+                        [(e.entity_type, e.value, e.start_pos, e.end_pos) for e in result.entities]))
+    return results
+
+
+def test_re2_is_opt_in():
+    assert not parser_module._USE_RE2
+    assert _compile(r"priority\s+(\w+)").search("priority élevée").group(1) == "élevée"
+
+
+def test_corpus_parses_the_same_on_both_engines(monkeypatch):
+    pytest.importorskip("re2")
+    expected = _parse_corpus(parser_module, _CORPUS)
+
+    # Patterns are compiled at import time, so the module is reloaded with RE2
+    monkeypatch.setenv(parser_module._RE2_ENV_VAR, "1")
+    try:
+        importlib.reload(parser_module)
+        assert parser_module._USE_RE2
+        assert _parse_corpus(parser_module, _CORPUS) == expected
+    finally:
+        monkeypatch.delenv(parser_module._RE2_ENV_VAR)
+        importlib.reload(parser_module)
+
+
+def test_match_span_stays_out_of_intent_parameters():
+    intent = DefaultNLParser().parse("create task Write docs").primary_intent
+
+    assert intent.name == "create_task"
+    assert intent.parameters == {}
+    assert "match_span" not in str(intent)
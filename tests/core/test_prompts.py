@@ -0,0 +1,22 @@
+import pytest
+
+from src.core.prompts import load_prompt, load_template, render_template
+
+
+def test_load_template_reads_each_template_once():
+    load_template.cache_clear()
+
+    first = load_template("task_analysis")
+
+    assert load_template("task_analysis") is first
+    assert load_template.cache_info().misses == 1
+
+
+def test_missing_template_raises():
+    with pytest.raises(FileNotFoundError):
+        load_prompt("no_such_template")
+
+
+def test_render_template_substitutes_known_variables():
+    assert render_template("Task: $title ($missing)", {"title": "Fix"}) == "Task: Fix ($missing)"
+    assert render_template("Task: $title ($missing)", {"title": "Ship"}) == "Task: Ship ($missing)"
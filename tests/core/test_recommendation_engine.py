@@ -0,0 +1,311 @@
+from datetime import datetime, timedelta, timezone
+
+import numpy as np
+
+from src.core.recommendation.base import RecommendationFactor, TaskScore, UserPreference, preference_fields
+from src.core.recommendation.engine import DefaultRecommendationEngine, _top_indices
+from src.core.recommendation.factors import (
+    DeadlineFactor, DependencyFactor, HistoricalSuccessFactor, PriorityFactor, UserPreferenceFactor
+)
+
+
+class _FieldFactor(RecommendationFactor):
+    def __init__(self, field, weight=1.0):
+        super().__init__(weight, field)
+        self.field = field
+
+    def score(self, task, context):
+        return task[self.field]
+
+
+def _tasks():
+    return [
+        {"id": "a", "x": 0.2, "y": 1.0},
+        {"id": "b", "x": 0.9, "y": 0.5},
+        {"id": "c", "x": 0.9, "y": 0.5},
+        {"id": "d", "x": 0.1, "y": 0.0},
+    ]
+
+
+def test_top_indices_matches_stable_sort():
+    scores = np.array([0.5, 0.9, 0.5, 0.1, 0.9, 0.5])
+    expected = sorted(range(len(scores)), key=lambda i: scores[i], reverse=True)
+
+    for k in range(-2, len(scores) + 2):
+        assert _top_indices(scores, k).tolist() == expected[:k]
+
+
+def test_recommend_tasks_ranks_by_weighted_factor_scores():
+    engine = DefaultRecommendationEngine(factors=[_FieldFactor("x", 2.0), _FieldFactor("y", 1.0)])
+
+    recommendations = engine.recommend_tasks(_tasks(), limit=3)
+
+    assert [r["task"]["id"] for r in recommendations] == ["b", "c", "a"]
+    assert recommendations[0]["score"] == engine.score_task(_tasks()[1]).overall_score
+    assert recommendations[2]["factor_scores"] == {"x": 0.2, "y": 1.0}
+
+
+def test_failing_factor_scores_zero():
+    class _Broken(RecommendationFactor):
+        def score(self, task, context):
+            raise RuntimeError("unavailable")
+
+    engine = DefaultRecommendationEngine(factors=[_FieldFactor("x"), _Broken()])
+
+    recommendations = engine.recommend_tasks(_tasks(), limit=1)
+
+    assert recommendations[0]["factor_scores"] == {"x": 0.9, "_Broken": 0.0}
+    assert recommendations[0]["score"] == 0.45
+
+
+def test_non_numeric_factor_score_counts_as_zero():
+    engine = DefaultRecommendationEngine(factors=[_FieldFactor("x"), _FieldFactor("missing")])
+    task = dict(_tasks()[1], missing=None)
+
+    score = engine.score_task(task)
+
+    assert score.factor_scores == {"x": 0.9, "missing": 0.0}
+    assert score.overall_score == engine.recommend_tasks([task])[0]["score"] == 0.45
+
+
+def test_pruned_scoring_keeps_the_full_ranking():
+    rng = np.random.RandomState(3)
+    tasks = [{"id": str(i), "x": rng.rand(), "y": rng.rand(), "z": round(rng.rand(), 1)}
+             for i in range(200)]
+    calls = []
+
+    class _Counted(_FieldFactor):
+        def score(self, task, context):
+            calls.append(self.field)
+            return super().score(task, context)
+
+    engine = DefaultRecommendationEngine(
+        factors=[_Counted("z", 0.2), _Counted("x", 3.0), _Counted("y", 1.0)])
+
+    recommendations = engine.recommend_tasks(tasks, limit=5)
+    assert calls.count("x") == 200
+    assert calls.count("z") < 200
+
+    expected = sorted(tasks, key=lambda t: engine.score_task(t).overall_score, reverse=True)[:5]
+    assert [r["task"]["id"] for r in recommendations] == [t["id"] for t in expected]
+    assert recommendations[0]["score"] == engine.score_task(expected[0]).overall_score
+
+
+def test_out_of_range_scores_disable_pruning():
+    # "a" leads on x, which is scored first, but its negative y sinks it
+    tasks = [{"id": "a", "x": 1.0, "y": -1.0}, {"id": "b", "x": 0.3, "y": 1.0}]
+    engine = DefaultRecommendationEngine(factors=[_FieldFactor("x", 2.0), _FieldFactor("y", 1.0)])
+
+    recommendations = engine.recommend_tasks(tasks, limit=1)
+
+    assert recommendations[0]["task"]["id"] == "b"
+
+
+def test_factor_changes_refresh_cached_weights():
+    engine = DefaultRecommendationEngine(factors=[_FieldFactor("x"), _FieldFactor("y")])
+    task = _tasks()[0]
+
+    assert engine.score_task(task).overall_score == 0.6
+
+    engine.set_factor_weight("y", 3.0)
+    assert engine.score_task(task).overall_score == (0.2 + 3.0) / 4.0
+
+    engine.remove_factor("y")
+    assert engine.score_task(task).overall_score == 0.2
+
+
+def test_balanced_tasks_reuse_initial_scores():
+    class _Counting(_FieldFactor):
+        calls = 0
+
+        def score(self, task, context):
+            _Counting.calls += 1
+            return super().score(task, context)
+
+    class _Balancer:
+        def calculate_workload_metrics(self, user_id, tasks):
+            return {}
+
+        def balance_workload(self, user_id, tasks):
+            return tasks[1:] + [{"id": "new", "x": 1.0}]
+
+    engine = DefaultRecommendationEngine(factors=[_Counting("x")], workload_balancer=_Balancer())
+
+    recommendations = engine.recommend_tasks(_tasks(), user_id="u1", limit=2)
+
+    assert [r["task"]["id"] for r in recommendations] == ["new", "c"]
+    assert _Counting.calls == len(_tasks()) + 1
+    assert recommendations[0]["timestamp"] == recommendations[1]["timestamp"]
+
+
+def test_context_data_fetched_only_for_registered_readers():
+    class _History:
+        calls = 0
+
+        def analyze_user_performance(self, user_id):
+            _History.calls += 1
+            return {}
+
+    engine = DefaultRecommendationEngine(
+        factors=[PriorityFactor(), HistoricalSuccessFactor()], historical_analyzer=_History())
+
+    engine.recommend_tasks(_tasks(), user_id="u1")
+    assert _History.calls == 1
+
+    engine.remove_factor("HistoricalSuccessFactor")
+    engine.recommend_tasks(_tasks(), user_id="u1")
+    assert _History.calls == 1
+
+    # Factors that don't declare their context keys may read anything
+    engine.add_factor(_FieldFactor("x"))
+    engine.recommend_tasks(_tasks(), user_id="u1")
+    assert _History.calls == 2
+
+
+def test_explain_uses_user_preferences():
+    class _Preferences:
+        def get_preferences(self, user_id):
+            return [UserPreference(user_id, "category_preference", "backend")]
+
+    engine = DefaultRecommendationEngine(
+        factors=[UserPreferenceFactor()], user_preference_manager=_Preferences())
+
+    explanation = engine.explain_recommendation({"id": "a", "category": "backend"}, user_id="u1")
+
+    assert explanation["all_factors"] == {"UserPreferenceFactor": 1.0}
+
+
+def test_preference_fields_accepts_dict_form():
+    preference = UserPreference("u1", "tag_preference", "ui", weight=0.5)
+
+    assert preference_fields(preference) == ("tag_preference", "ui", 0.5)
+    assert preference_fields(preference.to_dict()) == ("tag_preference", "ui", 0.5)
+
+
+def test_factor_lookup_by_name():
+    engine = DefaultRecommendationEngine(factors=[_FieldFactor("x"), _FieldFactor("y"), _FieldFactor("x", 0.5)])
+
+    assert engine.set_factor_weight("x", 2.0)
+    assert engine.get_factor_weights() == {"x": 0.5, "y": 1.0}
+    assert [factor.weight for factor in engine.factors] == [2.0, 1.0, 0.5]
+    assert not engine.set_factor_weight("missing", 1.0)
+
+    assert engine.remove_factor("x")
+    assert engine.remove_factor("x")
+    assert not engine.remove_factor("x")
+    assert [factor.name for factor in engine.factors] == ["y"]
+
+
+def test_explanation_text_lines():
+    engine = DefaultRecommendationEngine(factors=[])
+    task = {"title": "Ship it", "priority": "high"}
+
+    text = engine._generate_explanation_text(
+        task, [("PriorityFactor", 0.8), ("DeadlineFactor", 0.5), ("Custom", 0.25), ("WorkloadFactor", 0.9)])
+
+    assert text == (
+        "Task 'Ship it' was recommended because:\n"
+        "- It has a strongly high priority (high)\n"
+        "- Deadline considerations were moderately important\n"
+        "- Custom: 0.25\n"
+    )
+
+
+def test_task_score_iso_timestamp_follows_reassignment():
+    score = TaskScore("a", 0.5, {}, timestamp=datetime(2024, 1, 2, 3, 4, 5))
+    
+    assert score.to_dict()["timestamp"] == "2024-01-02T03:04:05"
+    score.timestamp = datetime(2025, 6, 7)
+    assert score.to_dict()["timestamp"] == "2025-06-07T00:00:00"
+    assert TaskScore.from_dict(score.to_dict()).timestamp == score.timestamp
+
+
+def test_scores_and_preferences_have_no_instance_dict():
+    score = TaskScore("a", 0.5, {})
+    preference = UserPreference("u1", "tag_preference", "ui")
+
+    assert not hasattr(score, "__dict__")
+    assert not hasattr(preference, "__dict__")
+    assert UserPreference.from_dict(preference.to_dict()).to_dict() == preference.to_dict()
+
+
+def test_scores_reused_for_same_task_and_context():
+    calls = []
+
+    class _Counted(_FieldFactor):
+        def score(self, task, context):
+            calls.append(task["id"])
+            return super().score(task, context)
+
+    engine = DefaultRecommendationEngine(factors=[_Counted("x")])
+    tasks = _tasks()
+    context = {}
+
+    top = engine.recommend_tasks(tasks, context=context, limit=2)
+    del calls[:]
+    explanation = engine.explain_recommendation(top[0]["task"], context=context)
+    assert calls == []
+    assert explanation["all_factors"] == top[0]["factor_scores"]
+
+    # Equal copies, other contexts and invalidation all score again
+    engine.score_task(dict(tasks[1]), context=context)
+    engine.score_task(tasks[1], context={})
+    engine.invalidate_cache()
+    engine.score_task(tasks[1], context=context)
+    assert calls == ["b", "b", "b"]
+
+    engine.set_factor_weight("x", 2.0)
+    engine.score_task(tasks[1], context=context)
+    assert len(calls) == 4
+
+
+def test_scores_without_a_context_are_not_cached():
+    engine = DefaultRecommendationEngine(factors=[_FieldFactor("x")])
+    context = {}
+    engine.recommend_tasks(_tasks(), context=context, limit=2)
+    cached = dict(engine._score_cache)
+
+    for task in _tasks():
+        engine.score_task(task)
+        engine.explain_recommendation(task)
+
+    assert engine._score_cache == cached
+
+
+def test_deadline_batch_matches_scalar_scores():
+    now = datetime.now()
+    due_dates = [None, "", "not a date", 42, now - timedelta(days=3), now + timedelta(hours=5),
+                 (now + timedelta(days=3, hours=1)).isoformat(), now + timedelta(days=30),
+                 (now + timedelta(days=2, hours=1)).astimezone(timezone.utc)]
+    tasks = [{"id": str(i), "due_date": due} for i, due in enumerate(due_dates)]
+    factor = DeadlineFactor(urgency_threshold_days=7)
+
+    batch = factor.score_batch(tasks, {}).tolist()
+
+    assert batch == [factor.score(task, {}) for task in tasks]
+    assert batch[:6] == [0.5, 0.5, 0.5, 0.5, 1.0, 1.0]
+    assert batch[7] == 0.2
+
+
+def test_batch_scoring_respects_overridden_score():
+    class _Flat(DeadlineFactor):
+        def score(self, task, context):
+            return 0.3
+
+    engine = DefaultRecommendationEngine(factors=[_Flat(name="Flat"), DeadlineFactor(name="Deadline")])
+
+    recommendation = engine.recommend_tasks([{"id": "a", "due_date": datetime.now()}])[0]
+
+    assert recommendation["factor_scores"] == {"Flat": 0.3, "Deadline": 1.0}
+
+
+def test_dependency_factor_tracks_the_current_task_index():
+    factor = DependencyFactor()
+    task = {"id": "t", "dependencies": ["a", "b", "b", "missing"]}
+    context = {"all_tasks": {"a": {"status": "completed"}, "b": {"status": "pending"}}}
+
+    assert factor.score(task, context) == 0.25
+
+    context["all_tasks"] = {"a": {"status": "completed"}, "b": {"status": "completed"}}
+    assert factor.score(task, context) == 0.75
+    assert factor.score({"id": "u"}, context) == 1.0
@@ -0,0 +1,72 @@
+from datetime import datetime, timezone
+
+import numpy as np
+
+from src.core.models import Task, TaskStatus, TaskPriority
+from src.core.task_table import TaskTable
+
+
+def _make_tasks():
+    return [
+        Task(title="A", id="a", status=TaskStatus.PENDING, priority=TaskPriority.HIGH, complexity_score=3.0),
+        Task(title="B", id="b", status=TaskStatus.IN_PROGRESS, priority=TaskPriority.LOW),
+        Task(title="C", id="c", status=TaskStatus.PENDING, priority=TaskPriority.LOW,
+             created_at=datetime(2024, 1, 1)),
+    ]
+
+
+def test_filter_by_status_and_priority():
+    table = TaskTable.from_tasks(_make_tasks())
+
+    pending = table.filter_status(TaskStatus.PENDING)
+    assert table.ids(pending) == ["a", "c"]
+    assert table.ids(pending & table.filter_priority(TaskPriority.HIGH)) == ["a"]
+    assert np.isnan(table.column("complexity_score")[1])
+    assert table.column("created_at")[2] == np.datetime64("2024-01-01")
+
+
+def test_add_grows_and_refreshes_rows():
+    table = TaskTable(capacity=1)
+    tasks = _make_tasks()
+    for task in tasks:
+        table.add(task)
+    assert len(table) == 3
+
+    tasks[1].status = TaskStatus.COMPLETED
+    assert table.add(tasks[1]) == 1
+    assert len(table) == 3
+    assert table.status_of(1) == TaskStatus.COMPLETED
+
+
+def test_remove_moves_last_row():
+    table = TaskTable.from_tasks(_make_tasks())
+
+    assert table.remove("a")
+    assert not table.remove("a")
+    assert len(table) == 2
+    assert table.ids() == ["c", "b"]
+    assert "c" in table
+    assert table.remove("c")
+    assert table.ids() == ["b"]
+
+
+def test_remove_keeps_long_ids_intact():
+    long_id = "f" * 36 + ".12345678"
+    table = TaskTable()
+    table.add(Task(title="Short", id="short"))
+    table.add(Task(title="Subtask", id=long_id))
+
+    assert table.remove("short")
+    assert table.ids() == [long_id]
+    assert table._row_by_id == {long_id: 0}
+    assert table.add(Task(title="New", id="new")) == 1
+    assert table.remove(long_id)
+    assert table.ids() == ["new"]
+
+
+def test_aware_timestamps_stored_as_local_time():
+    created = datetime(2024, 1, 1, 12, tzinfo=timezone.utc)
+    table = TaskTable.from_tasks([Task(title="A", id="a", created_at=created)])
+
+    expected = created.astimezone().replace(tzinfo=None)
+    assert table.column("created_at")[0] == np.datetime64(expected, "us")
@@ -0,0 +1,47 @@
+from datetime import datetime
+
+from src.core.integration.base import (
+    AuthenticationConfig, AuthType, IntegrationConfig, IntegrationType, SyncConfig, SyncDirection
+)
+
+
+def _config():
+    return IntegrationConfig(
+        id="gh",
+        name="GitHub",
+        type=IntegrationType.GITHUB,
+        auth_config=AuthenticationConfig(AuthType.TOKEN, {"token": "t"}, scopes=["repo"]),
+        sync_config=SyncConfig(SyncDirection.IMPORT),
+        settings={"owner": "octo"},
+    )
+
+
+def test_to_dict_does_not_return_the_cached_snapshot():
+    config = _config()
+
+    data = config.to_dict()
+    data["name"] = "changed"
+    data["auth_config"]["auth_type"] = "changed"
+
+    assert data is not config._snapshot()
+    assert config._snapshot()["name"] == "GitHub"
+    assert config._snapshot()["auth_config"]["auth_type"] == "token"
+
+
+def test_assigning_a_field_refreshes_the_snapshot():
+    config = _config()
+    assert config._snapshot()["name"] == "GitHub"
+
+    config.name = "Renamed"
+
+    assert config._snapshot()["name"] == "Renamed"
+
+
+def test_bump_refreshes_the_snapshot_after_nested_mutation():
+    config = _config()
+    assert config._snapshot()["auth_config"]["expires_at"] is None
+
+    config.auth_config.expires_at = datetime(2030, 1, 1)
+    config._bump()
+
+    assert config._snapshot()["auth_config"]["expires_at"] == "2030-01-01T00:00:00"
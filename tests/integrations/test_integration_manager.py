@@ -0,0 +1,232 @@
+import asyncio
+import json
+import os
+import threading
+from datetime import datetime
+
+import pytest
+
+schedule = pytest.importorskip("schedule")
+
+from src.core.integration.base import IntegrationConfig, IntegrationStatus, IntegrationType
+from src.core.integration.manager import IntegrationManager
+
+
+@pytest.fixture
+def manager(tmp_path):
+    return IntegrationManager(data_dir=str(tmp_path))
+
+
+def test_http_session_returns_final_response_after_retries(manager):
+    pytest.importorskip("requests")
+
+    retries = manager._get_http_session().get_adapter("https://api.github.com").max_retries
+
+    assert retries.total == 3
+    assert 503 in retries.status_forcelist
+    assert retries.raise_on_status is False
+
+
+def _create(manager, name, interval_minutes=60):
+    result = manager.create_integration(
+        name, IntegrationType.GITHUB,
+        auth_config={"auth_type": "token", "credentials": {"token": "t"}},
+        sync_config={"interval_minutes": interval_minutes},
+    )
+    return result["integration_id"]
+
+
+def _saved(manager):
+    with open(manager.config_file) as f:
+        return {item["id"]: item for item in json.load(f)}
+
+
+def test_flush_persists_mutations(manager):
+    integration_id = _create(manager, "GitHub")
+    manager.update_integration(integration_id, name="Renamed")
+
+    manager.flush()
+
+    assert _saved(manager)[integration_id]["name"] == "Renamed"
+    assert not os.path.exists(manager.config_file + ".tmp")
+
+
+def test_unchanged_integrations_skip_the_write(manager, monkeypatch):
+    integration_id = _create(manager, "GitHub")
+    manager.flush()
+
+    writes = []
+    real_replace = os.replace
+    monkeypatch.setattr(os, "replace", lambda *args: writes.append(args) or real_replace(*args))
+
+    manager.flush()
+    assert writes == []
+
+    manager.update_integration(integration_id, settings={"owner": "octo"})
+    manager.flush()
+    assert len(writes) == 1
+
+
+def test_update_changes_auth_config_in_place(manager):
+    integration_id = _create(manager, "GitHub")
+    auth = manager.integrations[integration_id].auth_config
+
+    manager.update_integration(integration_id, auth_config={
+        "scopes": ["repo", "read:org"],
+        "expires_at": "2030-01-02T03:04:05",
+    })
+
+    assert manager.integrations[integration_id].auth_config is auth
+    assert auth.scopes == ["repo", "read:org"]
+    assert auth.expires_at == datetime(2030, 1, 2, 3, 4, 5)
+    data = manager.integrations[integration_id].to_dict()["auth_config"]
+    assert data["expires_at"] == "2030-01-02T03:04:05"
+    assert data["credentials"] == {"token": "t"}
+
+
+def test_debounced_save_is_flushed_when_scheduler_stops(manager, monkeypatch):
+    monkeypatch.setattr(manager, "FLUSH_DELAY", 60)
+    integration_id = _create(manager, "GitHub")
+    manager.update_integration(integration_id, name="Renamed")
+    manager.update_integration(integration_id, name="Renamed again")
+
+    assert not os.path.exists(manager.config_file)
+
+    manager.stop_sync_scheduler()
+
+    assert manager._flush_timer is None
+    assert _saved(manager)[integration_id]["name"] == "Renamed again"
+
+
+def test_failed_save_schedules_a_retry(manager, monkeypatch):
+    monkeypatch.setattr(manager, "FLUSH_DELAY", 60)
+    integration_id = _create(manager, "GitHub")
+
+    def _fail(*args):
+        raise OSError("disk full")
+
+    with monkeypatch.context() as patch:
+        patch.setattr(os, "replace", _fail)
+        manager.flush()
+
+    assert manager._flush_timer is not None
+
+    manager.flush()
+
+    assert manager._flush_timer is None
+    assert integration_id in _saved(manager)
+
+
+def test_mutators_wait_for_the_writer_to_serialize(manager, monkeypatch):
+    monkeypatch.setattr(manager, "FLUSH_DELAY", 60)
+    first = _create(manager, "first")
+    real_snapshot = IntegrationConfig._snapshot
+    blocked = []
+
+    def _snapshot(config):
+        if config.id == first and not blocked:
+            writer = threading.Thread(target=_create, args=(manager, "second"))
+            writer.start()
+            writer.join(0.1)
+            blocked.append(writer)
+        return real_snapshot(config)
+
+    monkeypatch.setattr(IntegrationConfig, "_snapshot", _snapshot)
+    manager.flush()
+    monkeypatch.undo()
+
+    writer = blocked[0]
+    writer.join(1.0)
+    assert not writer.is_alive()
+    assert len(_saved(manager)) == 1
+    assert len(manager.integrations) == 2
+    manager.flush()
+
+
+def test_tick_all_runs_due_integrations_in_deadline_order(manager, monkeypatch):
+    every_two = _create(manager, "A", interval_minutes=2)
+    every_three = _create(manager, "B", interval_minutes=3)
+    for config in manager.integrations.values():
+        config.status = IntegrationStatus.ACTIVE
+
+    synced = []
+    monkeypatch.setattr(manager, "_scheduled_sync",
+                        lambda integration_id: synced.append((manager._sync_clock, integration_id)))
+    try:
+        manager._setup_sync_schedules()
+        assert manager._sync_tick == 1
+
+        for _ in range(4):
+            manager._tick_all()
+
+        # Deactivated integrations drop out of the heartbeat
+        manager.integrations[every_three].status = IntegrationStatus.INACTIVE
+        for _ in range(2):
+            manager._tick_all()
+    finally:
+        schedule.clear()
+
+    assert synced == [(2, every_two), (3, every_three), (4, every_two), (6, every_two)]
+
+
+class _ManualClockLoop(asyncio.SelectorEventLoop):
+    now = 0.0
+
+    def time(self):
+        return self.now
+
+
+def _spin(loop):
+    for _ in range(5):
+        loop.run_until_complete(asyncio.sleep(0))
+
+
+def test_async_scheduler_picks_up_integrations_changed_after_start(manager):
+    first = _create(manager, "first", interval_minutes=1)
+    manager.integrations[first].status = IntegrationStatus.ACTIVE
+
+    synced = []
+
+    async def _record(integration_id):
+        synced.append(integration_id)
+
+    manager._async_scheduled_sync = _record
+
+    loop = manager._async_loop = _ManualClockLoop()
+    asyncio.set_event_loop(loop)
+    try:
+        manager._async_stop = asyncio.Event()
+        manager._async_wakeup = asyncio.Event()
+        scheduler = loop.create_task(manager._async_run_scheduler())
+        _spin(loop)
+
+        # Created after the scheduler started
+        second = _create(manager, "second", interval_minutes=1)
+        manager.integrations[second].status = IntegrationStatus.ACTIVE
+        manager._wake_async_scheduler()
+        _spin(loop)
+
+        loop.now = 60
+        _spin(loop)
+        assert sorted(synced) == sorted([first, second])
+
+        # Briefly deactivated, so its due sync is dropped, then reactivated
+        manager.integrations[first].status = IntegrationStatus.INACTIVE
+        loop.now = 120
+        _spin(loop)
+        manager.integrations[first].status = IntegrationStatus.ACTIVE
+        manager._wake_async_scheduler()
+        _spin(loop)
+        assert synced[2:] == [second]
+
+        loop.now = 180
+        _spin(loop)
+        assert sorted(synced[3:]) == sorted([first, second])
+
+        loop.call_soon_threadsafe(manager._async_stop.set)
+        manager._wake_async_scheduler()
+        loop.run_until_complete(scheduler)
+    finally:
+        asyncio.set_event_loop(None)
+        manager._async_wakeup = None
+        loop.close()